@@ -0,0 +1,118 @@
+"""
+Free-threaded build 擴展性基準測試.
+
+產生一個合成專案, 以不同 worker 數執行 CPU-bound 階段 (import 擷取 / 語法檢查 / 死代碼掃描),
+輸出相對單執行緒的加速比與效率。在 3.13t / 3.14t 上應接近線性; 一般 GIL build 則約為 1x。
+
+用法:
+    python3.13t scripts/bench_free_threaded.py --files 2000 --workers 1 2 4 8
+    python3.13t scripts/bench_free_threaded.py --min-efficiency 0.7   # CI: 效率不足時 exit 1
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from pyci_check.deadcode import _scan_chunk
+from pyci_check.imports import _process_files_chunk
+from pyci_check.syntax import _check_files_chunk
+from pyci_check.utils import IS_FREE_THREADED, map_chunks, walk_python_files
+
+MODULE_TEMPLATE = '''"""合成模組 {index}."""
+
+import os
+import sys
+from collections import defaultdict
+
+try:
+    import optional_dep_{index}
+except ImportError:
+    optional_dep_{index} = None
+
+
+class Widget{index}:
+    def __init__(self, value):
+        self.value = value
+
+    def compute(self, items):
+        totals = defaultdict(int)
+        for i, item in enumerate(items):
+            totals[item % 7] += i * self.value
+        return dict(totals)
+
+
+def helper_{index}(a, b, *, scale=1):
+    return [x * scale for x in range(a, b) if x % 3]
+
+'''
+
+
+def build_project(root: str, file_count: int, functions_per_file: int) -> list[str]:
+    """產生 file_count 個檔案, 每個檔案附帶 functions_per_file 個額外函式增加解析量."""
+    for index in range(file_count):
+        package = os.path.join(root, f"pkg_{index % 20}")
+        os.makedirs(package, exist_ok=True)
+        extra = "".join(f"\ndef extra_{index}_{n}(x):\n    return helper_{index}(x, x + {n})\n" for n in range(functions_per_file))
+        with open(os.path.join(package, f"mod_{index}.py"), "w", encoding="utf-8") as f:
+            f.write(MODULE_TEMPLATE.format(index=index) + extra)
+    return walk_python_files(root, frozenset())
+
+
+def measure(func: Callable[[Sequence[str]], object], files: list[str], workers: int, repeat: int) -> float:
+    """取 repeat 次中最快的一次 (秒)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        map_chunks(func, files, workers)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    """主程式."""
+    parser = argparse.ArgumentParser(description="Free-threaded scaling benchmark")
+    parser.add_argument("--files", type=int, default=1500)
+    parser.add_argument("--functions", type=int, default=20, help="每個檔案額外的函式數")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-efficiency", type=float, default=None, help="最大 worker 數的效率下限 (0-1), 未達則 exit 1")
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}  free-threaded={IS_FREE_THREADED}  cpus={os.cpu_count()}")
+    if not IS_FREE_THREADED:
+        print("⚠️  Not a free-threaded build: expect ~1x speedup (GIL serializes ast.parse).")
+
+    phases: dict[str, Callable[[Sequence[str]], object]] = {
+        "imports": _process_files_chunk,
+        "syntax": partial(_check_files_chunk, current_dir=os.getcwd()),
+        "deadcode": _scan_chunk,
+    }
+
+    worst_efficiency = 1.0
+    with tempfile.TemporaryDirectory() as root:
+        files = build_project(root, args.files, args.functions)
+        print(f"{len(files)} files generated\n")
+        print(f"{'phase':<10}{'workers':>8}{'seconds':>10}{'speedup':>9}{'efficiency':>12}")
+        for name, func in phases.items():
+            baseline = measure(func, files, 1, args.repeat)
+            for workers in sorted(args.workers):
+                elapsed = baseline if workers == 1 else measure(func, files, workers, args.repeat)
+                speedup = baseline / elapsed
+                efficiency = speedup / workers
+                print(f"{name:<10}{workers:>8}{elapsed:>10.3f}{speedup:>8.2f}x{efficiency:>11.0%}")
+            worst_efficiency = min(worst_efficiency, efficiency)
+
+    if args.min_efficiency is not None and worst_efficiency < args.min_efficiency:
+        print(f"\n❌ Efficiency at {max(args.workers)} workers is {worst_efficiency:.0%} (< {args.min_efficiency:.0%})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
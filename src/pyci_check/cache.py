@@ -0,0 +1,578 @@
+"""
+.pyci-check-cache 快取儲存.
+
+所有快取 (find_spec 結果 / import 耗時 / 套件索引) 共用同一個 SQLite 檔, 以 namespace 區分:
+- 值以 JSON 序列化 (只含 dict / list / str / 數值, tuple 讀回為 list): 快取可能是其他 worktree / CI job
+  共用寫入的目錄, 讀回的內容只當資料解析, 不像 marshal / pickle 會還原 code object 等可執行物件
+- 逐鍵查詢: 只讀取實際用到的項目 (lazy), 冷啟動成本不隨快取大小成長
+- 寫入為單一 transaction: 中途中斷不會留下寫一半的內容
+- WAL + busy_timeout: 多個 pyci-check 行程 (例如多個 worktree 同時跑 git hook) 可並行讀寫
+- 每個 namespace 記錄 version + signature; 不符即視為空, 下次寫入時整批替換
+
+快取目錄 (優先順序): 環境變數 PYCI_CHECK_CACHE_DIR > [tool.pyci-check] cache-dir > <project>/.pyci-check-cache。
+指向共用目錄 (例如 $XDG_CACHE_HOME 或 CI cache mount) 時, 多個 worktree / CI job 共用同一個資料庫:
+- 與專案綁定的快取 (find_spec 等) 以專案路徑區分 namespace, 互不覆蓋
+- ContentCache 以「檔案內容 hash + 工具版本 + Python 版本」為鍵, 任何 checkout 中內容相同的檔案都能命中
+
+容量管理: 每個項目記錄最後存取時間, 超過 cache-max-size 時由最久未使用者開始淘汰 (LRU);
+各 namespace 的命中 / 未命中次數累計於 stats 表, 供 `pyci-check cache stats` 顯示。
+
+快取失敗 (唯讀檔案系統、檔案損毀、無 sqlite3 模組) 一律視為 miss, 不影響檢查結果。
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+import tomllib
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Self
+
+from pyci_check import __version__
+
+try:
+    import sqlite3
+except ImportError:
+    # 部分精簡 build 沒有 _sqlite3: 快取停用
+    sqlite3 = None
+
+CACHE_DIRNAME = ".pyci-check-cache"
+CACHE_DIR_ENV = "PYCI_CHECK_CACHE_DIR"
+DB_FILENAME = "cache.sqlite3"
+# 資料表結構版本 (PRAGMA user_version); 結構或值的序列化格式變更時遞增, 舊檔整個重建
+SCHEMA_VERSION = 3
+# 其他行程持有寫鎖時最多等待秒數
+BUSY_TIMEOUT = 5.0
+# 預設容量上限 (可由 [tool.pyci-check] cache-max-size 覆寫)
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+# 淘汰到上限的此比例為止, 避免每次執行都剛好超過而反覆 GC
+GC_LOW_WATER = 0.8
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    namespace TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    signature TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    atime INTEGER NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_atime ON entries (atime);
+CREATE TABLE IF NOT EXISTS stats (
+    namespace TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL,
+    misses INTEGER NOT NULL
+);
+"""
+
+_GET_SQL = (
+    "SELECT e.value FROM entries e JOIN meta m ON m.namespace = e.namespace "
+    "WHERE e.namespace = ? AND e.key = ? AND m.version = ? AND m.signature = ?"
+)
+
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?)i?b?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
+
+
+def user_cache_dir() -> str:
+    """使用者層級的共用快取目錄 ($XDG_CACHE_HOME/pyci-check, Windows 為 %LOCALAPPDATA%/pyci-check/Cache)."""
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return os.path.join(os.environ["LOCALAPPDATA"], "pyci-check", "Cache")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pyci-check")
+
+
+def _expand_cache_dir(value: str, base_dir: str) -> str:
+    """展開設定值: "user" → user_cache_dir(); 支援 ~ 與環境變數; 相對路徑以 base_dir 為基準."""
+    if value == "user":
+        return user_cache_dir()
+    return os.path.join(base_dir, os.path.expandvars(os.path.expanduser(value)))
+
+
+def parse_size(value: str | int) -> int:
+    """
+    解析容量設定.
+
+    Args:
+        value: 位元組數或帶單位字串 ("512MB" / "1G" / "100k", 以 1024 為底)
+
+    Returns:
+        位元組數
+
+    Raises:
+        ValueError: 格式不正確
+    """
+    if isinstance(value, int):
+        return value
+    match = _SIZE_PATTERN.match(value)
+    if not match:
+        raise ValueError(value)
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[unit.lower()])
+
+
+def format_size(size: int) -> str:
+    """位元組數 → 易讀字串 (1.5 MB)."""
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+@lru_cache(maxsize=16)
+def _load_cache_config(project_dir: str) -> tuple[str | None, int | None]:
+    """從 project_dir 往上找 pyproject.toml, 讀取 [tool.pyci-check] cache-dir / cache-max-size."""
+    current = project_dir
+    while True:
+        pyproject = os.path.join(current, "pyproject.toml")
+        if os.path.isfile(pyproject):
+            try:
+                with open(pyproject, "rb") as f:
+                    config = tomllib.load(f).get("tool", {}).get("pyci-check", {})
+            except (OSError, tomllib.TOMLDecodeError):
+                return None, None
+            value = config.get("cache-dir")
+            cache_dir = _expand_cache_dir(value, current) if isinstance(value, str) and value else None
+            max_size = None
+            with contextlib.suppress(ValueError, TypeError):
+                max_size = parse_size(config["cache-max-size"]) if "cache-max-size" in config else None
+            return cache_dir, max_size
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None, None
+        current = parent
+
+
+def cache_dir_for(project_dir: str) -> str:
+    """
+    專案的快取目錄.
+
+    優先順序: 環境變數 PYCI_CHECK_CACHE_DIR > [tool.pyci-check] cache-dir > <project>/.pyci-check-cache
+    """
+    env_value = os.environ.get(CACHE_DIR_ENV)
+    if env_value:
+        return _expand_cache_dir(env_value, os.getcwd())
+    return _load_cache_config(os.path.abspath(project_dir))[0] or os.path.join(project_dir, CACHE_DIRNAME)
+
+
+def cache_budget_for(project_dir: str) -> int:
+    """專案設定的快取容量上限 ([tool.pyci-check] cache-max-size), 預設 DEFAULT_MAX_SIZE."""
+    max_size = _load_cache_config(os.path.abspath(project_dir))[1]
+    return DEFAULT_MAX_SIZE if max_size is None else max_size
+
+
+def project_namespace(project_dir: str | None, name: str, version: int, signature: str = "") -> "CacheNamespace":
+    """
+    與專案綁定的 namespace: 名稱附加專案路徑 hash, 共用快取目錄時各專案互不覆蓋.
+
+    project_dir 為 None 時回傳停用的 namespace。
+    """
+    if project_dir is None:
+        return CacheNamespace(None, name, version, signature)
+    scope = hashlib.sha256(os.path.abspath(project_dir).encode()).hexdigest()[:12]
+    return CacheNamespace(cache_dir_for(project_dir), f"{name}@{scope}", version, signature)
+
+
+def _encode(value: object) -> bytes:
+    """快取值 → JSON bytes (緊湊格式)."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _connect(db_path: str) -> "sqlite3.Connection":
+    # check_same_thread=False: 每條連線仍只由開啟它的 thread 使用, 但結束時可由擁有者統一關閉
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT, isolation_level=None, check_same_thread=False)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            _rebuild_schema(conn)
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+def _rebuild_schema(conn: "sqlite3.Connection") -> None:
+    conn.execute("BEGIN IMMEDIATE")
+    # 取得寫鎖後再檢查一次: 另一個行程可能剛完成建立
+    if conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+        conn.execute("COMMIT")
+        return
+    for table in ("entries", "meta", "stats"):
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+    for statement in _SCHEMA.split(";"):
+        if statement.strip():
+            conn.execute(statement)
+    conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+    conn.execute("COMMIT")
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+        # incremental: GC 淘汰後可把空頁還給檔案系統; 既有檔案需 VACUUM 一次才會生效
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        with contextlib.suppress(sqlite3.OperationalError):
+            conn.execute("VACUUM")
+
+
+def _open_database(cache_dir: str) -> "sqlite3.Connection | None":
+    """開啟 (必要時建立) 快取資料庫; 檔案損毀時刪除重建一次."""
+    if sqlite3 is None:
+        return None
+    db_path = os.path.join(cache_dir, DB_FILENAME)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        return _connect(db_path)
+    except sqlite3.DatabaseError:
+        # 非 SQLite 檔 / 損毀: 快取內容可隨時重建, 直接捨棄
+        for suffix in ("", "-wal", "-shm"):
+            with contextlib.suppress(OSError):
+                os.unlink(db_path + suffix)
+    except (sqlite3.Error, OSError):
+        return None
+    try:
+        return _connect(db_path)
+    except (sqlite3.Error, OSError):
+        return None
+
+
+class CacheNamespace:
+    """
+    快取中的一個 namespace (例如 "find_spec").
+
+    version / signature 與資料庫中記錄的不符時, 讀取一律 miss; update 會先清空舊內容。
+    get 可由多個 thread 同時呼叫 (每個 thread 各自一條連線); 用完後呼叫 close 關閉所有 thread 開啟的連線。
+    命中次數與存取時間先累積在記憶體, 於 update 時與寫入一起送出 (讀取路徑不寫資料庫)。
+    """
+
+    def __init__(self, cache_dir: str | None, name: str, version: int, signature: str = "") -> None:
+        self.cache_dir = cache_dir
+        self.name = name
+        self.version = version
+        self.signature = signature
+        self.disabled = cache_dir is None or sqlite3 is None
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        # 統計只用於報表: free-threaded build 上並行累加可能少算, 不加鎖
+        self._hits = 0
+        self._misses = 0
+        self._touched: set[str] = set()
+        self._touched_all = False
+
+    def _conn(self) -> "sqlite3.Connection | None":
+        if self.disabled:
+            return None
+        conn = getattr(self._local, "conn", False)
+        if conn is False:
+            conn = _open_database(self.cache_dir)
+            self._local.conn = conn
+            if conn is not None:
+                with self._conns_lock:
+                    self._conns.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """
+        關閉各 thread 開啟的連線 (未送出的統計不會寫入, 需先呼叫 update).
+
+        呼叫時不應有其他 thread 仍在使用此 namespace; 之後再存取會重新開啟連線。
+        """
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+            self._local = threading.local()
+        for conn in conns:
+            with contextlib.suppress(sqlite3.Error):
+                conn.close()
+
+    def get(self, key: str) -> object | None:
+        """查詢單一鍵; None = miss."""
+        conn = self._conn()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(_GET_SQL, (self.name, key, self.version, self.signature)).fetchone()
+            value = None if row is None else json.loads(row[0])
+        except (sqlite3.Error, ValueError, EOFError, TypeError):
+            value = None
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            self._touched.add(key)
+        return value
+
+    def items(self) -> dict[str, object] | None:
+        """讀取整個 namespace; None = 尚無有效內容 (與空 dict 區分)."""
+        conn = self._conn()
+        if conn is None:
+            return None
+        try:
+            meta = conn.execute("SELECT version, signature FROM meta WHERE namespace = ?", (self.name,)).fetchone()
+            if meta != (self.version, self.signature):
+                self._misses += 1
+                return None
+            rows = conn.execute("SELECT key, value FROM entries WHERE namespace = ?", (self.name,)).fetchall()
+            result = {key: json.loads(value) for key, value in rows}
+        except (sqlite3.Error, ValueError, EOFError, TypeError):
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._touched_all = True
+        return result
+
+    def update(self, mapping: Mapping[str, object] | None = None, replace: bool = False) -> None:
+        """
+        寫入多個鍵, 並送出累積的命中統計與存取時間 (單一 transaction).
+
+        沒有新值也應呼叫 (例如全部命中時), 否則存取時間不會更新、LRU 會誤判為久未使用。
+
+        Args:
+            mapping: 鍵 → 值 (值需可被 JSON 序列化)
+            replace: True 則先清空此 namespace (整份重建的快取, 例如套件索引)
+        """
+        mapping = mapping or {}
+        if not mapping and not self._hits and not self._misses:
+            return
+        conn = self._conn()
+        if conn is None:
+            return
+        now = int(time.time())
+        hits, misses, touched, touched_all = self._hits, self._misses, self._touched, self._touched_all
+        self._hits = self._misses = 0
+        self._touched = set()
+        self._touched_all = False
+        try:
+            rows = [(self.name, key, _encode(value), now) for key, value in mapping.items()]
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                meta = conn.execute("SELECT version, signature FROM meta WHERE namespace = ?", (self.name,)).fetchone()
+                if replace or meta != (self.version, self.signature):
+                    conn.execute("DELETE FROM entries WHERE namespace = ?", (self.name,))
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta (namespace, version, signature) VALUES (?, ?, ?)",
+                        (self.name, self.version, self.signature),
+                    )
+                elif touched_all:
+                    conn.execute("UPDATE entries SET atime = ? WHERE namespace = ?", (now, self.name))
+                elif touched:
+                    conn.executemany(
+                        "UPDATE entries SET atime = ? WHERE namespace = ? AND key = ?",
+                        [(now, self.name, key) for key in touched - mapping.keys()],
+                    )
+                conn.executemany("INSERT OR REPLACE INTO entries (namespace, key, value, atime) VALUES (?, ?, ?, ?)", rows)
+                conn.execute(
+                    "INSERT INTO stats (namespace, hits, misses) VALUES (?, ?, ?) "
+                    "ON CONFLICT (namespace) DO UPDATE SET hits = hits + excluded.hits, misses = misses + excluded.misses",
+                    (self.name, hits, misses),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except (sqlite3.Error, ValueError, TypeError):
+            # 寫入失敗 (含無法序列化的值) 不影響檢查結果
+            pass
+
+
+class ContentCache:
+    """
+    以檔案內容為鍵的單檔結果快取 (content-addressed).
+
+    鍵 = sha256(工具版本 + Python cache tag + 階段 + 階段選項 + 檔案 bytes): 與路徑、分支、checkout 無關,
+    因此共用快取目錄時, 另一個 worktree / CI job 中內容相同的檔案直接命中。
+    結果不可含檔案路徑 (呼叫端命中後自行補上)。
+
+    每個 thread / 區塊各自建立實例; put 先緩衝, flush 時以單一 transaction 寫入。
+    可作為 context manager: 離開時 flush 並關閉連線 (或自行呼叫 flush + close)。
+    """
+
+    NAMESPACE_PREFIX = "content:"
+    VERSION = 1
+
+    def __init__(self, cache_dir: str | None, phase: str, options: str = "") -> None:
+        self._store = CacheNamespace(cache_dir, self.NAMESPACE_PREFIX + phase, self.VERSION)
+        self.disabled = self._store.disabled
+        self._salt = f"{__version__}\0{sys.implementation.cache_tag}\0{phase}\0{options}\0".encode()
+        self._updates: dict[str, object] = {}
+
+    def key_for(self, data: bytes) -> str:
+        """檔案內容 → 快取鍵."""
+        return hashlib.sha256(self._salt + data).hexdigest()
+
+    def get(self, key: str) -> object | None:
+        return self._store.get(key)
+
+    def put(self, key: str, value: object) -> None:
+        if not self.disabled:
+            self._updates[key] = value
+
+    def flush(self) -> None:
+        self._store.update(self._updates)
+        self._updates = {}
+
+    def close(self) -> None:
+        self._store.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        try:
+            self.flush()
+        finally:
+            self.close()
+
+
+# --------------------------------------------
+# 容量管理 (pyci-check cache stats / gc / clear)
+# --------------------------------------------
+
+
+def _phase_of(namespace: str) -> str:
+    """Namespace → 階段名稱 (去掉專案 scope 後綴)."""
+    return namespace.split("@", 1)[0]
+
+
+def _database_bytes(conn: "sqlite3.Connection") -> int:
+    """資料庫實際使用的位元組數 (不含可重用的空頁)."""
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    return (page_count - free_pages) * page_size
+
+
+def _existing_database(cache_dir: str) -> "sqlite3.Connection | None":
+    """只開啟既有的資料庫 (管理指令不應為了查詢而建立快取)."""
+    if not os.path.isfile(os.path.join(cache_dir, DB_FILENAME)):
+        return None
+    return _open_database(cache_dir)
+
+
+def cache_stats(cache_dir: str) -> dict | None:
+    """
+    快取統計.
+
+    Returns:
+        None (尚無快取) 或
+        {
+            "path": 資料庫路徑,
+            "size": 使用中的位元組數,
+            "entries": 項目總數,
+            "phases": {階段: {"entries", "bytes", "hits", "misses"}},  # 依階段名排序
+        }
+    """
+    conn = _existing_database(cache_dir)
+    if conn is None:
+        return None
+    try:
+        phases: dict[str, dict[str, int]] = {}
+
+        def phase(namespace: str) -> dict[str, int]:
+            return phases.setdefault(_phase_of(namespace), {"entries": 0, "bytes": 0, "hits": 0, "misses": 0})
+
+        for namespace, count, size in conn.execute(
+            "SELECT namespace, COUNT(*), SUM(length(key) + length(value)) FROM entries GROUP BY namespace"
+        ):
+            phase(namespace)["entries"] += count
+            phase(namespace)["bytes"] += size or 0
+        for namespace, hits, misses in conn.execute("SELECT namespace, hits, misses FROM stats"):
+            phase(namespace)["hits"] += hits
+            phase(namespace)["misses"] += misses
+        return {
+            "path": os.path.join(cache_dir, DB_FILENAME),
+            "size": _database_bytes(conn),
+            "entries": sum(p["entries"] for p in phases.values()),
+            "phases": dict(sorted(phases.items())),
+        }
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+
+
+def collect_garbage(cache_dir: str, max_bytes: int) -> tuple[int, int]:
+    """
+    容量超過 max_bytes 時, 由最久未存取的項目開始淘汰到上限的 GC_LOW_WATER 比例.
+
+    淘汰與並行的讀取者相容: 被淘汰的項目只會讓對方 miss 後重新計算。
+
+    Args:
+        cache_dir: 快取目錄
+        max_bytes: 容量上限
+
+    Returns:
+        (淘汰項目數, 淘汰的資料位元組數)
+    """
+    conn = _existing_database(cache_dir)
+    if conn is None:
+        return 0, 0
+    try:
+        before = _database_bytes(conn)
+        if before <= max_bytes:
+            return 0, 0
+        need = before - int(max_bytes * GC_LOW_WATER)
+        victims: list[tuple[str, str]] = []
+        freed = 0
+        for namespace, key, size in conn.execute(
+            "SELECT namespace, key, length(key) + length(value) FROM entries ORDER BY atime, namespace, key"
+        ):
+            victims.append((namespace, key))
+            freed += size
+            # 每列的頁面 / 索引額外開銷以固定值估計
+            if freed + len(victims) * 64 >= need:
+                break
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", victims)
+            # 沒有任何項目的 namespace 的 meta 一併移除
+            conn.execute("DELETE FROM meta WHERE namespace NOT IN (SELECT DISTINCT namespace FROM entries)")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("PRAGMA incremental_vacuum")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return len(victims), freed
+    except sqlite3.Error:
+        return 0, 0
+    finally:
+        conn.close()
+
+
+def clear_cache(cache_dir: str) -> bool:
+    """
+    清空快取 (含命中統計).
+
+    以 SQL 刪除而非刪檔: 其他正在執行的 pyci-check 行程仍持有連線, 刪檔會讓它們寫入已不存在的檔案。
+
+    Returns:
+        是否有快取被清除
+    """
+    conn = _existing_database(cache_dir)
+    if conn is None:
+        return False
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for table in ("entries", "meta", "stats"):
+                conn.execute(f"DELETE FROM {table}")  # noqa: S608
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("PRAGMA incremental_vacuum")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return True
+    except sqlite3.Error:
+        return False
+    finally:
+        conn.close()
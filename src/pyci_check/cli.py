@@ -4,6 +4,7 @@ import argparse
 import io
 import os
 import sys
+from collections.abc import Iterator
 
 # 確保 Windows 上的 stdout 使用 UTF-8 編碼
 if sys.platform == "win32":
@@ -12,21 +13,48 @@ if sys.platform == "win32":
     if sys.stderr.encoding != "utf-8":
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
 
-from pyci_check.cycles import find_import_cycles
+from pyci_check.cache import (
+    cache_budget_for,
+    cache_dir_for,
+    cache_stats,
+    clear_cache,
+    collect_garbage,
+    format_size,
+    parse_size,
+)
+from pyci_check.contracts import evaluate_contracts, load_contracts
+from pyci_check.cycles import find_graph_cycles, suggest_cycle_breaks
 from pyci_check.deadcode import scan_dead_code
 from pyci_check.dependency import find_dependency_issues
 from pyci_check.git_hook import install_hooks, uninstall_hooks
+from pyci_check.graph import (
+    GRAPH_FORMATS,
+    build_import_graph,
+    file_level_edges,
+    is_test_file,
+    iter_export,
+    load_import_graph,
+    package_level_edges,
+    transitive_importers,
+)
 from pyci_check.i18n import t
 from pyci_check.imports import (
+    IMPORT_TIME_KINDS,
+    RUNTIME_IMPORT_KINDS,
+    ImportProfile,
     check_missing_modules,
     extract_from_all_files,
     get_ruff_config_from_pyproject,
     get_venv_from_pyproject,
+    iter_missing_imports,
+    summarize_import_profiles,
 )
+from pyci_check.lazy_imports import DEFAULT_LAZY_IMPORT_MIN_SIZE, find_lazy_import_candidates
 from pyci_check.side_effects import detect_side_effects
 from pyci_check.signature import check_signatures
-from pyci_check.syntax import check_files_parallel, find_python_files
+from pyci_check.syntax import PYC_INVALIDATION_MODES, check_files_parallel, find_python_files
 from pyci_check.utils import safe_relpath
+from pyci_check.weight import external_module_roots, import_weights_for_project, load_weight_budget, over_budget
 
 
 def check_syntax(args: argparse.Namespace) -> int:
@@ -51,10 +79,29 @@ def check_syntax(args: argparse.Namespace) -> int:
             print(t("syntax.no_files"))
         return 0
 
+    # 編譯模式 (CLI 參數 > pyproject.toml)
+    ruff_config = get_ruff_config_from_pyproject(os.getcwd())
+    compile_mode = getattr(args, "compile", False) or ruff_config.get("compile", False)
+    pyc_prefix = getattr(args, "pyc_prefix", None) or ruff_config.get("pyc_prefix")
+    invalidation = getattr(args, "pyc_invalidation", None) or ruff_config.get("pyc_invalidation")
+    # 目標版本來自 [tool.pyci-check] / [tool.ruff] target-version
+    target_version = ruff_config.get("target_version")
+
     if not args.quiet:
         print(t("syntax.checking", len(python_files)))
-
-    _success_count, _error_count, errors = check_files_parallel(python_files)
+        if target_version:
+            print(t("syntax.target_version", f"{target_version[0]}.{target_version[1]}"))
+        if compile_mode:
+            print(t("syntax.compile_mode", pyc_prefix or "__pycache__"))
+
+    _success_count, _error_count, errors = check_files_parallel(
+        python_files,
+        compile_mode=compile_mode,
+        pyc_prefix=pyc_prefix,
+        invalidation=invalidation,
+        target_version=target_version,
+        cache_dir=cache_dir_for(os.getcwd()),
+    )
 
     if errors:
         for file_path, error_msg in errors:
@@ -67,6 +114,23 @@ def check_syntax(args: argparse.Namespace) -> int:
     return 0
 
 
+def _resolve_venv_path(args: argparse.Namespace, project_path: str) -> str | None:
+    """取得 venv 路徑 (優先順序: CLI 參數 > pyproject.toml > 自動偵測 .venv)."""
+    venv_path = getattr(args, "venv", None)
+
+    if not venv_path:
+        # 從 pyproject.toml 讀取
+        venv_path = get_venv_from_pyproject(project_path)
+
+    if not venv_path:
+        # 自動偵測 .venv
+        venv_dir = os.path.join(project_path, ".venv")
+        if os.path.exists(venv_dir):
+            venv_path = "."
+
+    return venv_path
+
+
 def check_imports(args: argparse.Namespace) -> int:
     """執行 import 檢查."""
     paths = getattr(args, "paths", None) or ["."]
@@ -81,18 +145,7 @@ def check_imports(args: argparse.Namespace) -> int:
     ignore_dirs = set(ruff_config["exclude_dirs"])
     ignore_files = set(ruff_config["exclude_files"])
 
-    # 取得 venv 路徑 (優先順序: CLI 參數 > pyproject.toml > 自動偵測 .venv)
-    venv_path = getattr(args, "venv", None)
-
-    if not venv_path:
-        # 從 pyproject.toml 讀取
-        venv_path = get_venv_from_pyproject(project_path)
-
-    if not venv_path:
-        # 自動偵測 .venv
-        venv_dir = os.path.join(project_path, ".venv")
-        if os.path.exists(venv_dir):
-            venv_path = "."
+    venv_path = _resolve_venv_path(args, project_path)
 
     if not args.quiet:
         print(t("imports.checking"))
@@ -113,6 +166,10 @@ def check_imports(args: argparse.Namespace) -> int:
             print(t("imports.mode_execute"))
             print(t("imports.mode_execute_warning"))
 
+    # 靜態模式且不需先檢查相對 import: 串流管線, 確認缺少的 import 立即輸出
+    if use_static and not args.check_relative:
+        return _check_imports_streaming(args, paths, project_path, ruff_config, venv_path)
+
     # 根據指定路徑收集檔案
     target_files = []
     for path in paths:
@@ -135,6 +192,18 @@ def check_imports(args: argparse.Namespace) -> int:
             print(t("imports.relative_import_warning", rel_import["file"], rel_import["line"], rel_import["statement"]))
         return 1
 
+    # import 耗時量測僅在執行模式有意義 (靜態模式不執行任何 import)
+    budget_ms = getattr(args, "import_budget_ms", None)
+    if budget_ms is None:
+        budget_ms = ruff_config.get("import_budget_ms")
+    # 明確指定 --import-deadline 0 (停用時限) 也應覆寫設定檔, 不可用 or 合併
+    deadline = getattr(args, "import_deadline", None)
+    if deadline is None:
+        deadline = ruff_config.get("import_deadline")
+    profiles: dict[str, ImportProfile] | None = None
+    if not use_static and (getattr(args, "profile_imports", False) or budget_ms is not None):
+        profiles = {}
+
     missing_modules = check_missing_modules(
         all_imports,
         project_dir=project_path,
@@ -142,37 +211,112 @@ def check_imports(args: argparse.Namespace) -> int:
         timeout=args.timeout,
         venv_path=venv_path,
         use_static=use_static,
+        profile_sink=profiles,
+        deadline=deadline,
+    )
+
+    if profiles:
+        _print_import_profiles(profiles, budget_ms, args.quiet)
+
+    total_errors = 0
+    for module, import_list in sorted(missing_modules.items()):
+        for import_info in import_list:
+            _print_missing_import(module, import_info, project_path)
+            total_errors += 1
+    return _print_imports_summary(len(missing_modules), total_errors, args.quiet)
+
+
+def _check_imports_streaming(
+    args: argparse.Namespace,
+    paths: list[str],
+    project_path: str,
+    ruff_config: dict,
+    venv_path: str | None,
+) -> int:
+    """
+    靜態 import 檢查的串流版: 邊走訪邊解析, 每個確認缺少的 import 立即輸出.
+
+    檔案選取與批次版相同: 指定目錄以 find_python_files 展開; 沒有任何檔案時走訪整個專案,
+    兩者都套用 pyproject.toml 設定的排除目錄 / 檔案。
+    """
+    ignore_dirs = set(ruff_config["exclude_dirs"])
+    ignore_files = set(ruff_config["exclude_files"])
+
+    def _target_files() -> Iterator[str]:
+        for path in paths:
+            abs_path = os.path.abspath(path)
+            if os.path.isfile(abs_path):
+                if abs_path.endswith(".py"):
+                    yield abs_path
+            elif os.path.isdir(abs_path):
+                yield from find_python_files(abs_path, exclude_dirs=list(ignore_dirs))
+
+    failed_modules: set[str] = set()
+    total_errors = 0
+    for module, import_info in iter_missing_imports(
+        project_path,
+        ignore_dirs,
+        ignore_files,
+        target_files=_target_files(),
+        src_dirs=ruff_config["src"],
+        venv_path=venv_path,
+    ):
+        _print_missing_import(module, import_info, project_path)
+        failed_modules.add(module)
+        total_errors += 1
+    return _print_imports_summary(len(failed_modules), total_errors, args.quiet)
+
+
+def _print_missing_import(module: str, import_info: dict, project_path: str) -> None:
+    """輸出單一無法載入的 import."""
+    rel_path = safe_relpath(import_info["file"], project_path)
+    error_msg = import_info.get("error", "Module not found")
+    print(t("imports.module_failed", module))
+    print(t("imports.file", rel_path, import_info["line"]))
+    print(t("imports.statement", import_info["statement"]))
+    print(t("imports.reason", error_msg))
+    print(
+        "   Hint: Ensure this module is installed in your environment (e.g., check requirements.txt/pyproject.toml). If it is a local module, verify the path or module name spelling."
     )
+    print()
 
-    if missing_modules:
-        total_errors = 0
-        for module, import_list in sorted(missing_modules.items()):
-            for import_info in import_list:
-                rel_path = safe_relpath(import_info["file"], project_path)
-                error_msg = import_info.get("error", "Module not found")
-                print(t("imports.module_failed", module))
-                print(t("imports.file", rel_path, import_info["line"]))
-                print(t("imports.statement", import_info["statement"]))
-                print(t("imports.reason", error_msg))
-                print(
-                    "   Hint: Ensure this module is installed in your environment (e.g., check requirements.txt/pyproject.toml). If it is a local module, verify the path or module name spelling."
-                )
-                print()
-                total_errors += 1
 
+def _print_imports_summary(failed_modules: int, total_errors: int, quiet: bool) -> int:
+    """輸出 import 檢查統計並回傳 exit code."""
+    if failed_modules:
         # 顯示統計資訊
-        if not args.quiet:
+        if not quiet:
             print("=" * 60)
-            print(t("imports.summary.failed_modules", len(missing_modules)))
+            print(t("imports.summary.failed_modules", failed_modules))
             print(t("imports.summary.total_errors", total_errors))
             print("=" * 60)
         return 1
 
-    if not args.quiet:
+    if not quiet:
         print(t("imports.success"))
     return 0
 
 
+def _print_import_profiles(profiles: dict[str, ImportProfile], budget_ms: float | None, quiet: bool) -> None:
+    """輸出 import 耗時報告; 超過預算的模組只警告, 不影響 exit code."""
+    summary = summarize_import_profiles(profiles, budget_ms=budget_ms)
+
+    if not quiet:
+        print(t("imports.profile.heaviest"))
+        for profile in summary["heaviest_modules"]:
+            rss = f"{profile.peak_rss_kb / 1024:.1f} MB" if profile.peak_rss_kb is not None else "n/a"
+            print(f"  - {profile.module}: {profile.total_ms:.1f} ms, peak RSS {rss}")
+        print(t("imports.profile.slowest"))
+        for name, self_ms in summary["slowest_imports"]:
+            print(f"  - {name}: {self_ms:.1f} ms")
+
+    if summary["over_budget"]:
+        print(t("imports.profile.over_budget", len(summary["over_budget"]), budget_ms))
+        for profile in summary["over_budget"]:
+            print(f"  - {profile.module}: {profile.total_ms:.1f} ms")
+        print("  Hint: Defer heavy imports into the functions that need them, or move top-level work out of module scope.")
+
+
 def check_dependency(args: argparse.Namespace) -> int:
     """執行依賴健康度檢查."""
     project_path = os.getcwd()
@@ -202,7 +346,7 @@ def check_dependency(args: argparse.Namespace) -> int:
                 rel = os.path.relpath(fp, root)
                 local_modules.add(rel.split(os.sep)[0].removesuffix(".py"))
 
-    issues = find_dependency_issues(project_path, imported_modules, local_modules)
+    issues = find_dependency_issues(project_path, imported_modules, local_modules, venv_path=_resolve_venv_path(args, project_path))
 
     has_issues = False
     if issues["phantom"]:
@@ -243,13 +387,24 @@ def check_cycles(args: argparse.Namespace) -> int:
         ignore_files=ignore_files,
     )
 
-    cycles = find_import_cycles(all_imports, all_relative_imports, project_path, src_dirs)
+    # 預設只看 import 時執行的邊; --include-deferred 一併納入函數內的 import
+    kinds = RUNTIME_IMPORT_KINDS if getattr(args, "include_deferred", False) else IMPORT_TIME_KINDS
+    graph = build_import_graph(all_imports, all_relative_imports, project_path, src_dirs, kinds=kinds, keep_imports=True)
+    cycles = find_graph_cycles(graph.edges)
 
     if cycles:
         print(t("cycles.found", len(cycles)))
         for i, cycle in enumerate(cycles, 1):
             rel_cycle = [safe_relpath(fp, project_path) for fp in cycle]
             print(f"  {i}. {' -> '.join(rel_cycle)}")
+        # 每個 SCC 移除後即無循環的 import 敘述
+        breaks = suggest_cycle_breaks(graph)
+        print(t("cycles.breaks", sum(len(b.imports) for b in breaks)))
+        for i, cycle_break in enumerate(breaks, 1):
+            print(t("cycles.break_component", i, len(cycle_break.files), len(cycle_break.imports)))
+            for imp in cycle_break.imports:
+                location = f"{safe_relpath(imp['file'], project_path)}:{imp['line']}"
+                print(f"      - {location}  {imp['statement']}  (-> {safe_relpath(imp['target'], project_path)})")
         print(
             "  Hint: Import cycles usually happen when two modules depend on each other. Consider extracting the shared logic into a third module, or move the import statement inside a function/method to defer evaluation."
         )
@@ -260,6 +415,144 @@ def check_cycles(args: argparse.Namespace) -> int:
     return 0
 
 
+def check_impact(args: argparse.Namespace) -> int:
+    """
+    影響分析: 列出變更檔案本身與所有直接 / 間接 import 它們的檔案.
+
+    每行輸出一個相對路徑, 可直接交給測試執行器 (例如 `pytest $(pyci-check impact a.py --tests)`)。
+    """
+    project_path = os.getcwd()
+    ruff_config = get_ruff_config_from_pyproject(project_path)
+    graph = load_import_graph(
+        project_path,
+        ruff_config["src"],
+        ignore_dirs=set(ruff_config["exclude_dirs"]),
+        ignore_files=set(ruff_config["exclude_files"]),
+    )
+
+    changed: set[str] = set()
+    for fp in args.files:
+        abs_fp = os.path.abspath(fp)
+        if abs_fp in graph.edges:
+            changed.add(abs_fp)
+        else:
+            print(t("impact.unknown_file", fp), file=sys.stderr)
+
+    affected = changed | transitive_importers(graph, changed)
+    if getattr(args, "tests", False):
+        affected = {fp for fp in affected if is_test_file(fp)}
+    for fp in sorted(safe_relpath(fp, project_path) for fp in affected):
+        print(fp)
+    return 0
+
+
+def export_graph(args: argparse.Namespace) -> int:
+    """匯出 import 圖 (檔案或套件層級) 與節點指標, 串流寫入 stdout 或 --output 檔案."""
+    project_path = os.getcwd()
+    ruff_config = get_ruff_config_from_pyproject(project_path)
+    graph = load_import_graph(
+        project_path,
+        ruff_config["src"],
+        ignore_dirs=set(ruff_config["exclude_dirs"]),
+        ignore_files=set(ruff_config["exclude_files"]),
+    )
+    level = getattr(args, "level", "file")
+    edges = package_level_edges(graph) if level == "package" else file_level_edges(graph)
+    chunks = iter_export(edges, getattr(args, "format", "json"), level)
+
+    output = getattr(args, "output", None)
+    if not output:
+        sys.stdout.writelines(chunks)
+        return 0
+    with open(output, "w", encoding="utf-8") as f:
+        f.writelines(chunks)
+    print(t("graph.written", len(edges), sum(len(targets) for targets in edges.values()), output), file=sys.stderr)
+    return 0
+
+
+def check_contracts(args: argparse.Namespace) -> int:
+    """執行架構契約檢查 ([[tool.pyci-check.contracts]])."""
+    project_path = os.getcwd()
+    contracts, config_errors = load_contracts(project_path)
+    for error in config_errors:
+        print(error)
+    if not contracts:
+        if not config_errors and not args.quiet:
+            print(t("contracts.none"))
+        return 1 if config_errors else 0
+
+    if not args.quiet:
+        print(t("contracts.checking", len(contracts)))
+
+    ruff_config = get_ruff_config_from_pyproject(project_path)
+    graph = load_import_graph(
+        project_path,
+        ruff_config["src"],
+        ignore_dirs=set(ruff_config["exclude_dirs"]),
+        ignore_files=set(ruff_config["exclude_files"]),
+    )
+    violations, unmatched = evaluate_contracts(graph, contracts)
+
+    for module in sorted(unmatched):
+        print(t("contracts.unmatched", module))
+    if violations:
+        print(t("contracts.found", len(violations)))
+        for violation in violations:
+            print(t("contracts.violation", violation.contract, violation.importer, violation.imported))
+            print(f"      {' -> '.join(violation.chain)}")
+        return 1
+    if config_errors:
+        return 1
+
+    if not args.quiet:
+        print(t("contracts.success", len(contracts)))
+    return 0
+
+
+def check_weight(args: argparse.Namespace) -> int:
+    """靜態 import 成本: 列出入口模組與最重的模組, 入口模組超過 [tool.pyci-check.import-weight] 預算時回傳 1."""
+    project_path = os.getcwd()
+    ruff_config = get_ruff_config_from_pyproject(project_path)
+    graph = load_import_graph(
+        project_path,
+        ruff_config["src"],
+        ignore_dirs=set(ruff_config["exclude_dirs"]),
+        ignore_files=set(ruff_config["exclude_files"]),
+        kinds=IMPORT_TIME_KINDS,
+    )
+    weights = import_weights_for_project(graph, _resolve_venv_path(args, project_path))
+    budget = load_weight_budget(project_path)
+    entry_points = getattr(args, "entry", None) or budget.entry_points
+
+    def row(weight) -> str:
+        return t("weight.row", weight.module, weight.modules, len(weight.third_party), format_size(weight.source_bytes))
+
+    by_module = {w.module: w for w in weights.values()}
+    over = False
+    if entry_points:
+        print(t("weight.entry_points"))
+        for module in entry_points:
+            weight = by_module.get(module)
+            if weight is None:
+                print(t("weight.unknown_entry", module))
+                continue
+            print(row(weight))
+            for name, actual, limit in over_budget(weight, budget):
+                over = True
+                if name == "max-bytes":
+                    actual, limit = format_size(actual), format_size(limit)
+                print(t("weight.over_budget", name, actual, limit))
+
+    top = getattr(args, "top", 10)
+    if top:
+        print(t("weight.heaviest", top))
+        for weight in sorted(weights.values(), key=lambda w: (-w.source_bytes, w.module))[:top]:
+            print(row(weight))
+            if getattr(args, "verbose", False) and weight.third_party:
+                print(f"      {', '.join(weight.third_party)}")
+    return 1 if over else 0
+
+
 def check_signature(args: argparse.Namespace) -> int:
     """執行跨檔案本地簽章驗證."""
     project_path = os.getcwd()
@@ -314,6 +607,47 @@ def check_side_effects(args: argparse.Namespace) -> int:
     return 0
 
 
+def check_lazy_imports(args: argparse.Namespace) -> int:
+    """找出只在函數內使用的 top-level import, 依估計 import 成本排序 (僅警告)."""
+    project_path = os.getcwd()
+    ruff_config = get_ruff_config_from_pyproject(project_path)
+    graph = load_import_graph(
+        project_path,
+        ruff_config["src"],
+        ignore_dirs=set(ruff_config["exclude_dirs"]),
+        ignore_files=set(ruff_config["exclude_files"]),
+        kinds=IMPORT_TIME_KINDS,
+    )
+    venv_path = _resolve_venv_path(args, project_path)
+    min_bytes = getattr(args, "min_size", None)
+    if min_bytes is None:
+        min_bytes = ruff_config.get("lazy_import_min_size")
+    if min_bytes is None:
+        min_bytes = DEFAULT_LAZY_IMPORT_MIN_SIZE
+
+    if not args.quiet:
+        print(t("lazy_imports.checking", format_size(min_bytes)))
+
+    candidates = find_lazy_import_candidates(
+        graph,
+        import_weights_for_project(graph, venv_path),
+        external_module_roots(project_path, venv_path),
+        min_bytes,
+    )
+    if candidates:
+        print(t("lazy_imports.found", len(candidates)))
+        for c in candidates:
+            print(f"  - {safe_relpath(c.file, project_path)}:{c.line} -> {c.statement} (~{format_size(c.estimated_bytes)})")
+            print(t("lazy_imports.used_in", ", ".join(c.names), ", ".join(c.functions)))
+        print(t("lazy_imports.hint"))
+        # 僅警告，不回傳錯誤碼
+        return 0
+
+    if not args.quiet:
+        print(t("lazy_imports.success"))
+    return 0
+
+
 def check_deadcode(args: argparse.Namespace) -> int:
     """執行死代碼掃描 (僅警告)."""
     project_path = os.getcwd()
@@ -324,7 +658,7 @@ def check_deadcode(args: argparse.Namespace) -> int:
     if not args.quiet:
         print(t("deadcode.checking"))
 
-    warnings = scan_dead_code(python_files)
+    warnings = scan_dead_code(python_files, project_path, ruff_config["src"])
 
     if warnings:
         print(t("deadcode.found", len(warnings)))
@@ -381,6 +715,15 @@ def check_all(args: argparse.Namespace) -> int:
     if check_cycles(args) != 0:
         exit_code = 1
 
+    # 架構契約檢查 (有設定契約時才執行)
+    if any(load_contracts(os.getcwd())):
+        if not args.quiet:
+            print(f"\n{t('check_all.contracts_phase')}")
+        if check_contracts(args) != 0:
+            exit_code = 1
+            if args.fail_fast:
+                return exit_code
+
     # 5. 跨檔案本地簽章驗證
     if not args.quiet:
         print(f"\n{t('check_all.signature_phase')}")
@@ -410,6 +753,49 @@ def check_all(args: argparse.Namespace) -> int:
     return exit_code
 
 
+def manage_cache(args: argparse.Namespace) -> int:
+    """快取管理: stats (容量與各階段命中率) / gc (依容量上限淘汰) / clear."""
+    project_path = os.getcwd()
+    cache_dir = cache_dir_for(project_path)
+    action = getattr(args, "cache_command", None) or "stats"
+
+    if action == "clear":
+        print(t("cache.cleared", cache_dir) if clear_cache(cache_dir) else t("cache.empty", cache_dir))
+        return 0
+
+    max_bytes = getattr(args, "max_size", None) or cache_budget_for(project_path)
+    if action == "gc":
+        removed, freed = collect_garbage(cache_dir, max_bytes)
+        if removed:
+            print(t("cache.gc_done", removed, format_size(freed)))
+        else:
+            stats = cache_stats(cache_dir)
+            print(t("cache.gc_within_budget", format_size(stats["size"] if stats else 0), format_size(max_bytes)))
+        return 0
+
+    stats = cache_stats(cache_dir)
+    if stats is None:
+        print(t("cache.empty", cache_dir))
+        return 0
+    print(t("cache.location", stats["path"]))
+    print(t("cache.summary", format_size(stats["size"]), stats["entries"], format_size(max_bytes)))
+    for phase, info in stats["phases"].items():
+        lookups = info["hits"] + info["misses"]
+        hit_rate = f"{info['hits'] / lookups:.0%}" if lookups else "-"
+        print(t("cache.phase_row", phase, info["entries"], format_size(info["bytes"]), hit_rate, info["hits"], lookups))
+    return 0
+
+
+# 不執行檢查的子指令; 其餘子指令 (含之後新增者) 結束後一律檢查快取容量上限, 不需逐一登記
+NON_CHECK_COMMANDS = frozenset({"install-hooks", "uninstall-hooks", "cache"})
+
+
+def _collect_cache_garbage() -> None:
+    """檢查指令結束後: 快取超過容量上限才淘汰 (未超過時只讀取頁數, 成本可忽略)."""
+    project_path = os.getcwd()
+    collect_garbage(cache_dir_for(project_path), cache_budget_for(project_path))
+
+
 def main() -> None:
     """CLI 主程式."""
     parser = argparse.ArgumentParser(
@@ -432,6 +818,12 @@ def main() -> None:
         subparser.add_argument("--check-relative", action="store_true", help=t("cli.help.check_relative"))
         subparser.add_argument("--venv", type=str, help=t("cli.help.venv"))
         subparser.add_argument("--i-understand-this-will-execute-code", action="store_true", help=t("cli.help.i_understand"))
+        subparser.add_argument("--profile-imports", action="store_true", help=t("cli.help.profile_imports"))
+        subparser.add_argument("--import-budget-ms", type=float, default=None, help=t("cli.help.import_budget_ms"))
+        subparser.add_argument("--import-deadline", type=float, default=None, help=t("cli.help.import_deadline"))
+        subparser.add_argument("--compile", action="store_true", help=t("cli.help.compile"))
+        subparser.add_argument("--pyc-prefix", type=str, default=None, help=t("cli.help.pyc_prefix"))
+        subparser.add_argument("--pyc-invalidation", choices=PYC_INVALIDATION_MODES, default=None, help=t("cli.help.pyc_invalidation"))
 
     # check 子指令 (執行所有檢查)
     check_parser = subparsers.add_parser("check", help="執行所有檢查 (語法 + import)")
@@ -452,6 +844,29 @@ def main() -> None:
     # cycles 子指令
     cycles_parser = subparsers.add_parser("cycles", help=t("cli.help.cycles"))
     add_common_args(cycles_parser)
+    cycles_parser.add_argument("--include-deferred", action="store_true", help=t("cli.help.cycles_include_deferred"))
+
+    # contracts 子指令
+    contracts_parser = subparsers.add_parser("contracts", help=t("cli.help.contracts"))
+    add_common_args(contracts_parser)
+
+    # impact 子指令
+    impact_parser = subparsers.add_parser("impact", help=t("cli.help.impact"))
+    impact_parser.add_argument("files", nargs="+", help=t("cli.help.impact_files"))
+    impact_parser.add_argument("--tests", action="store_true", help=t("cli.help.impact_tests"))
+
+    # graph 子指令
+    graph_parser = subparsers.add_parser("graph", help=t("cli.help.graph"))
+    graph_parser.add_argument("--format", choices=GRAPH_FORMATS, default="json", help=t("cli.help.graph_format"))
+    graph_parser.add_argument("--level", choices=["file", "package"], default="file", help=t("cli.help.graph_level"))
+    graph_parser.add_argument("--output", "-o", type=str, default=None, help=t("cli.help.graph_output"))
+
+    # weight 子指令
+    weight_parser = subparsers.add_parser("weight", help=t("cli.help.weight"))
+    weight_parser.add_argument("--entry", action="append", default=None, help=t("cli.help.weight_entry"))
+    weight_parser.add_argument("--top", type=int, default=10, help=t("cli.help.weight_top"))
+    weight_parser.add_argument("--verbose", "-v", action="store_true", help=t("cli.help.weight_verbose"))
+    weight_parser.add_argument("--venv", type=str, help=t("cli.help.venv"))
 
     # signature 子指令
     signature_parser = subparsers.add_parser("signature", help=t("cli.help.signature"))
@@ -461,6 +876,11 @@ def main() -> None:
     side_effects_parser = subparsers.add_parser("side-effects", help="檢查全局副作用 (警告層級)")
     add_common_args(side_effects_parser)
 
+    # lazy-imports 子指令
+    lazy_imports_parser = subparsers.add_parser("lazy-imports", help=t("cli.help.lazy_imports"))
+    add_common_args(lazy_imports_parser)
+    lazy_imports_parser.add_argument("--min-size", type=parse_size, default=None, help=t("cli.help.lazy_imports_min_size"))
+
     # deadcode 子指令
     deadcode_parser = subparsers.add_parser("deadcode", help="掃描死代碼 (警告層級)")
     add_common_args(deadcode_parser)
@@ -472,6 +892,14 @@ def main() -> None:
     # uninstall-hooks 子指令
     subparsers.add_parser("uninstall-hooks", help=t("cli.help.uninstall_hooks"))
 
+    # cache 子指令
+    cache_parser = subparsers.add_parser("cache", help=t("cli.help.cache"))
+    cache_subparsers = cache_parser.add_subparsers(dest="cache_command")
+    cache_subparsers.add_parser("stats", help=t("cli.help.cache_stats"))
+    gc_parser = cache_subparsers.add_parser("gc", help=t("cli.help.cache_gc"))
+    gc_parser.add_argument("--max-size", type=parse_size, default=None, help=t("cli.help.cache_max_size"))
+    cache_subparsers.add_parser("clear", help=t("cli.help.cache_clear"))
+
     args = parser.parse_args()
 
     # 執行對應指令
@@ -485,21 +913,36 @@ def main() -> None:
         exit_code = check_dependency(args)
     elif args.command == "cycles":
         exit_code = check_cycles(args)
+    elif args.command == "contracts":
+        exit_code = check_contracts(args)
+    elif args.command == "impact":
+        exit_code = check_impact(args)
+    elif args.command == "graph":
+        exit_code = export_graph(args)
+    elif args.command == "weight":
+        exit_code = check_weight(args)
     elif args.command == "signature":
         exit_code = check_signature(args)
     elif args.command == "side-effects":
         exit_code = check_side_effects(args)
+    elif args.command == "lazy-imports":
+        exit_code = check_lazy_imports(args)
     elif args.command == "deadcode":
         exit_code = check_deadcode(args)
     elif args.command == "install-hooks":
         exit_code = install_hooks(args.type)
     elif args.command == "uninstall-hooks":
         exit_code = uninstall_hooks()
+    elif args.command == "cache":
+        exit_code = manage_cache(args)
     else:
         # 沒有指定子指令時,顯示幫助訊息
         parser.print_help()
         exit_code = 0
 
+    if args.command is not None and args.command not in NON_CHECK_COMMANDS:
+        _collect_cache_garbage()
+
     sys.exit(exit_code)
 
 
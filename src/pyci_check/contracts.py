@@ -0,0 +1,220 @@
+"""
+分層架構契約 (Architecture Contracts).
+
+在 import 圖上檢查 [[tool.pyci-check.contracts]] 宣告的規則:
+- forbidden: source 模組不得 import forbidden 模組
+- layers: 由上而下排列的層, 下層不得 import 上層
+- independence: 列出的模組彼此不得 import
+
+預設連間接 import 一起檢查 (indirect = false 時只看直接 import)。所有規則共用同一份
+ReachabilityIndex, 每個模組的可達集合只計算一次, 之後每條規則的檢查為一次整數 AND;
+只有違規時才做 BFS 找出路徑。
+"""
+
+import os
+import tomllib
+from dataclasses import dataclass, field
+
+from pyci_check.graph import ImportGraph, ReachabilityIndex, shortest_import_path
+from pyci_check.i18n import Message
+from pyci_check.imports import find_pyproject_toml
+
+CONTRACT_TYPES = ("forbidden", "layers", "independence")
+
+
+@dataclass
+class Contract:
+    """單一架構契約."""
+
+    name: str
+    type: str
+    # forbidden
+    source: list[str] = field(default_factory=list)
+    forbidden: list[str] = field(default_factory=list)
+    # layers: 由上而下, 每層可為多個平行模組
+    layers: list[list[str]] = field(default_factory=list)
+    # independence
+    modules: list[str] = field(default_factory=list)
+    indirect: bool = True
+
+
+@dataclass
+class ContractViolation:
+    """違反契約的一組 (importer, imported) 模組, 附一條最短 import 路徑作為證據."""
+
+    contract: str
+    importer: str
+    imported: str
+    chain: list[str]
+
+
+def _as_list(value: object) -> list[str] | None:
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list) and value and all(isinstance(v, str) for v in value):
+        return value
+    return None
+
+
+def _contract_pairs(contract: Contract) -> list[tuple[str, str]]:
+    """契約 → 需檢查的 (importer, imported) 模組組合."""
+    if contract.type == "forbidden":
+        return [(src, dst) for src in contract.source for dst in contract.forbidden]
+    if contract.type == "layers":
+        # 下層 (index 較大) 不得 import 上層
+        pairs: list[tuple[str, str]] = []
+        for upper, higher_layer in enumerate(contract.layers):
+            for lower_layer in contract.layers[upper + 1 :]:
+                pairs.extend((src, dst) for src in lower_layer for dst in higher_layer)
+        return pairs
+    return [(src, dst) for src in contract.modules for dst in contract.modules if src != dst]
+
+
+def _is_within(module: str, package: str) -> bool:
+    """判斷 module 是否為 package 本身或其子模組."""
+    return module == package or module.startswith(package + ".")
+
+
+def _parse_contract(index: int, raw: object) -> Contract | Message:
+    """設定 → Contract; 格式錯誤時回傳錯誤訊息."""
+    if not isinstance(raw, dict):
+        return Message("contracts.error.not_a_table", index)
+    kind = raw.get("type")
+    if kind not in CONTRACT_TYPES:
+        return Message("contracts.error.unknown_type", index, kind, ", ".join(CONTRACT_TYPES))
+    name = raw.get("name")
+    contract = Contract(name=name if isinstance(name, str) and name else f"{kind} #{index}", type=kind)
+    contract.indirect = raw.get("indirect", True) is not False
+
+    if kind == "forbidden":
+        source, forbidden = _as_list(raw.get("source")), _as_list(raw.get("forbidden"))
+        if source is None or forbidden is None:
+            return Message("contracts.error.missing_field", contract.name, "source / forbidden")
+        contract.source, contract.forbidden = source, forbidden
+    elif kind == "layers":
+        layers = raw.get("layers")
+        parsed = [_as_list(layer) for layer in layers] if isinstance(layers, list) else []
+        if len(parsed) < 2 or any(layer is None for layer in parsed):
+            return Message("contracts.error.missing_field", contract.name, "layers")
+        contract.layers = parsed
+    else:
+        modules = _as_list(raw.get("modules"))
+        if modules is None or len(modules) < 2:
+            return Message("contracts.error.missing_field", contract.name, "modules")
+        contract.modules = modules
+    # imported 為 importer 本身或其子模組時, imported 的檔案全屬於 importer, 這組規則永遠無從檢查
+    for importer, imported in _contract_pairs(contract):
+        if _is_within(imported, importer):
+            return Message("contracts.error.nested_module", contract.name, imported, importer)
+    return contract
+
+
+def load_contracts(project_dir: str) -> tuple[list[Contract], list[Message]]:
+    """
+    讀取 [[tool.pyci-check.contracts]].
+
+    Returns:
+        (契約列表, 設定錯誤訊息列表)
+    """
+    pyproject_path = find_pyproject_toml(project_dir)
+    if not pyproject_path:
+        return [], []
+    try:
+        with open(pyproject_path, "rb") as f:
+            raw_contracts = tomllib.load(f).get("tool", {}).get("pyci-check", {}).get("contracts", [])
+    except (OSError, tomllib.TOMLDecodeError):
+        return [], []
+    if not isinstance(raw_contracts, list):
+        return [], [Message("contracts.error.not_a_list")]
+
+    contracts: list[Contract] = []
+    errors: list[Message] = []
+    for i, raw in enumerate(raw_contracts, 1):
+        parsed = _parse_contract(i, raw)
+        if isinstance(parsed, Contract):
+            contracts.append(parsed)
+        else:
+            errors.append(parsed)
+    return contracts, errors
+
+
+class ContractChecker:
+    """
+    在同一份 import 圖上檢查多個契約.
+
+    模組前綴索引 (模組名及其所有上層套件 → 檔案) 與可達性索引只建立一次, 所有規則共用。
+    """
+
+    def __init__(self, graph: ImportGraph) -> None:
+        self._graph = graph
+        self._index = ReachabilityIndex(graph.edges)
+        self._files_by_prefix: dict[str, set[str]] = {}
+        for fp, module in graph.modules.items():
+            parts = module.split(".")
+            for depth in range(1, len(parts) + 1):
+                self._files_by_prefix.setdefault(".".join(parts[:depth]), set()).add(fp)
+        self.unmatched: set[str] = set()
+        # 同一模組常出現在多條規則 (例如 layers 的每一組上下層), 位元集合依模組名快取
+        self._reach_bits: dict[str, int] = {}
+        self._target_bits: dict[str, int] = {}
+
+    def files_for(self, patterns: list[str]) -> set[str]:
+        """模組名 (含子模組) → 檔案; 找不到任何檔案的模組記入 unmatched."""
+        files: set[str] = set()
+        for pattern in patterns:
+            matched = self._files_by_prefix.get(pattern)
+            if matched:
+                files |= matched
+            else:
+                self.unmatched.add(pattern)
+        return files
+
+    def _violation(self, contract: Contract, importer: str, imported: str) -> ContractViolation | None:
+        """檢查 importer 是否 import imported, 是則回傳附最短路徑的違規."""
+        sources = self.files_for([importer])
+        # imported 在 importer 之內的組合由 load_contracts 回報為設定錯誤; 直接建立的 Contract 在此略過
+        targets = self.files_for([imported]) - sources
+        if not sources or not targets:
+            return None
+        edges = self._graph.edges
+        if contract.indirect:
+            if importer not in self._reach_bits:
+                self._reach_bits[importer] = self._index.reach_bits(sources)
+            if imported not in self._target_bits:
+                self._target_bits[imported] = self._index.bits_for(targets)
+            if not self._reach_bits[importer] & self._target_bits[imported]:
+                return None
+            path = shortest_import_path(edges, sources, targets)
+        else:
+            path = next(([fp, target] for fp in sorted(sources) for target in sorted(edges[fp] & targets)), None)
+        if path is None:
+            return None
+        modules = self._graph.modules
+        return ContractViolation(contract.name, importer, imported, [modules.get(fp, os.path.basename(fp)) for fp in path])
+
+    def check(self, contract: Contract) -> list[ContractViolation]:
+        """檢查單一契約, 每組違規的 (importer, imported) 模組回報一次."""
+        violations = []
+        for importer, imported in _contract_pairs(contract):
+            violation = self._violation(contract, importer, imported)
+            if violation:
+                violations.append(violation)
+        return violations
+
+
+def evaluate_contracts(graph: ImportGraph, contracts: list[Contract]) -> tuple[list[ContractViolation], set[str]]:
+    """
+    檢查所有契約.
+
+    Args:
+        graph: import 圖
+        contracts: load_contracts 的結果
+
+    Returns:
+        (違規列表, 契約中找不到任何檔案的模組名)
+    """
+    checker = ContractChecker(graph)
+    violations: list[ContractViolation] = []
+    for contract in contracts:
+        violations.extend(checker.check(contract))
+    return violations, checker.unmatched
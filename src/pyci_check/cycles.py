@@ -2,12 +2,37 @@
 循環引用偵測 (Import Cycle Detection).
 
 分析專案中檔案間的匯入關係，找出構成循環引用的路徑。
+
+預設只看 import 時執行的邊 (模組層級與 optional import): 函數內的 import 在呼叫時才執行,
+TYPE_CHECKING 守護下的 import runtime 不執行, 兩者都不會造成 import 時的循環。
+
+大型強連通元件 (SCC) 會列出大量重疊的環; suggest_cycle_breaks 對每個 SCC 計算近似最小回饋邊集
+(以構成該邊的 import 敘述數加權), 直接指出要移動哪些 import 敘述。
 """
 
-import os
+from collections.abc import Collection
+from dataclasses import dataclass
+
+from pyci_check.graph import ImportGraph, build_import_graph, feedback_edges
+from pyci_check.imports import IMPORT_TIME_KINDS
+
+
+@dataclass
+class CycleBreak:
+    """單一強連通元件的斷環建議."""
+
+    files: list[str]
+    # 要移動 (移進函數 / 改為 TYPE_CHECKING) 的 import 紀錄, 附 "target": 被 import 的檔案
+    imports: list[dict]
 
 
-def find_import_cycles(all_imports: list[dict], all_relative_imports: list[dict], project_dir: str, src_dirs: list[str]) -> list[list[str]]:
+def find_import_cycles(
+    all_imports: list[dict],
+    all_relative_imports: list[dict],
+    project_dir: str,
+    src_dirs: list[str],
+    kinds: Collection[str] = IMPORT_TIME_KINDS,
+) -> list[list[str]]:
     """
     找出專案中的循環引用.
 
@@ -16,88 +41,23 @@ def find_import_cycles(all_imports: list[dict], all_relative_imports: list[dict]
         all_relative_imports: 所有相對匯入資訊
         project_dir: 專案根目錄
         src_dirs: 原始碼目錄 (PYTHONPATH)
+        kinds: 納入的 import 執行時機 (imports.IMPORT_KINDS), 預設只看 import 時執行的邊
 
     Returns:
         包含路徑環的列表，例如 [["a.py", "b.py", "a.py"]]
     """
-    # 1. 建立檔案到模組名的對應，以及模組名到檔案的對應
-    file_to_module: dict[str, str] = {}
-    module_to_file: dict[str, str] = {}
-
-    # 收集所有本地模組
-    from pyci_check.utils import get_exclude_dirs_set, walk_python_files
-
-    python_files = walk_python_files(project_dir, get_exclude_dirs_set())
-
-    # 建立映射
-    roots = [project_dir]
-    roots.extend(os.path.join(project_dir, s) for s in src_dirs)
-
-    for fp in python_files:
-        abs_fp = os.path.abspath(fp)
-        # 尋找最短模組名 (最深層的 root)
-        best_mod = None
-        for root in roots:
-            abs_root = os.path.abspath(root)
-            if abs_fp.startswith(abs_root):
-                rel = os.path.relpath(abs_fp, abs_root)
-                mod = rel.replace(os.sep, ".").removesuffix(".py").removesuffix(".__init__")
-                if best_mod is None or len(mod) < len(best_mod):
-                    best_mod = mod
-        if best_mod:
-            file_to_module[abs_fp] = best_mod
-            module_to_file[best_mod] = abs_fp
-
-    # 2. 建立匯入圖 (Adjacency List)
-    graph: dict[str, set[str]] = {fp: set() for fp in file_to_module}
-
-    # 處理絕對匯入
-    for imp in all_imports:
-        src_file = os.path.abspath(imp["file"])
-        if src_file not in graph:
-            continue
-
-        target_mod = imp["module"]
-        # 尋找匹配的本地檔案 (處理 dotted submodules)
-        # 例如 import a.b.c，可能是 a/b/c.py 或 a/b/__init__.py
-        current = target_mod
-        while current:
-            if current in module_to_file:
-                graph[src_file].add(module_to_file[current])
-                break
-            if "." not in current:
-                break
-            current = current.rsplit(".", 1)[0]
-
-    # 處理相對匯入
-    for imp in all_relative_imports:
-        src_file = os.path.abspath(imp["file"])
-        if src_file not in graph:
-            continue
-
-        level = imp["level"]
-        module = imp["module"]
-
-        # 解析相對路徑
-        src_dir = os.path.dirname(src_file)
-        target_dir = src_dir
-        for _ in range(level - 1):
-            target_dir = os.path.dirname(target_dir)
-
-        # 拼接模組名
-        if module == ".":
-            # from . import x -> target is the current dir's __init__.py
-            potential_file = os.path.join(target_dir, "__init__.py")
-        else:
-            potential_file = os.path.join(target_dir, *module.split(".")) + ".py"
-            if not os.path.exists(potential_file):
-                potential_file = os.path.join(target_dir, *module.split("."), "__init__.py")
-
-        abs_target = os.path.abspath(potential_file)
-        if abs_target in graph:
-            graph[src_file].add(abs_target)
-
-    # 3. 尋找環 (DFS)
+    graph = build_import_graph(all_imports, all_relative_imports, project_dir, src_dirs, kinds=kinds)
+    return find_graph_cycles(graph.edges)
+
+
+def find_graph_cycles(graph: dict[str, set[str]]) -> list[list[str]]:
+    """
+    以 DFS 找出 import 圖中的環.
+
+    Returns:
+        包含路徑環的列表，例如 [["a.py", "b.py", "a.py"]]
+    """
+    # 尋找環 (DFS)
     cycles = []
     visited = set()
     stack = []
@@ -127,3 +87,30 @@ def find_import_cycles(all_imports: list[dict], all_relative_imports: list[dict]
             dfs(node)
 
     return cycles
+
+
+def suggest_cycle_breaks(graph: ImportGraph) -> list[CycleBreak]:
+    """
+    每個有循環的強連通元件, 移除後即無循環的一小組 import 敘述.
+
+    邊的權重為構成該邊的 import 敘述數, 以 graph.feedback_edges 求近似最小加權回饋邊集。
+
+    Args:
+        graph: 以 keep_imports=True 建立的 import 圖
+
+    Returns:
+        CycleBreak 列表, 依相依順序排列
+    """
+
+    def statement_count(source: str, target: str) -> int:
+        return len(graph.edge_imports[source][target])
+
+    breaks = []
+    for members, removed in feedback_edges(graph.edges, statement_count):
+        imports = [
+            {**imp, "target": target}
+            for source, target in removed
+            for imp in sorted(graph.edge_imports[source][target], key=lambda imp: imp.get("line", 0))
+        ]
+        breaks.append(CycleBreak(files=members, imports=imports))
+    return breaks
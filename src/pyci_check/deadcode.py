@@ -1,140 +1,643 @@
 """
 死代碼深層掃描 (Deep Dead Code Elimination).
 
-掃描整個專案，找出定義了但在整個專案中完全沒有被呼叫過的函數或類別。
+掃描整個專案，找出定義了但從任何根都無法到達的函數、類別與方法。
 這是一種啟發式掃描，僅作為警告輸出。
 
+根 (DeadcodeRoots):
+- [project.scripts] / [project.gui-scripts] / [project.entry-points] 宣告的入口
+- 測試檔與 conftest.py (整個檔案), __main__.py 與含 `if __name__ == "__main__"` 的模組
+- 以框架註冊用 decorator (@app.route、@pytest.fixture 等) 裝飾的定義
+- __all__ 匯出的名稱與常見入口名稱 (main / setup / run / cli / pytest 鉤子)
+- 未宣告任何入口時 (純函式庫), 所有模組的模組層級程式碼
+
+引用一個定義代表其模組 (與上層套件) 的模組層級程式碼也會執行。
+
+符號以完整限定名 (pkg.mod.func / pkg.mod.Class.method) 識別:
+- 每個檔案產生一份符號摘要 (定義、import 綁定、__all__、各作用域引用的名稱鏈), 以 (mtime, size) 快取,
+  只重新解析變動過的檔案
+- SymbolIndex 依 import 綁定解析引用 (含別名、star import 與 __init__ 的重新匯出鏈), 解析結果逐名稱快取
+- 從根出發做一次 worklist BFS, 每個作用域的引用只解析一次, 時間與圖大小成線性; 未到達的定義即為候選
+
+接收者無法解析的屬性存取 (obj.method) 只能以名稱比對, 因此方法仍以方法名保守判定;
+繼承外部類別 (stdlib / 第三方, 例如 ast.NodeVisitor) 的 class 其方法可能是框架回呼, 隨 class 一起到達。
+模組層級的函數 / 類別則必須透過 import 解析到才算被使用。
+
 由於 Python 的動態特性，這可能會產生 False Positives (例如透過反射呼叫、
 或者作為 API 暴露給外部使用)。
 """
 
 import ast
+import os
+import tomllib
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+
+from pyci_check.cache import project_namespace
+from pyci_check.graph import is_test_file, map_local_modules
+from pyci_check.imports import find_pyproject_toml
+from pyci_check.utils import calculate_optimal_workers, map_chunks, should_use_thread_pool
+
+# 模組層級程式碼的作用域名稱
+MODULE_SCOPE = ""
+
+# 常見的框架鉤子/白名單 (不應被報警)
+ENTRY_POINT_NAMES = frozenset(
+    {
+        "main",
+        "setup",
+        "run",
+        "cli",  # 入口
+        "pytest_configure",
+        "pytest_addoption",  # pytest 鉤子
+    }
+)
+
+# 框架以 decorator 註冊的定義 (由框架呼叫, 專案內不會有引用); 比對 decorator 的名稱鏈,
+# 以及經 import 綁定展開後的完整名稱 (from pytest import fixture → pytest.fixture)
+DEFAULT_ROOT_DECORATORS = (
+    "pytest.fixture",
+    "pytest.hookimpl",
+    "*.route",
+    "*.get",
+    "*.post",
+    "*.put",
+    "*.patch",
+    "*.delete",
+    "*.websocket",
+    "*.command",
+    "*.group",
+    "*.callback",
+    "*.task",
+    "*.shared_task",
+    "*.receiver",
+    "*.listens_for",
+    "*.on_event",
+    "*.middleware",
+    "*.exception_handler",
+    "*.register",
+    "*.hookimpl",
+)
+
+# 重新匯出鏈的最大追蹤深度 (防止 a.x -> b.x -> a.x 這類循環綁定)
+_MAX_ALIAS_DEPTH = 32
+
+
+def _is_dunder(name: str) -> bool:
+    return name.startswith("__") and name.endswith("__")
+
+
+def _name_chain(node: ast.expr) -> str:
+    """a.b.c / a.b[T] → "a.b.c" / "a.b"; 其他運算式為 ""."""
+    if isinstance(node, ast.Subscript):
+        node = node.value
+    attrs = []
+    while isinstance(node, ast.Attribute):
+        attrs.append(node.attr)
+        node = node.value
+    return ".".join([node.id, *reversed(attrs)]) if isinstance(node, ast.Name) else ""
+
+
+class SymbolVisitor(ast.NodeVisitor):
+    """
+    產生單一模組的符號摘要.
 
+    定義只收模組層級與 class 內 (含巢狀 class) 的函數 / 類別; 函數內的巢狀定義視為該函數的一部分。
+    decorator、預設值、annotation 與 base class 在外層作用域求值, 其引用歸屬外層作用域;
+    魔術方法不列為定義, 其 body 的引用歸屬所在的 class。
+    """
 
-class DefinitionVisitor(ast.NodeVisitor):
-    def __init__(self, filepath: str):
-        self.filepath = filepath
-        # 定義的符號: name -> lineno
+    def __init__(self, module: str, is_package: bool) -> None:
+        self.module = module
+        self.is_package = is_package
+        # 本地限定名 (func / Class / Class.method) → 行號
         self.definitions: dict[str, int] = {}
-        # 標記在 __all__ 裡的符號 (視為 public API，不應報警)
-        self.exported: set[str] = set()
-
-    def visit_FunctionDef(self, node: ast.FunctionDef):
-        # 排除魔術方法
-        if not (node.name.startswith("__") and node.name.endswith("__")):
-            self.definitions[node.name] = node.lineno
+        # 定義在 class 內的函數 (方法) 的本地限定名
+        self.methods: set[str] = set()
+        # 本地名稱 → 完整限定名 (import / import as / from import, 相對 import 已解析)
+        self.bindings: dict[str, str] = {}
+        self.star_imports: list[str] = []
+        self.exported: list[str] | None = None
+        # class 本地限定名 → base class 的名稱鏈 (無法表示為名稱鏈的 base 記為 "")
+        self.bases: dict[str, list[str]] = {}
+        # 定義的本地限定名 → decorator 的名稱鏈 (@app.route("/") 記為 "app.route")
+        self.decorators: dict[str, list[str]] = {}
+        # 模組層級有 if __name__ == "__main__"
+        self.main_guard = False
+        # 作用域 → 引用的名稱鏈 ("a.b.c"; 無法追溯到名稱的屬性記為 ".attr")
+        self.references: dict[str, set[str]] = {}
+        self._owner = MODULE_SCOPE
+        # 目前 class body 的本地限定名前綴 ("" 表示模組層級)
+        self._prefix = ""
+        self._in_function = False
+
+    def summary(self) -> dict:
+        """可被 JSON 序列化的摘要 (快取用)."""
+        return {
+            "definitions": self.definitions,
+            "methods": sorted(self.methods),
+            "bindings": self.bindings,
+            "star_imports": self.star_imports,
+            "exported": self.exported,
+            "bases": self.bases,
+            "decorators": self.decorators,
+            "main_guard": self.main_guard,
+            "references": {owner: sorted(refs) for owner, refs in self.references.items()},
+        }
+
+    def _reference(self, ref: str) -> None:
+        self.references.setdefault(self._owner, set()).add(ref)
+
+    def _visit_all(self, nodes: Iterable[ast.AST | None]) -> None:
+        for node in nodes:
+            if node is not None:
+                self.visit(node)
+
+    def _visit_scope(self, body: list[ast.stmt], owner: str, prefix: str, in_function: bool) -> None:
+        saved = self._owner, self._prefix, self._in_function
+        self._owner, self._prefix, self._in_function = owner, prefix, in_function
+        self._visit_all(body)
+        self._owner, self._prefix, self._in_function = saved
+
+    def _record_decorators(self, qualname: str, decorators: list[ast.expr]) -> None:
+        chains = [_name_chain(d.func if isinstance(d, ast.Call) else d) for d in decorators]
+        if any(chains):
+            self.decorators[qualname] = [chain for chain in chains if chain]
+
+    def visit_If(self, node: ast.If) -> None:
+        test = node.test
+        if (
+            self._owner == MODULE_SCOPE
+            and isinstance(test, ast.Compare)
+            and isinstance(test.left, ast.Name)
+            and test.left.id == "__name__"
+            and any(isinstance(c, ast.Constant) and c.value == "__main__" for c in test.comparators)
+        ):
+            self.main_guard = True
         self.generic_visit(node)
 
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
-        if not (node.name.startswith("__") and node.name.endswith("__")):
-            self.definitions[node.name] = node.lineno
-        self.generic_visit(node)
-
-    def visit_ClassDef(self, node: ast.ClassDef):
-        self.definitions[node.name] = node.lineno
-        self.generic_visit(node)
-
-    def visit_Assign(self, node: ast.Assign):
-        # 嘗試解析 __all__ = ["func1", "func2"]
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        args = node.args
+        self._visit_all(node.decorator_list)
+        self._visit_all([*args.defaults, *args.kw_defaults])
+        self._visit_all(arg.annotation for arg in (*args.posonlyargs, *args.args, *args.kwonlyargs, args.vararg, args.kwarg) if arg)
+        self._visit_all([node.returns])
+
+        if self._in_function:
+            self._visit_all(node.body)
+            return
+        if _is_dunder(node.name):
+            # 魔術方法由直譯器隱式呼叫, 隨所在 class 一起到達
+            self._visit_scope(node.body, self._owner, "", True)
+            return
+        qualname = self._prefix + node.name
+        self.definitions[qualname] = node.lineno
+        self._record_decorators(qualname, node.decorator_list)
+        if self._prefix:
+            self.methods.add(qualname)
+        self._visit_scope(node.body, qualname, "", True)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._visit_function(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._visit_function(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self._visit_all(node.decorator_list)
+        self._visit_all(node.bases)
+        self._visit_all(kw.value for kw in node.keywords)
+        if self._in_function:
+            self._visit_all(node.body)
+            return
+        qualname = self._prefix + node.name
+        self.definitions[qualname] = node.lineno
+        self._record_decorators(qualname, node.decorator_list)
+        self.bases[qualname] = [_name_chain(base) for base in node.bases]
+        self._visit_scope(node.body, qualname, qualname + ".", False)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.asname:
+                self.bindings[alias.asname] = alias.name
+            else:
+                # import a.b.c 綁定 a
+                top = alias.name.split(".", 1)[0]
+                self.bindings[top] = top
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        base = node.module or ""
+        if node.level:
+            parts = self.module.split(".")
+            if not self.is_package:
+                parts = parts[:-1]
+            if node.level > 1:
+                parts = parts[: -(node.level - 1)]
+            base = ".".join([*parts, *([node.module] if node.module else [])])
+        for alias in node.names:
+            if alias.name == "*":
+                self.star_imports.append(base)
+            else:
+                self.bindings[alias.asname or alias.name] = f"{base}.{alias.name}" if base else alias.name
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        # 解析 __all__ = ["func1", "func2"]
         for target in node.targets:
             if isinstance(target, ast.Name) and target.id == "__all__" and isinstance(node.value, (ast.List, ast.Tuple)):
-                for elt in node.value.elts:
-                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
-                        self.exported.add(elt.value)
-        self.generic_visit(node)
-
-
-class UsageVisitor(ast.NodeVisitor):
-    def __init__(self):
-        # 所有被使用的符號名稱
-        self.used_names: set[str] = set()
-
-    def visit_Name(self, node: ast.Name):
-        # 如果作為變數被讀取，我們也視為被使用 (例如當作 callback 傳遞)
-        if isinstance(node.ctx, ast.Load):
-            self.used_names.add(node.id)
+                self.exported = [elt.value for elt in node.value.elts if isinstance(elt, ast.Constant) and isinstance(elt.value, str)]
         self.generic_visit(node)
 
-    def visit_Attribute(self, node: ast.Attribute):
-        # obj.method 的情況
+    def visit_Name(self, node: ast.Name) -> None:
+        # 作為變數被讀取也視為使用 (例如當作 callback 傳遞)
         if isinstance(node.ctx, ast.Load):
-            self.used_names.add(node.attr)
-        self.generic_visit(node)
-
-    # 不需要特別覆蓋 visit_Call，因為 call 的 func 通常是 Name 或 Attribute，
-    # 會被上面的方法捕獲。
-
-
-def scan_dead_code(python_files: list[str]) -> list[dict]:
+            self._reference(node.id)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        attrs = []
+        current: ast.expr = node
+        while isinstance(current, ast.Attribute):
+            attrs.append(current.attr)
+            current = current.value
+        if isinstance(current, ast.Name):
+            # a.b.c: 整條名稱鏈交給 SymbolIndex 解析
+            self._reference(".".join([current.id, *reversed(attrs)]))
+        else:
+            # foo().bar / x[0].bar: 接收者未知, 只記屬性名
+            for attr in attrs:
+                self._reference("." + attr)
+            self.visit(current)
+
+
+def summarize_module(code: str, module: str, is_package: bool) -> dict | None:
     """
-    掃描專案尋找可能未被呼叫的定義.
+    單一模組的符號摘要.
 
     Returns:
-        包含死代碼資訊的列表
+        SymbolVisitor.summary(); 語法錯誤時為 None
     """
-    from pyci_check.imports import read_file_with_encoding
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return None
+    visitor = SymbolVisitor(module, is_package)
+    visitor.visit(tree)
+    return visitor.summary()
 
-    # name -> list of {file, line}
-    all_definitions: dict[str, list[dict]] = {}
-    all_exported: set[str] = set()
 
-    # 存放所有使用的名字
-    usage_visitor = UsageVisitor()
+def _summarize_chunk(items: Sequence[tuple[str, str]]) -> list[tuple[str, dict | None]]:
+    """解析一個區塊的 (檔案, 模組名), 每個區塊在自己的 worker 內累積結果."""
+    from pyci_check.imports import read_file_with_encoding
 
-    # Pass 1 & 2: 收集定義與使用
-    for filepath in python_files:
+    results = []
+    for filepath, module in items:
         code = read_file_with_encoding(filepath)
-        if not code:
-            continue
-
-        try:
-            tree = ast.parse(code)
+        summary = summarize_module(code, module, os.path.basename(filepath) == "__init__.py") if code else None
+        results.append((filepath, summary))
+    return results
+
+
+class _SymbolSummaryCache:
+    """每個檔案的符號摘要, 以 (mtime_ns, size, 模組名) 判斷是否需要重新解析."""
+
+    NAMESPACE = "deadcode_symbols"
+    VERSION = 3
+
+    def __init__(self, project_dir: str | None) -> None:
+        self._store = project_namespace(project_dir, self.NAMESPACE, self.VERSION)
+        self._data: dict[str, tuple] = self._store.items() or {}
+        self._updates: dict[str, tuple] = {}
+
+    def load(self, file_to_module: dict[str, str]) -> dict[str, dict]:
+        """
+        所有檔案的摘要; 變動過的檔案重新解析 (大型專案分區塊並行).
+
+        Returns:
+            {檔案: 摘要} (無法讀取或解析的檔案不在其中)
+        """
+        summaries: dict[str, dict] = {}
+        stale: list[tuple[str, str]] = []
+        stats: dict[str, tuple[int, int]] = {}
+        for fp, module in file_to_module.items():
+            try:
+                st = os.stat(fp)
+            except OSError:
+                continue
+            stats[fp] = (st.st_mtime_ns, st.st_size)
+            cached = self._data.get(fp)
+            if cached is not None and (cached[0], cached[1], cached[2]) == (st.st_mtime_ns, st.st_size, module):
+                if cached[3] is not None:
+                    summaries[fp] = cached[3]
+            else:
+                stale.append((fp, module))
+
+        if should_use_thread_pool(len(stale), work_kind="cpu"):
+            chunks = map_chunks(_summarize_chunk, stale, calculate_optimal_workers(len(stale), work_kind="cpu"))
+        else:
+            chunks = [_summarize_chunk(stale)]
+        for chunk in chunks:
+            for fp, summary in chunk:
+                self._updates[fp] = (*stats[fp], file_to_module[fp], summary)
+                if summary is not None:
+                    summaries[fp] = summary
+
+        if set(stats) != self._data.keys():
+            # 有檔案刪除 / 新增: 整份重寫, 不保留已刪除檔案的項目
+            self._store.update({fp: self._updates.get(fp) or self._data[fp] for fp in stats}, replace=True)
+        elif self._updates:
+            self._store.update(self._updates)
+        return summaries
+
+
+@dataclass
+class DeadcodeRoots:
+    """死代碼分析的入口設定."""
+
+    # "pkg.mod:attr" 形式的入口 ([project.scripts] / [project.gui-scripts] / [project.entry-points])
+    entry_points: list[str] = field(default_factory=list)
+    # decorator 名稱樣式 (fnmatch), 預設 DEFAULT_ROOT_DECORATORS 加上 [tool.pyci-check] deadcode-root-decorators
+    decorators: list[str] = field(default_factory=lambda: list(DEFAULT_ROOT_DECORATORS))
+
+
+class SymbolIndex:
+    """
+    專案的限定名符號表.
 
-            # 收集定義
-            def_visitor = DefinitionVisitor(filepath)
-            def_visitor.visit(tree)
+    節點為定義的完整限定名 (pkg.mod.Class.method) 或模組節點 ("pkg.mod:", 代表模組層級程式碼)。
+    引用解析結果 (限定名 → 節點) 逐名稱快取, 同一個重新匯出鏈只追蹤一次。
+    """
 
-            for name, lineno in def_visitor.definitions.items():
-                if name not in all_definitions:
-                    all_definitions[name] = []
-                all_definitions[name].append({"file": filepath, "line": lineno})
+    def __init__(self, summaries: dict[str, dict], file_to_module: dict[str, str]) -> None:
+        # 模組名 → 摘要 / 檔案
+        self.modules: dict[str, dict] = {}
+        self.files: dict[str, str] = {}
+        for fp, summary in summaries.items():
+            module = file_to_module[fp]
+            self.modules[module] = summary
+            self.files[module] = fp
+        # 定義節點 → (模組名, 本地限定名)
+        self.definitions: dict[str, tuple[str, str]] = {}
+        # 方法名 → 方法節點 (接收者未知的屬性存取以名稱比對)
+        self.methods_by_name: dict[str, list[str]] = {}
+        # class 節點 → 直接定義在其中的方法節點
+        self.class_methods: dict[str, list[str]] = {}
+        for module, summary in self.modules.items():
+            for qualname in summary["definitions"]:
+                self.definitions[f"{module}.{qualname}"] = (module, qualname)
+            for qualname in summary["methods"]:
+                owner, _, name = qualname.rpartition(".")
+                self.methods_by_name.setdefault(name, []).append(f"{module}.{qualname}")
+                self.class_methods.setdefault(f"{module}.{owner}", []).append(f"{module}.{qualname}")
+        self._canonical: dict[str, tuple[str | None, tuple[str, ...]]] = {}
+        self._external_base: dict[str, bool] = {}
+
+    @staticmethod
+    def module_node(module: str) -> str:
+        return module + ":"
+
+    def _member(self, module: str, parts: list[str], depth: int) -> tuple[str | None, tuple[str, ...]]:
+        """模組內名稱鏈 → (節點, 無法解析的剩餘屬性)."""
+        summary = self.modules[module]
+        definitions = summary["definitions"]
+        name = parts[0]
+        if name in definitions:
+            # Class.method / Outer.Inner: 盡量往下解析
+            qualname = name
+            i = 1
+            while i < len(parts) and f"{qualname}.{parts[i]}" in definitions:
+                qualname = f"{qualname}.{parts[i]}"
+                i += 1
+            return f"{module}.{qualname}", tuple(parts[i:])
+        if depth < _MAX_ALIAS_DEPTH:
+            if name in summary["bindings"]:
+                # import 綁定 / 重新匯出
+                return self.canonical(".".join([summary["bindings"][name], *parts[1:]]), depth + 1)
+            for source in summary["star_imports"]:
+                node, rest = self.canonical(".".join([source, *parts]), depth + 1)
+                if node is not None:
+                    return node, rest
+        return None, tuple(parts[1:])
+
+    def canonical(self, qualified: str, depth: int = 0) -> tuple[str | None, tuple[str, ...]]:
+        """
+        完整限定名 → 節點.
+
+        Returns:
+            (節點, 剩餘屬性); 非本地模組 (stdlib / 第三方) 為 (None, ())
+        """
+        cached = self._canonical.get(qualified)
+        if cached is not None:
+            return cached
+        parts = qualified.split(".")
+        result: tuple[str | None, tuple[str, ...]] = (None, ())
+        for i in range(len(parts), 0, -1):
+            module = ".".join(parts[:i])
+            if module in self.modules:
+                result = (self.module_node(module), ()) if i == len(parts) else self._member(module, parts[i:], depth)
+                break
+        self._canonical[qualified] = result
+        return result
+
+    def resolve(self, module: str, ref: str) -> tuple[str | None, tuple[str, ...]]:
+        """
+        模組內的引用 (名稱鏈或 ".attr") → (節點, 剩餘屬性).
+
+        本地未綁定的名稱 (區域變數、參數、builtin) 解析為 None, 其後的屬性全部視為剩餘屬性。
+        """
+        if ref.startswith("."):
+            return None, (ref[1:],)
+        parts = ref.split(".")
+        summary = self.modules[module]
+        if parts[0] in summary["definitions"] or parts[0] in summary["bindings"]:
+            return self._member(module, parts, 0)
+        for source in summary["star_imports"]:
+            node, rest = self.canonical(f"{source}.{ref}", 1)
+            if node is not None:
+                return node, rest
+        return None, tuple(parts[1:])
+
+    def inherits_external(self, class_node: str) -> bool:
+        """Class 是否 (直接或經由本地 base) 繼承外部類別; 無法解析的 base 視為外部, object 除外."""
+        cached = self._external_base.get(class_node)
+        if cached is not None:
+            return cached
+        # 先標記為 False: 循環繼承 (語法上合法但執行會失敗) 不會無限遞迴
+        self._external_base[class_node] = False
+        module, qualname = self.definitions[class_node]
+        result = False
+        for base in self.modules[module]["bases"].get(qualname, ()):
+            if base == "object":
+                continue
+            node = self.resolve(module, base)[0] if base else None
+            if node is None or node not in self.definitions or self.inherits_external(node):
+                result = True
+                break
+        self._external_base[class_node] = result
+        return result
+
+    def successors(self, node: str) -> set[str]:
+        """
+        節點引用到的節點.
+
+        解析到的定義 / 模組, 剩餘屬性名對應的方法; 繼承外部類別的 class 另外連到自己的所有方法。
+        定義連到所在模組, 模組連到上層套件 (import 時會執行其模組層級程式碼)。
+        """
+        targets: set[str] = set()
+        if node.endswith(":"):
+            module, owner = node[:-1], MODULE_SCOPE
+            package = module.rpartition(".")[0]
+            if package in self.modules:
+                targets.add(self.module_node(package))
+        else:
+            module, owner = self.definitions[node]
+            targets.add(self.module_node(module))
+        if owner in self.modules[module]["bases"] and self.inherits_external(node):
+            targets.update(self.class_methods.get(node, ()))
+        for ref in self.modules[module]["references"].get(owner, ()):
+            target, rest = self.resolve(module, ref)
+            if target is not None:
+                targets.add(target)
+            for attr in rest:
+                targets.update(self.methods_by_name.get(attr, ()))
+        return targets
+
+    def reachable(self, roots: Iterable[str]) -> set[str]:
+        """從 roots 出發可到達的節點 (BFS, 每個節點的引用只解析一次)."""
+        seen = set(roots)
+        queue = deque(seen)
+        while queue:
+            for target in self.successors(queue.popleft()):
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return seen
+
+    def _matches_decorator(self, module: str, chain: str, patterns: Sequence[str]) -> bool:
+        """判斷 decorator 名稱鏈 (原樣或經 import 綁定展開) 是否符合任一樣式."""
+        head, _, rest = chain.partition(".")
+        binding = self.modules[module]["bindings"].get(head)
+        names = [chain] if binding is None else [chain, f"{binding}.{rest}" if rest else binding]
+        return any(fnmatchcase(name, pattern) for name in names for pattern in patterns)
+
+    def roots(self, config: DeadcodeRoots | None = None) -> set[str]:
+        """
+        可達性分析的根節點.
+
+        Args:
+            config: 入口與框架 decorator 設定; None 時不含宣告的入口, decorator 使用預設樣式
+
+        Returns:
+            根節點集合
+        """
+        config = config or DeadcodeRoots()
+        roots: set[str] = set()
+        for entry_point in config.entry_points:
+            # "pkg.cli:main" / "pkg.cli:App.run" / "pkg.cli"
+            node, rest = self.canonical(entry_point.replace(":", ".").strip())
+            if node is not None and not rest:
+                roots.add(node)
+        # 未宣告入口 (純函式庫): 所有模組都可能被 import
+        entry_modules_only = bool(roots)
+
+        for module, summary in self.modules.items():
+            path = self.files[module]
+            basename = os.path.basename(path)
+            if is_test_file(path) or basename == "conftest.py":
+                # 測試檔由 pytest 收集: 整個檔案都是根
+                roots.add(self.module_node(module))
+                roots.update(f"{module}.{qualname}" for qualname in summary["definitions"])
+                continue
+            if not entry_modules_only or basename == "__main__.py" or summary["main_guard"]:
+                roots.add(self.module_node(module))
+            for name in summary["exported"] or ():
+                node, _ = self._member(module, [name], 0)
+                if node is not None:
+                    roots.add(node)
+            for qualname, chains in summary["decorators"].items():
+                if any(self._matches_decorator(module, chain, config.decorators) for chain in chains):
+                    roots.add(f"{module}.{qualname}")
+
+        for node, (_, qualname) in self.definitions.items():
+            name = qualname.rpartition(".")[2]
+            if name in ENTRY_POINT_NAMES or name.startswith(("test_", "fixture_")):
+                roots.add(node)
+        return roots
+
+
+def load_deadcode_roots(project_dir: str) -> DeadcodeRoots:
+    """
+    讀取 pyproject.toml 的入口宣告與 [tool.pyci-check] deadcode-root-decorators.
 
-            all_exported.update(def_visitor.exported)
+    Returns:
+        DeadcodeRoots
+    """
+    pyproject_path = find_pyproject_toml(project_dir)
+    if not pyproject_path:
+        return DeadcodeRoots()
+    try:
+        with open(pyproject_path, "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return DeadcodeRoots()
+
+    project = data.get("project", {})
+    groups = [project.get("scripts", {}), project.get("gui-scripts", {}), *project.get("entry-points", {}).values()]
+    entry_points = sorted({value for group in groups if isinstance(group, dict) for value in group.values() if isinstance(value, str)})
+
+    roots = DeadcodeRoots(entry_points=entry_points)
+    extra = data.get("tool", {}).get("pyci-check", {}).get("deadcode-root-decorators", [])
+    if isinstance(extra, list):
+        roots.decorators.extend(pattern for pattern in extra if isinstance(pattern, str))
+    return roots
+
+
+def build_symbol_index(python_files: list[str], project_dir: str | None = None, src_dirs: list[str] | None = None) -> SymbolIndex:
+    """
+    建立專案的符號表, 未變動的檔案直接使用快取的摘要.
 
-            # 收集使用
-            usage_visitor.visit(tree)
+    Args:
+        python_files: 要掃描的檔案
+        project_dir: 專案根目錄 (決定模組名與快取位置); None 時以檔案的共同目錄命名且不使用快取
+        src_dirs: 原始碼目錄 (PYTHONPATH)
 
-        except SyntaxError:
-            pass
+    Returns:
+        SymbolIndex
+    """
+    if not python_files:
+        return SymbolIndex({}, {})
+    root = project_dir or os.path.commonpath([os.path.dirname(os.path.abspath(fp)) for fp in python_files])
+    file_to_module = map_local_modules(python_files, root, src_dirs or [])
+    summaries = _SymbolSummaryCache(project_dir).load(file_to_module)
+    return SymbolIndex(summaries, file_to_module)
 
-    # 分析結果
-    warnings = []
 
-    # 常見的框架鉤子/白名單 (不應被報警)
-    whitelist = {
-        "main",
-        "setup",
-        "run",
-        "cli",  # 入口
-        "pytest_configure",
-        "pytest_addoption",  # pytest 鉤子
-    }
+def scan_dead_code(python_files: list[str], project_dir: str | None = None, src_dirs: list[str] | None = None) -> list[dict]:
+    """
+    掃描專案尋找可能未被呼叫的定義.
 
-    for name, locations in all_definitions.items():
-        if name in all_exported or name in whitelist:
-            continue
+    Args:
+        python_files: 要掃描的檔案
+        project_dir: 專案根目錄; None 時以檔案的共同目錄推導模組名
+        src_dirs: 原始碼目錄 (PYTHONPATH)
 
-        # 測試檔案中的定義 (例如 test_foo) 不算死代碼，它們是由測試運行器呼叫的
-        [loc for loc in locations if not loc["file"].endswith("test_" + name + ".py")]
+    Returns:
+        包含死代碼資訊的列表 (依檔案與行號排序)
+    """
+    index = build_symbol_index(python_files, project_dir, src_dirs)
+    reached = index.reachable(index.roots(load_deadcode_roots(project_dir) if project_dir else None))
 
-        # 簡化判斷：如果一個符號的定義都在 test 檔案裡 (或者開頭是 test_)，略過
-        if name.startswith(("test_", "fixture_")):
+    warnings = []
+    for node, (module, qualname) in index.definitions.items():
+        if node in reached:
             continue
-
-        if name not in usage_visitor.used_names:
-            warnings.extend(
-                {"file": loc["file"], "line": loc["line"], "name": name, "reason": "Definition appears to be unused across the project"}
-                for loc in locations
-            )
-
+        warnings.append(
+            {
+                "file": index.files[module],
+                "line": index.modules[module]["definitions"][qualname],
+                "name": qualname,
+                "reason": "Definition is not reachable from any entry point, test, registered decorator or __all__ export",
+            }
+        )
+    warnings.sort(key=lambda w: (w["file"], w["line"]))
     return warnings
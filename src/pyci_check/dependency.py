@@ -6,11 +6,14 @@
 2. 冗餘依賴 (Orphan Dependencies): 宣告了但在專案中完全沒有使用的依賴。
 """
 
+import glob
+import hashlib
 import os
 import re
 import tomllib
 
-from pyci_check.imports import _stdlib_top_levels
+from pyci_check.cache import project_namespace
+from pyci_check.imports import _stdlib_top_levels, _venv_site_packages
 
 
 def parse_pyproject_dependencies(pyproject_path: str) -> set[str]:
@@ -80,6 +83,34 @@ def _extract_names(spec_list: list[str]) -> list[str]:
     return names
 
 
+def _normalize_name(name: str) -> str:
+    """PEP 503 套件名正規化 (大小寫、`-` / `_` / `.` 視為相同)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _requirements_files(project_dir: str) -> tuple[list[str], list[str]]:
+    """
+    找出 requirements 類檔案, 區分「宣告」與「鎖定」.
+
+    pip-tools 慣例: `requirements*.in` 是人工宣告, 同名 `.txt` 是 pip-compile 產出的完整鎖定清單
+    (含 transitive 依賴), 不應視為宣告。沒有對應 `.in` 的 `.txt` 仍視為宣告。
+
+    Returns:
+        (宣告檔列表, 鎖定檔列表)
+    """
+    inputs = sorted(glob.glob(os.path.join(project_dir, "requirements*.in")))
+    txts = sorted(
+        {
+            *glob.glob(os.path.join(project_dir, "requirements*.txt")),
+            *glob.glob(os.path.join(project_dir, "*-requirements.txt")),
+        }
+    )
+    compiled = {os.path.splitext(p)[0] + ".txt" for p in inputs}
+    declared = inputs + [p for p in txts if p not in compiled]
+    locked = [p for p in txts if p in compiled]
+    return declared, locked
+
+
 def get_declared_dependencies(project_dir: str) -> set[str]:
     """獲取專案宣告的所有依賴 (包名)."""
     all_deps = set()
@@ -89,16 +120,205 @@ def get_declared_dependencies(project_dir: str) -> set[str]:
     if os.path.exists(pyproject):
         all_deps.update(parse_pyproject_dependencies(pyproject))
 
-    # 2. requirements.txt (及常見變體)
-    for req_file in ["requirements.txt", "requirements-dev.txt", "dev-requirements.txt"]:
-        path = os.path.join(project_dir, req_file)
-        if os.path.exists(path):
-            all_deps.update(parse_requirements_txt(path))
+    # 2. requirements*.txt (及常見變體) / pip-tools requirements*.in
+    declared_files, _ = _requirements_files(project_dir)
+    for path in declared_files:
+        all_deps.update(parse_requirements_txt(path))
 
     return all_deps
 
 
-def find_dependency_issues(project_dir: str, imported_modules: set[str], local_modules: set[str]) -> dict[str, set[str]]:
+def parse_lockfile_packages(project_dir: str) -> set[str]:
+    """
+    從鎖定檔收集專案環境中應存在的所有套件名 (含 transitive 依賴).
+
+    支援 uv.lock / poetry.lock ([[package]] 表格) 與 pip-tools 產出的 requirements*.txt。
+    uv.lock 中 editable / virtual 來源是專案自身, 不列入。
+
+    Args:
+        project_dir: 專案根目錄
+
+    Returns:
+        正規化後的套件名集合 (沒有鎖定檔時為空集合)
+    """
+    packages: set[str] = set()
+    for lock_name in ("uv.lock", "poetry.lock"):
+        path = os.path.join(project_dir, lock_name)
+        try:
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+        except (OSError, tomllib.TOMLDecodeError):
+            continue
+        for entry in data.get("package", []):
+            name = entry.get("name")
+            source = entry.get("source", {})
+            if not name or (isinstance(source, dict) and ({"editable", "virtual"} & source.keys())):
+                continue
+            packages.add(_normalize_name(name))
+
+    _, locked_files = _requirements_files(project_dir)
+    for path in locked_files:
+        packages.update(_normalize_name(p) for p in parse_requirements_txt(path))
+    return packages
+
+
+def _dist_top_levels(dist_dir: str) -> list[str]:
+    """
+    讀單一 dist-info / egg-info 提供的頂層模組名.
+
+    優先 top_level.txt (setuptools 產出); 沒有則從 RECORD 的檔案路徑推導 (wheel 一定有 RECORD)。
+    """
+    try:
+        with open(os.path.join(dist_dir, "top_level.txt"), encoding="utf-8") as f:
+            names = [line.strip().replace("/", ".").split(".", 1)[0] for line in f]
+        return sorted({n for n in names if n})
+    except OSError:
+        pass
+
+    tops: set[str] = set()
+    try:
+        with open(os.path.join(dist_dir, "RECORD"), encoding="utf-8") as f:
+            for line in f:
+                path = line.split(",", 1)[0].strip()
+                # ../../bin/xxx 之類的 script 與 metadata 目錄不是可 import 的模組
+                if not path or path.startswith(("..", "/")):
+                    continue
+                first = path.split("/", 1)[0]
+                if first.endswith((".dist-info", ".egg-info", ".data", ".pth")) or first == "__pycache__":
+                    continue
+                if "/" in path:
+                    tops.add(first)
+                elif first.endswith(".py"):
+                    tops.add(first[:-3])
+                elif first.endswith((".so", ".pyd")):
+                    # C extension: foo.cpython-311-x86_64-linux-gnu.so → foo
+                    tops.add(first.split(".", 1)[0])
+    except OSError:
+        pass
+    return sorted(t for t in tops if t.isidentifier())
+
+
+def _dist_name(dist_dir: str) -> str:
+    """dist-info 目錄名 `<name>-<version>.dist-info` 取出套件名 (METADATA 可能很大, 不讀)."""
+    base = os.path.basename(dist_dir)
+    return _normalize_name(base.rsplit(".", 1)[0].split("-", 1)[0])
+
+
+def build_module_index(site_packages_dirs: list[str]) -> dict[str, list[str]]:
+    """
+    直接讀目標環境的 dist-info / egg-info 建立 模組 → 套件 索引.
+
+    不 import 目標環境, 也不依賴執行 pyci-check 的 interpreter (pipx / 全域安裝時兩者不同)。
+
+    Args:
+        site_packages_dirs: 目標環境的 site-packages 目錄
+
+    Returns:
+        {頂層模組名: [正規化套件名, ...]}
+    """
+    index: dict[str, set[str]] = {}
+    for site_dir in site_packages_dirs:
+        try:
+            entries = os.listdir(site_dir)
+        except OSError:
+            continue
+        for entry in entries:
+            if not entry.endswith((".dist-info", ".egg-info")):
+                continue
+            dist_dir = os.path.join(site_dir, entry)
+            if not os.path.isdir(dist_dir):
+                continue
+            pkg = _dist_name(dist_dir)
+            for module in _dist_top_levels(dist_dir):
+                index.setdefault(module, set()).add(pkg)
+    return {module: sorted(pkgs) for module, pkgs in index.items()}
+
+
+class _PackageIndexCache:
+    """
+    模組 → 套件 索引快取.
+
+    簽名 = site-packages 路徑 + 各目錄 mtime: 安裝 / 移除套件會新增 / 刪除 dist-info 目錄,
+    site-packages 的 mtime 隨之改變 → 快取失效。
+    """
+
+    NAMESPACE = "package_index"
+    VERSION = 1
+
+    def __init__(self, project_dir: str, site_packages_dirs: list[str]) -> None:
+        parts = []
+        for p in site_packages_dirs:
+            try:
+                parts.append(f"{p}={os.path.getmtime(p)}")
+            except OSError:
+                parts.append(f"{p}=missing")
+        self.signature = hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+        self._store = project_namespace(project_dir, self.NAMESPACE, self.VERSION, self.signature)
+
+    def load(self) -> dict[str, list[str]] | None:
+        index = self._store.items()
+        if index is not None:
+            # 記錄命中與存取時間 (LRU)
+            self._store.update()
+        return index
+
+    def store(self, index: dict[str, list[str]]) -> None:
+        # 整份重建: 已移除套件的模組不可殘留
+        self._store.update(index, replace=True)
+
+
+def _find_site_packages(project_dir: str, venv_path: str | None) -> list[str]:
+    """目標環境 site-packages: 指定的 venv, 否則專案內的 .venv."""
+    if venv_path:
+        return _venv_site_packages(os.path.join(project_dir, venv_path))
+    return _venv_site_packages(os.path.join(project_dir, ".venv"))
+
+
+def get_module_package_index(project_dir: str, venv_path: str | None = None) -> dict[str, list[str]]:
+    """
+    取得 模組 → 套件 索引.
+
+    來源優先順序:
+    1. 目標 venv 的 dist-info (有快取, 環境不變就不重掃)
+    2. 找不到目標 venv 時退回當前 interpreter 的 importlib.metadata.packages_distributions()
+
+    鎖定檔中有、但環境中未安裝的套件, 以套件名推測模組名補上 (requests → requests,
+    python-dateutil → python_dateutil), 讓尚未 `uv sync` 的環境也能判斷。
+
+    Args:
+        project_dir: 專案根目錄
+        venv_path: 目標虛擬環境路徑 (相對於 project_dir 或絕對路徑)
+
+    Returns:
+        {頂層模組名: [正規化套件名, ...]}
+    """
+    site_dirs = _find_site_packages(project_dir, venv_path)
+    if site_dirs:
+        cache = _PackageIndexCache(project_dir, site_dirs)
+        index = cache.load()
+        if index is None:
+            index = build_module_index(site_dirs)
+            cache.store(index)
+    else:
+        import importlib.metadata
+
+        try:
+            index = {m: sorted({_normalize_name(p) for p in pkgs}) for m, pkgs in importlib.metadata.packages_distributions().items()}
+        except Exception:
+            index = {}
+
+    provided = {p for pkgs in index.values() for p in pkgs}
+    for pkg in parse_lockfile_packages(project_dir) - provided:
+        index.setdefault(pkg.replace("-", "_"), []).append(pkg)
+    return index
+
+
+def find_dependency_issues(
+    project_dir: str,
+    imported_modules: set[str],
+    local_modules: set[str],
+    venv_path: str | None = None,
+) -> dict[str, set[str]]:
     """
     分析依賴問題.
 
@@ -106,6 +326,7 @@ def find_dependency_issues(project_dir: str, imported_modules: set[str], local_m
         project_dir: 專案根目錄
         imported_modules: 程式碼中使用的所有頂層模組名
         local_modules: 專案自身的模組名 (應排除在第三方檢查外)
+        venv_path: 目標虛擬環境路徑 (None 則自動偵測專案內 .venv)
 
     Returns:
         {"phantom": set(), "orphan": set()}
@@ -113,13 +334,8 @@ def find_dependency_issues(project_dir: str, imported_modules: set[str], local_m
     declared_packages = get_declared_dependencies(project_dir)
     stdlib = _stdlib_top_levels()
 
-    # 獲取模組到包的映射 (需在當前環境執行)
-    import importlib.metadata
-
-    try:
-        module_to_pkg = importlib.metadata.packages_distributions()
-    except Exception:
-        module_to_pkg = {}
+    # 模組到包的映射: 讀目標環境 dist-info + 鎖定檔, 不依賴當前 interpreter
+    module_to_pkg = get_module_package_index(project_dir, venv_path)
 
     # 1. 幽靈依賴 (Phantom): 使用了，但沒宣告
     phantom = set()
@@ -0,0 +1,732 @@
+"""
+專案內部的檔案層級 import 圖.
+
+循環引用偵測、影響分析 (impact) 與圖匯出 (graph) 共用同一份圖:
+- build_import_graph: 由 extract_from_all_files 的結果建圖
+- load_import_graph: 以 (mtime, size) 快取每個檔案的 import, 只重新解析變動過的檔案,
+  供 `pyci-check impact` 這類需要毫秒級回應的查詢使用
+- 每條邊標記 import 的執行時機 (模組層級 / 函數內 / TYPE_CHECKING / optional), 建圖時可只收錄部分時機
+- feedback_edges: 每個 SCC 的近似最小回饋邊集 (Eades-Lin-Smyth), 移除後即無循環
+- compute_metrics: fan-in / fan-out / SCC / 拓撲層 / 遞移 import 數, 皆為線性或位元平行計算
+- iter_export: 以 JSON / DOT / GraphML 串流輸出
+"""
+
+import heapq
+import json
+import os
+from collections import deque
+from collections.abc import Callable, Collection, Iterable, Iterator
+from dataclasses import asdict, dataclass, field, fields
+from xml.sax.saxutils import quoteattr
+
+from pyci_check.cache import project_namespace
+from pyci_check.imports import RUNTIME_IMPORT_KINDS, process_single_file
+from pyci_check.utils import get_exclude_dirs_set, walk_python_files
+
+
+@dataclass
+class ImportGraph:
+    """
+    檔案層級 import 圖.
+
+    節點為本地 Python 檔案的絕對路徑; 只包含解析得到本地檔案的 import (第三方 / stdlib 不在圖中)。
+    只收錄建圖時指定執行時機 (imports.IMPORT_KINDS) 的 import, 每條邊記錄其 import 的執行時機。
+    """
+
+    project_dir: str
+    # 檔案 → 模組名
+    modules: dict[str, str]
+    # 檔案 → 它 import 的本地檔案
+    edges: dict[str, set[str]]
+    # 檔案 → 它 import 的非本地頂層模組 (stdlib 與第三方, 未區分)
+    external: dict[str, set[str]] = field(default_factory=dict)
+    # 檔案 → {import 的本地檔案: 該邊 import 敘述的執行時機集合}
+    edge_kinds: dict[str, dict[str, set[str]]] = field(default_factory=dict)
+    # 檔案 → {import 的本地檔案: 構成該邊的 import 紀錄}; 只有 keep_imports=True 建圖時才有
+    edge_imports: dict[str, dict[str, list[dict]]] = field(default_factory=dict)
+    _importers: dict[str, set[str]] | None = field(default=None, init=False, repr=False)
+
+    @property
+    def importers(self) -> dict[str, set[str]]:
+        """反向圖: 檔案 → import 它的檔案 (首次存取時建立)."""
+        if self._importers is None:
+            reverse: dict[str, set[str]] = {node: set() for node in self.edges}
+            for src, targets in self.edges.items():
+                for target in targets:
+                    reverse[target].add(src)
+            self._importers = reverse
+        return self._importers
+
+    def edges_for(self, kinds: Collection[str]) -> dict[str, set[str]]:
+        """只保留至少有一個 import 敘述屬於 kinds 的邊."""
+        kinds = frozenset(kinds)
+        return {
+            src: {target for target, edge_kinds in self.edge_kinds.get(src, {}).items() if not edge_kinds.isdisjoint(kinds)}
+            for src in self.edges
+        }
+
+
+def map_local_modules(python_files: Iterable[str], project_dir: str, src_dirs: list[str]) -> dict[str, str]:
+    """
+    本地檔案 → 模組名.
+
+    同一檔案可從多個 root (專案根目錄 / src 目錄) 推得模組名時, 取最短者 (最深層的 root)。
+
+    Returns:
+        {檔案絕對路徑: 模組名}
+    """
+    roots = [os.path.abspath(project_dir)]
+    roots.extend(os.path.abspath(os.path.join(project_dir, s)) for s in src_dirs)
+
+    file_to_module: dict[str, str] = {}
+    for fp in python_files:
+        abs_fp = os.path.abspath(fp)
+        best_mod = None
+        for abs_root in roots:
+            if abs_fp.startswith(abs_root):
+                rel = os.path.relpath(abs_fp, abs_root)
+                mod = rel.replace(os.sep, ".").removesuffix(".py").removesuffix(".__init__")
+                if best_mod is None or len(mod) < len(best_mod):
+                    best_mod = mod
+        if best_mod:
+            file_to_module[abs_fp] = best_mod
+    return file_to_module
+
+
+def _resolve_relative(src_file: str, module: str, level: int) -> str:
+    """相對 import → 目標檔案絕對路徑 (不保證存在)."""
+    target_dir = os.path.dirname(src_file)
+    for _ in range(level - 1):
+        target_dir = os.path.dirname(target_dir)
+
+    if module == ".":
+        # from . import x -> target is the current dir's __init__.py
+        return os.path.abspath(os.path.join(target_dir, "__init__.py"))
+    potential_file = os.path.join(target_dir, *module.split(".")) + ".py"
+    if not os.path.exists(potential_file):
+        potential_file = os.path.join(target_dir, *module.split("."), "__init__.py")
+    return os.path.abspath(potential_file)
+
+
+def build_import_graph(
+    all_imports: list[dict],
+    all_relative_imports: list[dict],
+    project_dir: str,
+    src_dirs: list[str],
+    python_files: list[str] | None = None,
+    *,
+    kinds: Collection[str] = RUNTIME_IMPORT_KINDS,
+    keep_imports: bool = False,
+) -> ImportGraph:
+    """
+    由 import 資訊建立檔案層級 import 圖.
+
+    Args:
+        all_imports: 所有絕對匯入資訊
+        all_relative_imports: 所有相對匯入資訊
+        project_dir: 專案根目錄
+        src_dirs: 原始碼目錄 (PYTHONPATH)
+        python_files: 本地檔案; None 則走訪 project_dir (預設排除目錄)
+        kinds: 收錄的 import 執行時機 (imports.IMPORT_KINDS); 未標記的 import 視為 module
+        keep_imports: 在 edge_imports 保留每條邊對應的 import 紀錄 (行號 / 原始敘述)
+
+    Returns:
+        ImportGraph
+    """
+    if python_files is None:
+        python_files = walk_python_files(project_dir, get_exclude_dirs_set())
+    file_to_module = map_local_modules(python_files, project_dir, src_dirs)
+    module_to_file = {mod: fp for fp, mod in file_to_module.items()}
+    local_tops = {mod.split(".", 1)[0] for mod in module_to_file}
+    graph: dict[str, set[str]] = {fp: set() for fp in file_to_module}
+    external: dict[str, set[str]] = {fp: set() for fp in file_to_module}
+    edge_kinds: dict[str, dict[str, set[str]]] = {fp: {} for fp in file_to_module}
+    edge_imports: dict[str, dict[str, list[dict]]] = {fp: {} for fp in file_to_module} if keep_imports else {}
+
+    def add_edge(src_file: str, target: str, imp: dict, kind: str) -> None:
+        graph[src_file].add(target)
+        edge_kinds[src_file].setdefault(target, set()).add(kind)
+        if keep_imports:
+            edge_imports[src_file].setdefault(target, []).append(imp)
+
+    # 處理絕對匯入
+    for imp in all_imports:
+        src_file = os.path.abspath(imp["file"])
+        kind = imp.get("kind", "module")
+        if src_file not in graph or kind not in kinds:
+            continue
+        # 尋找匹配的本地檔案 (處理 dotted submodules)
+        # 例如 import a.b.c，可能是 a/b/c.py 或 a/b/__init__.py
+        current = imp["module"]
+        top = current.split(".", 1)[0]
+        if top not in local_tops:
+            external[src_file].add(top)
+            continue
+        while current:
+            if current in module_to_file:
+                add_edge(src_file, module_to_file[current], imp, kind)
+                break
+            if "." not in current:
+                break
+            current = current.rsplit(".", 1)[0]
+
+    # 處理相對匯入
+    for imp in all_relative_imports:
+        src_file = os.path.abspath(imp["file"])
+        kind = imp.get("kind", "module")
+        if src_file not in graph or kind not in kinds:
+            continue
+        abs_target = _resolve_relative(src_file, imp["module"], imp["level"])
+        if abs_target in graph:
+            add_edge(src_file, abs_target, imp, kind)
+
+    return ImportGraph(
+        project_dir=project_dir,
+        modules=file_to_module,
+        edges=graph,
+        external=external,
+        edge_kinds=edge_kinds,
+        edge_imports=edge_imports,
+    )
+
+
+class _FileImportsCache:
+    """
+    每個檔案的 import 清單, 以 (mtime_ns, size) 判斷是否需要重新解析.
+
+    只存模組名、相對 import 層級與執行時機 (建圖所需的最小資訊), 不存行號與原始敘述;
+    TYPE_CHECKING 守護下的 import 也一併記錄, 由建圖時的 kinds 決定是否收錄。
+    """
+
+    NAMESPACE = "file_imports"
+    VERSION = 2
+
+    def __init__(self, project_dir: str) -> None:
+        self._store = project_namespace(project_dir, self.NAMESPACE, self.VERSION)
+        self._data: dict[str, tuple] = self._store.items() or {}
+        self._updates: dict[str, tuple] = {}
+
+    def imports_for(self, file_path: str) -> tuple[list[tuple[str, str]], list[tuple[str, int, str]]]:
+        """([(絕對 import 模組名, kind)], [(相對 import 模組名, level, kind)])."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return [], []
+        cached = self._data.get(file_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2], cached[3]
+        imports, relative_imports = process_single_file(file_path, include_type_checking=True)
+        modules = [(imp["module"], imp["kind"]) for imp in imports]
+        relatives = [(imp["module"], imp["level"], imp["kind"]) for imp in relative_imports]
+        self._updates[file_path] = (st.st_mtime_ns, st.st_size, modules, relatives)
+        return modules, relatives
+
+    def flush(self, current_files: set[str]) -> None:
+        if current_files != self._data.keys():
+            # 有檔案刪除 / 新增: 整份重寫, 不保留已刪除檔案的項目
+            self._store.update({fp: self._updates.get(fp) or self._data[fp] for fp in current_files}, replace=True)
+        else:
+            self._store.update(self._updates)
+
+
+def load_import_graph(
+    project_dir: str,
+    src_dirs: list[str],
+    ignore_dirs: set[str] | None = None,
+    ignore_files: set[str] | None = None,
+    kinds: Collection[str] = RUNTIME_IMPORT_KINDS,
+) -> ImportGraph:
+    """
+    建立 import 圖, 未變動的檔案直接使用快取的 import 清單.
+
+    只對 mtime / size 改變的檔案重新解析; 全部未變動時成本約為走訪目錄 + 每個檔案一次 stat。
+
+    Args:
+        project_dir: 專案根目錄
+        src_dirs: 原始碼目錄 (PYTHONPATH)
+        ignore_dirs: 額外排除目錄, 與預設排除清單 (.venv、node_modules、build 等) 合併
+        ignore_files: 排除檔名
+        kinds: 收錄的 import 執行時機; 預設為 runtime 會執行的 import (不含 TYPE_CHECKING)
+
+    Returns:
+        ImportGraph
+    """
+    exclude = get_exclude_dirs_set() | frozenset(ignore_dirs or ())
+    python_files = [os.path.abspath(fp) for fp in walk_python_files(project_dir, exclude, frozenset(ignore_files or ()))]
+
+    cache = _FileImportsCache(project_dir)
+    all_imports: list[dict] = []
+    all_relative_imports: list[dict] = []
+    for fp in python_files:
+        modules, relatives = cache.imports_for(fp)
+        all_imports.extend({"file": fp, "module": module, "kind": kind} for module, kind in modules)
+        all_relative_imports.extend({"file": fp, "module": module, "level": level, "kind": kind} for module, level, kind in relatives)
+    cache.flush(set(python_files))
+
+    return build_import_graph(all_imports, all_relative_imports, project_dir, src_dirs, python_files, kinds=kinds)
+
+
+def transitive_importers(graph: ImportGraph, files: Iterable[str]) -> set[str]:
+    """
+    直接或間接 import 指定檔案的所有檔案 (反向 BFS, O(V + E)).
+
+    Args:
+        graph: import 圖
+        files: 變更的檔案 (相對或絕對路徑)
+
+    Returns:
+        受影響檔案的絕對路徑, 不含輸入檔案本身
+    """
+    importers = graph.importers
+    sources = {os.path.abspath(fp) for fp in files}
+    seen: set[str] = set()
+    queue = deque(fp for fp in sources if fp in importers)
+    while queue:
+        for importer in importers[queue.popleft()]:
+            if importer not in seen:
+                seen.add(importer)
+                queue.append(importer)
+    return seen - sources
+
+
+def file_level_edges(graph: ImportGraph) -> dict[str, set[str]]:
+    """檔案層級圖, 節點改為相對於專案根目錄的路徑 (以 / 分隔)."""
+
+    def rel(fp: str) -> str:
+        return os.path.relpath(fp, graph.project_dir).replace(os.sep, "/")
+
+    return {rel(src): {rel(target) for target in targets} for src, targets in graph.edges.items()}
+
+
+def _package_of(file_path: str, module: str) -> str:
+    """檔案所屬套件: __init__.py 即套件本身, 其餘取上一層; 頂層模組自成一個節點."""
+    if os.path.basename(file_path) == "__init__.py":
+        return module
+    return module.rpartition(".")[0] or module
+
+
+def package_level_edges(graph: ImportGraph) -> dict[str, set[str]]:
+    """套件層級圖: 節點為套件名, 套件內部的 import 不成邊."""
+    package = {fp: _package_of(fp, mod) for fp, mod in graph.modules.items()}
+    edges: dict[str, set[str]] = {pkg: set() for pkg in package.values()}
+    for src, targets in graph.edges.items():
+        src_pkg = package[src]
+        edges[src_pkg].update(package[target] for target in targets)
+        edges[src_pkg].discard(src_pkg)
+    return edges
+
+
+def strongly_connected_components(edges: dict[str, set[str]]) -> list[list[str]]:
+    """
+    強連通元件 (迭代式 Tarjan, O(V + E), 不受遞迴深度限制).
+
+    Returns:
+        元件列表, 依相依順序排列: 被 import 的元件一定排在 import 它的元件之前
+    """
+    index: dict[str, int] = {}
+    low: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    components: list[list[str]] = []
+
+    def visit(node: str) -> Iterator[str]:
+        index[node] = low[node] = len(index)
+        stack.append(node)
+        on_stack.add(node)
+        return iter(sorted(edges.get(node, ())))
+
+    for root in sorted(edges):
+        if root in index:
+            continue
+        work = [(root, visit(root))]
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    work.append((neighbor, visit(neighbor)))
+                    break
+                if neighbor in on_stack:
+                    low[node] = min(low[node], index[neighbor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+    return components
+
+
+def condensation(edges: dict[str, set[str]]) -> tuple[list[list[str]], dict[str, int], list[set[int]]]:
+    """
+    SCC 縮點後的 DAG.
+
+    Returns:
+        (元件列表 (相依順序), 節點 → 元件編號, 元件 → 它 import 的其他元件)
+    """
+    components = strongly_connected_components(edges)
+    component_of = {node: idx for idx, members in enumerate(components) for node in members}
+    dag: list[set[int]] = []
+    for idx, members in enumerate(components):
+        deps = {component_of[target] for node in members for target in edges.get(node, ())}
+        deps.discard(idx)
+        dag.append(deps)
+    return components, component_of, dag
+
+
+class ReachabilityIndex:
+    """
+    可達性索引: SCC 縮點 DAG 上的遞移閉包, 每個元件一個整數位元集合.
+
+    依相依順序建立 (被 import 的元件先完成), 之後每次「A 是否直接或間接 import B」查詢為一次整數 AND。
+    同一 SCC 內的節點互相可達; 節點一定可達自身。
+    """
+
+    def __init__(self, edges: dict[str, set[str]]) -> None:
+        _, self._component_of, dag = condensation(edges)
+        reach: list[int] = []
+        for idx, deps in enumerate(dag):
+            bits = 1 << idx
+            for dep in deps:
+                bits |= reach[dep]
+            reach.append(bits)
+        self._reach = reach
+
+    def bits_for(self, nodes: Iterable[str]) -> int:
+        """節點集合 → 所屬元件的位元集合 (作為查詢目標)."""
+        bits = 0
+        for node in nodes:
+            bits |= 1 << self._component_of[node]
+        return bits
+
+    def reach_bits(self, nodes: Iterable[str]) -> int:
+        """節點集合直接或間接 import 的所有元件 (含自身) 的聯集."""
+        bits = 0
+        for component in {self._component_of[node] for node in nodes}:
+            bits |= self._reach[component]
+        return bits
+
+
+def shortest_import_path(edges: dict[str, set[str]], sources: Iterable[str], targets: set[str]) -> list[str] | None:
+    """
+    從 sources 任一節點到 targets 任一節點的最短 import 路徑 (BFS).
+
+    Returns:
+        [source, ..., target]; 不可達時為 None
+    """
+    parent: dict[str, str | None] = {}
+    queue: deque[str] = deque()
+    for src in sorted(sources):
+        parent[src] = None
+        queue.append(src)
+    while queue:
+        node = queue.popleft()
+        for neighbor in sorted(edges.get(node, ())):
+            if neighbor in parent:
+                continue
+            parent[neighbor] = node
+            if neighbor in targets:
+                path = [neighbor]
+                while (prev := parent[path[-1]]) is not None:
+                    path.append(prev)
+                return path[::-1]
+            queue.append(neighbor)
+    return None
+
+
+def _unit_weight(_source: str, _target: str) -> int:
+    return 1
+
+
+def _insert_acyclic(
+    succ: dict[str, set[str]],
+    pred: dict[str, set[str]],
+    order: dict[str, int],
+    source: str,
+    target: str,
+) -> bool:
+    """
+    在 DAG 加入 source → target, 會形成循環時不加入 (Pearce-Kelly 動態拓撲排序).
+
+    order 為目前的拓撲順序; 只搜尋順序介於 target 與 source 之間的節點, 加入後就地調整 order。
+
+    Returns:
+        是否已加入
+    """
+    lower, upper = order[target], order[source]
+    if lower > upper:
+        succ[source].add(target)
+        pred[target].add(source)
+        return True
+
+    forward = {target}
+    stack = [target]
+    while stack:
+        for neighbor in succ[stack.pop()]:
+            if neighbor == source:
+                return False
+            if neighbor not in forward and order[neighbor] < upper:
+                forward.add(neighbor)
+                stack.append(neighbor)
+    backward = {source}
+    stack = [source]
+    while stack:
+        for neighbor in pred[stack.pop()]:
+            if neighbor not in backward and order[neighbor] > lower:
+                backward.add(neighbor)
+                stack.append(neighbor)
+
+    # 受影響節點重新分配原本佔用的位置: 先 backward (含 source) 再 forward (含 target)
+    affected = sorted(backward, key=order.__getitem__) + sorted(forward, key=order.__getitem__)
+    order.update(zip(affected, sorted(order[node] for node in affected), strict=True))
+    succ[source].add(target)
+    pred[target].add(source)
+    return True
+
+
+def _eades_order(members: list[str], succ: dict[str, set[str]], weight: Callable[[str, str], int]) -> list[str]:
+    """
+    Eades-Lin-Smyth 啟發式排序 (加權版, O(E log V)).
+
+    反覆移除 sink (排到最後) 與 source (排到最前); 兩者皆無時取 (出邊權重 - 入邊權重) 最大的節點排到前面,
+    同分時取入邊權重較小者 (它的入邊會成為回饋邊)。排序後指向前方的邊即為回饋邊。
+    """
+    pred: dict[str, set[str]] = {node: set() for node in members}
+    for node in members:
+        for target in succ[node]:
+            pred[target].add(node)
+    out_deg = {node: len(succ[node]) for node in members}
+    in_deg = {node: len(pred[node]) for node in members}
+    in_weight = {node: sum(weight(p, node) for p in pred[node]) for node in members}
+    delta = {node: sum(weight(node, t) for t in succ[node]) - in_weight[node] for node in members}
+
+    removed: set[str] = set()
+    head: list[str] = []
+    tail: list[str] = []
+    sinks = [node for node in reversed(members) if out_deg[node] == 0]
+    sources = [node for node in reversed(members) if in_deg[node] == 0]
+    # 延遲刪除的 max-heap: delta 變動時推入新項目, 取出時略過過期項目
+    heap = [(-delta[node], in_weight[node], node) for node in members]
+    heapq.heapify(heap)
+
+    def remove(node: str) -> None:
+        removed.add(node)
+        for target in succ[node]:
+            if target not in removed:
+                in_deg[target] -= 1
+                in_weight[target] -= weight(node, target)
+                delta[target] += weight(node, target)
+                heapq.heappush(heap, (-delta[target], in_weight[target], target))
+                if in_deg[target] == 0:
+                    sources.append(target)
+        for source in pred[node]:
+            if source not in removed:
+                out_deg[source] -= 1
+                delta[source] -= weight(source, node)
+                heapq.heappush(heap, (-delta[source], in_weight[source], source))
+                if out_deg[source] == 0:
+                    sinks.append(source)
+
+    while len(removed) < len(members):
+        if sinks:
+            node = sinks.pop()
+            if node not in removed:
+                tail.append(node)
+                remove(node)
+        elif sources:
+            node = sources.pop()
+            if node not in removed:
+                head.append(node)
+                remove(node)
+        else:
+            neg_delta, node_in_weight, node = heapq.heappop(heap)
+            if node not in removed and -neg_delta == delta[node] and node_in_weight == in_weight[node]:
+                head.append(node)
+                remove(node)
+    return head + tail[::-1]
+
+
+def feedback_edges(
+    edges: dict[str, set[str]],
+    weight: Callable[[str, str], int] | None = None,
+) -> list[tuple[list[str], list[tuple[str, str]]]]:
+    """
+    每個強連通元件的近似最小加權回饋邊集: 移除這些邊後整張圖無循環.
+
+    先以 Eades-Lin-Smyth 排序取得回饋邊, 再依權重由大到小嘗試放回不會造成循環的邊,
+    結果中每條邊都是必要的 (放回任一條都會重新形成循環)。自我引用不計。
+
+    Args:
+        edges: 檔案 → import 的檔案
+        weight: 邊的權重 (例如構成該邊的 import 敘述數); None 時每條邊權重為 1
+
+    Returns:
+        [(元件成員, 回饋邊列表)], 只包含有循環的元件, 依相依順序排列
+    """
+    weight = weight or _unit_weight
+    results = []
+    for members in strongly_connected_components(edges):
+        if len(members) < 2:
+            continue
+        member_set = set(members)
+        succ = {node: {t for t in edges.get(node, ()) if t in member_set and t != node} for node in members}
+        position = {node: i for i, node in enumerate(_eades_order(members, succ, weight))}
+
+        # 順向邊構成 DAG (position 即其拓撲順序); 逆向邊為候選回饋邊, 權重大的優先嘗試放回
+        backward = sorted(
+            ((node, target) for node in members for target in succ[node] if position[target] < position[node]),
+            key=lambda e: (-weight(*e), e),
+        )
+        for node, target in backward:
+            succ[node].discard(target)
+        pred: dict[str, set[str]] = {node: set() for node in members}
+        for node in members:
+            for target in succ[node]:
+                pred[target].add(node)
+        removed = [(node, target) for node, target in backward if not _insert_acyclic(succ, pred, position, node, target)]
+        results.append((members, sorted(removed)))
+    return results
+
+
+@dataclass
+class NodeMetrics:
+    """圖匯出附帶的節點指標."""
+
+    fan_in: int
+    fan_out: int
+    scc: int  # 強連通元件編號; 同一循環內的節點共用
+    scc_size: int
+    layer: int  # 拓撲層: 不 import 任何本地節點為 0, 其餘為相依節點最大層 + 1 (同一 SCC 同層)
+    transitive_size: int  # 直接或間接 import 的本地節點數 (不含自身)
+
+
+def compute_metrics(edges: dict[str, set[str]]) -> dict[str, NodeMetrics]:
+    """
+    計算每個節點的指標.
+
+    遞移 import 數以 SCC 縮點 DAG 上的位元集合聯集計算: 每個節點佔一個 bit (同一 SCC 的 bit 相鄰),
+    依相依順序將相依元件的位元集合 OR 起來, 成本為 O(V + E) 次大整數 OR (每次 O(V / 64) 個 word)。
+    位元集合在最後一個依賴它的元件處理完後立即釋放, 以壓低尖峰記憶體。
+
+    Args:
+        edges: 鄰接表 (所有 import 目標也必須是 key)
+
+    Returns:
+        {節點: NodeMetrics}
+    """
+    components, component_of, dag = condensation(edges)
+    fan_in = dict.fromkeys(edges, 0)
+    for targets in edges.values():
+        for target in targets:
+            fan_in[target] += 1
+
+    pending = [0] * len(components)
+    for deps in dag:
+        for dep in deps:
+            pending[dep] += 1
+
+    layers: list[int] = []
+    sizes: list[int] = []
+    reach: dict[int, int] = {}
+    offset = 0
+    for idx, members in enumerate(components):
+        bits = ((1 << len(members)) - 1) << offset
+        offset += len(members)
+        layer = 0
+        for dep in dag[idx]:
+            bits |= reach[dep]
+            layer = max(layer, layers[dep] + 1)
+            pending[dep] -= 1
+            if not pending[dep]:
+                del reach[dep]
+        layers.append(layer)
+        sizes.append(bits.bit_count() - 1)
+        if pending[idx]:
+            reach[idx] = bits
+
+    return {
+        node: NodeMetrics(
+            fan_in=fan_in[node],
+            fan_out=len(edges[node]),
+            scc=component_of[node],
+            scc_size=len(components[component_of[node]]),
+            layer=layers[component_of[node]],
+            transitive_size=sizes[component_of[node]],
+        )
+        for node in edges
+    }
+
+
+GRAPH_FORMATS = ("json", "dot", "graphml")
+
+
+def _iter_json(edges: dict[str, set[str]], metrics: dict[str, NodeMetrics], level: str) -> Iterator[str]:
+    yield f'{{"level": {json.dumps(level)}, "nodes": ['
+    for i, node in enumerate(sorted(edges)):
+        yield ("," if i else "") + "\n  " + json.dumps({"id": node, **asdict(metrics[node])}, ensure_ascii=False)
+    yield '\n], "edges": ['
+    first = True
+    for src in sorted(edges):
+        for target in sorted(edges[src]):
+            yield ("\n  " if first else ",\n  ") + json.dumps([src, target], ensure_ascii=False)
+            first = False
+    yield "\n]}\n"
+
+
+def _iter_dot(edges: dict[str, set[str]], metrics: dict[str, NodeMetrics], level: str) -> Iterator[str]:
+    # DOT 的字串跳脫規則 (\" 與 \\) 與 JSON 相容
+    yield f"digraph {json.dumps(level + '_imports')} {{\n"
+    for node in sorted(edges):
+        attrs = ", ".join(f"{key}={value}" for key, value in asdict(metrics[node]).items())
+        yield f"  {json.dumps(node, ensure_ascii=False)} [{attrs}];\n"
+    for src in sorted(edges):
+        for target in sorted(edges[src]):
+            yield f"  {json.dumps(src, ensure_ascii=False)} -> {json.dumps(target, ensure_ascii=False)};\n"
+    yield "}\n"
+
+
+def _iter_graphml(edges: dict[str, set[str]], metrics: dict[str, NodeMetrics], level: str) -> Iterator[str]:
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+    metric_names = [f.name for f in fields(NodeMetrics)]
+    for name in metric_names:
+        yield f'  <key id="{name}" for="node" attr.name="{name}" attr.type="int"/>\n'
+    yield f'  <graph id={quoteattr(level)} edgedefault="directed">\n'
+    for node in sorted(edges):
+        data = "".join(f'<data key="{key}">{value}</data>' for key, value in asdict(metrics[node]).items())
+        yield f"    <node id={quoteattr(node)}>{data}</node>\n"
+    for src in sorted(edges):
+        for target in sorted(edges[src]):
+            yield f"    <edge source={quoteattr(src)} target={quoteattr(target)}/>\n"
+    yield "  </graph>\n</graphml>\n"
+
+
+_EXPORTERS = {"json": _iter_json, "dot": _iter_dot, "graphml": _iter_graphml}
+
+
+def iter_export(edges: dict[str, set[str]], fmt: str, level: str = "file") -> Iterator[str]:
+    """
+    串流輸出圖與節點指標.
+
+    Args:
+        edges: 鄰接表 (file_level_edges / package_level_edges)
+        fmt: GRAPH_FORMATS 之一
+        level: 圖的層級名稱, 寫入輸出供辨識
+
+    Yields:
+        輸出片段, 依序寫入即為完整文件
+    """
+    return _EXPORTERS[fmt](edges, compute_metrics(edges), level)
+
+
+def is_test_file(file_path: str) -> bool:
+    """測試檔判定: pytest 預設命名 (test_*.py / *_test.py)."""
+    name = os.path.basename(file_path)
+    return name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
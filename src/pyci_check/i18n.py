@@ -123,3 +123,45 @@ def t(key: str, *args, **kwargs) -> str:
             return text
 
     return text
+
+
+class Message:
+    """
+    延遲翻譯的訊息: 只記錄翻譯鍵與參數, 輸出時才呼叫 t().
+
+    檢查階段產生 Message 而非翻譯後字串: 熱迴圈不做字串格式化, 快取內容也與語言無關
+    (以 to_json() 儲存 [key, *args])。str() / format() 時才依當前語言渲染。
+    """
+
+    __slots__ = ("args", "key")
+
+    def __init__(self, key: str, *args: object) -> None:
+        self.key = key
+        self.args = args
+
+    def __str__(self) -> str:
+        return t(self.key, *self.args)
+
+    def __repr__(self) -> str:
+        return f"Message({self.key!r}{''.join(f', {a!r}' for a in self.args)})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Message):
+            return NotImplemented
+        return self.key == other.key and self.args == other.args
+
+    def __hash__(self) -> int:
+        return hash((self.key, self.args))
+
+    def to_json(self) -> list:
+        """
+        轉為可 JSON 序列化的 [key, *args].
+
+        非 str / int / float 的參數 (例如 exception) 先轉為字串: 其 {} 格式化結果相同。
+        """
+        return [self.key, *(a if isinstance(a, (str, int, float)) else str(a) for a in self.args)]
+
+    @classmethod
+    def from_json(cls, data: list) -> "Message":
+        """由 to_json() 的結果還原."""
+        return cls(data[0], *data[1:])
@@ -12,21 +12,36 @@ import argparse
 import ast
 import contextlib
 import hashlib
-import json
 import os
 import re
 import runpy
 import subprocess
 import sys
+import threading
 import time
 import tomllib
 from argparse import Namespace
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from functools import lru_cache
-
-from pyci_check.i18n import t
-from pyci_check.utils import calculate_optimal_workers, get_exclude_dirs_set, safe_relpath, should_use_thread_pool, walk_python_files
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import chain
+
+from pyci_check.cache import ContentCache, cache_dir_for, parse_size, project_namespace
+from pyci_check.i18n import Message, t
+from pyci_check.utils import (
+    IS_FREE_THREADED,
+    calculate_execute_workers,
+    calculate_optimal_workers,
+    compute_once,
+    get_exclude_dirs_set,
+    iter_python_files,
+    map_chunks,
+    safe_relpath,
+    should_use_thread_pool,
+    walk_python_files,
+)
 
 # 效能優化: 預先定義常數避免重複創建
 SENSITIVE_ENV_PREFIXES = frozenset({"AWS", "SECRET", "TOKEN", "KEY", "PASSWORD"})
@@ -36,6 +51,7 @@ SENSITIVE_ENV_PREFIXES = frozenset({"AWS", "SECRET", "TOKEN", "KEY", "PASSWORD"}
 MODULE_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)*$")
 
 # 一次性 subprocess import 檢查腳本; sys.exit(0) 在 try 外面避免被 BaseException 捕到
+# 成功後於 stdout 以 marker 行回報 peak RSS (KB) 供排程估算並行數, Windows 無 resource 模組則不回報
 IMPORT_CHECK_SCRIPT = """
 import sys
 sys.dont_write_bytecode = True
@@ -45,9 +61,58 @@ except BaseException as e:
     # 含 SystemExit/KeyboardInterrupt: 模組 top-level 觸發 sys.exit 視為失敗
     print(str(e) or type(e).__name__, file=sys.stderr)
     sys.exit(1)
+try:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+except Exception:
+    pass
+else:
+    # macOS 單位是 bytes, Linux 是 KB
+    print('{marker}', rss // 1024 if sys.platform == 'darwin' else rss)
 sys.exit(0)
 """
 
+# -X importtime 量測版: marker 之前的 startup import (encodings/site/resource) 不計入;
+# 成功後於 stdout 回報 peak RSS (KB), Windows 無 resource 模組則不回報
+IMPORT_PROFILE_MARKER = "__pyci_check_profile__"
+IMPORT_PROFILE_SCRIPT = """
+import sys
+sys.dont_write_bytecode = True
+try:
+    import resource
+except ImportError:
+    resource = None
+sys.stderr.write('{marker}\\n')
+try:
+    __import__('{module}')
+except BaseException as e:
+    print(str(e) or type(e).__name__, file=sys.stderr)
+    sys.exit(1)
+if resource is not None:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 單位是 bytes, Linux 是 KB
+    print('{marker}', rss // 1024 if sys.platform == 'darwin' else rss)
+sys.exit(0)
+"""
+
+# "import time:       123 |        456 |   pkg.sub"; "| " 之後每層巢狀縮排 2 格 (header 行不吃數字會被略過)
+IMPORTTIME_LINE_PATTERN = re.compile(r"^import time:\s*(\d+) \|\s*(\d+) \|( *)(\S+)\s*$")
+
+
+@dataclass
+class ImportProfile:
+    """單一模組在乾淨 interpreter 內 import 的耗時與記憶體量測."""
+
+    module: str
+    total_us: int  # 被測模組所有 top-level import 的 cumulative 總和
+    peak_rss_kb: int | None
+    # (imported package, self us, cumulative us, 巢狀深度)
+    imports: list[tuple[str, int, int, int]] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_us / 1000
+
 
 class _FindSpecCache:
     """
@@ -57,22 +122,16 @@ class _FindSpecCache:
     pip install / venv 變更 → 簽名改變 → cache 自動失效
     """
 
-    FILENAME = "find_spec.json"
-    VERSION = 2
+    NAMESPACE = "find_spec"
+    VERSION = 3
 
     def __init__(self, project_dir: str | None, sys_path: list[str]) -> None:
         self.disabled = project_dir is None
-        if self.disabled:
-            self.signature = ""
-            self.cache_file = ""
-        else:
-            self.cache_dir = os.path.join(project_dir, ".pyci-check-cache")
-            self.cache_file = os.path.join(self.cache_dir, self.FILENAME)
-            self.signature = self._compute_signature(sys_path)
-        self._data: dict[str, bool | str] = {}  # module -> True (found) / error_msg (missing)
-        self._dirty = False
-        if not self.disabled:
-            self._load()
+        self.signature = "" if self.disabled else self._compute_signature(sys_path)
+        # module -> True (found) / [翻譯鍵, *參數] (missing); 不存翻譯後字串, 切換語言不需失效
+        # 讀取逐鍵查詢資料庫 (各 thread 各自連線); 新結果只由主 thread 寫入 _updates, flush 時一次寫入
+        self._store = project_namespace(project_dir, self.NAMESPACE, self.VERSION, self.signature)
+        self._updates: dict[str, bool | list] = {}
 
     @staticmethod
     def _compute_signature(sys_path: list[str]) -> str:
@@ -85,38 +144,73 @@ class _FindSpecCache:
                 parts.append(f"{p}=missing")
         return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
 
-    def _load(self) -> None:
-        try:
-            with open(self.cache_file, encoding="utf-8") as f:
-                data = json.load(f)
-        except (OSError, ValueError):
-            return
-        if data.get("version") == self.VERSION and data.get("signature") == self.signature:
-            self._data = data.get("results", {})
-
-    def get(self, module: str) -> tuple[bool, str | None] | None:
-        """None = miss, (True, None) = 已找到, (False, msg) = 找不到."""
-        v = self._data.get(module)
+    def get(self, module: str) -> tuple[bool, Message | None] | None:
+        """None = miss, (True, None) = 已找到, (False, msg) = 找不到 (不含本次尚未 flush 的結果)."""
+        v = self._store.get(module)
         if v is None:
             return None
         if v is True:
             return (True, None)
-        return (False, str(v))
+        if isinstance(v, list) and v:
+            return (False, Message.from_json(v))
+        return (False, Message("imports.error.module_not_found", module))
 
-    def set(self, module: str, error: str | None) -> None:
-        self._data[module] = True if error is None else error
-        self._dirty = True
+    def set(self, module: str, error: Message | None) -> None:
+        self._updates[module] = True if error is None else error.to_json()
 
     def flush(self) -> None:
-        if self.disabled or not self._dirty:
-            return
-        try:
-            os.makedirs(self.cache_dir, exist_ok=True)
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump({"version": self.VERSION, "signature": self.signature, "results": self._data}, f)
-        except OSError:
-            # 寫入失敗不影響檢查結果
-            pass
+        # 沒有新結果也要送出: 更新命中統計與存取時間
+        self._store.update(self._updates)
+        self._updates = {}
+
+    def close(self) -> None:
+        """關閉各 thread 查詢時開啟的連線."""
+        self._store.close()
+
+
+class _ImportTimingCache:
+    """
+    execute 模式各模組的歷史 import 耗時 / peak RSS.
+
+    用途: 排程時最久的模組先跑 (LPT), 並以歷史 peak RSS 估算記憶體可承受的並行數。
+    與 sys.path 簽名無關: 環境變動後舊數據仍是合理的估計值, 以平均值逐步修正。
+    """
+
+    NAMESPACE = "import_timings"
+    VERSION = 1
+
+    def __init__(self, project_dir: str | None) -> None:
+        self.disabled = project_dir is None
+        self._store = project_namespace(project_dir, self.NAMESPACE, self.VERSION)
+        # module -> {"ms": 平均耗時, "rss_kb": 最近一次 peak RSS}; 排序需要全部資料, 一次讀入
+        self._data: dict[str, dict[str, float]] = {} if self.disabled else (self._store.items() or {})
+        self._dirty: set[str] = set()
+
+    def order_longest_first(self, modules: list[str]) -> list[str]:
+        """依歷史耗時由長到短排序; 未量測過的模組以已知中位數估計."""
+        known = sorted(entry["ms"] for entry in self._data.values())
+        default = known[len(known) // 2] if known else 0.0
+        return sorted(modules, key=lambda m: self._data.get(m, {}).get("ms", default), reverse=True)
+
+    def peak_rss_kb(self) -> int | None:
+        """歷史上最大的單一 import subprocess peak RSS."""
+        rss = [int(entry["rss_kb"]) for entry in self._data.values() if entry.get("rss_kb")]
+        return max(rss) if rss else None
+
+    def record(self, module: str, elapsed_ms: float, rss_kb: int | None = None) -> None:
+        previous = self._data.get(module)
+        entry = {"ms": elapsed_ms if previous is None else (previous["ms"] + elapsed_ms) / 2}
+        if rss_kb is not None:
+            entry["rss_kb"] = rss_kb
+        elif previous and previous.get("rss_kb"):
+            entry["rss_kb"] = previous["rss_kb"]
+        self._data[module] = entry
+        self._dirty.add(module)
+
+    def flush(self) -> None:
+        # 只寫入本次量測的模組: 並行的其他行程寫入的項目不會被覆蓋
+        self._store.update({module: self._data[module] for module in self._dirty})
+        self._dirty.clear()
 
 
 @lru_cache(maxsize=1)
@@ -154,18 +248,43 @@ def get_ruff_config_from_pyproject(project_dir: str) -> dict:
     - [tool.ruff].extend-exclude
 
     Returns:
-        dict with keys: src, exclude_dirs, exclude_files
+        dict with keys: src, exclude_dirs, exclude_files, check_test_purity, import_budget_ms, import_deadline,
+        compile, pyc_prefix, pyc_invalidation, target_version, lazy_import_min_size
     """
     pyproject_path = find_pyproject_toml(project_dir)
     if not pyproject_path:
-        return {"src": [], "exclude_dirs": [], "exclude_files": [], "check_test_purity": False}
+        return {
+            "src": [],
+            "exclude_dirs": [],
+            "exclude_files": [],
+            "check_test_purity": False,
+            "import_budget_ms": None,
+            "import_deadline": None,
+            "compile": False,
+            "pyc_prefix": None,
+            "pyc_invalidation": None,
+            "target_version": None,
+            "lazy_import_min_size": None,
+        }
 
     try:
         with open(pyproject_path, "rb") as f:
             data = tomllib.load(f)
     except (OSError, tomllib.TOMLDecodeError):
         # 檔案讀取失敗或 TOML 格式錯誤,使用預設設定
-        return {"src": [], "exclude_dirs": [], "exclude_files": [], "check_test_purity": False}
+        return {
+            "src": [],
+            "exclude_dirs": [],
+            "exclude_files": [],
+            "check_test_purity": False,
+            "import_budget_ms": None,
+            "import_deadline": None,
+            "compile": False,
+            "pyc_prefix": None,
+            "pyc_invalidation": None,
+            "target_version": None,
+            "lazy_import_min_size": None,
+        }
 
     ruff = data.get("tool", {}).get("ruff", {})
     pyci_check = data.get("tool", {}).get("pyci-check", {})
@@ -212,7 +331,68 @@ def get_ruff_config_from_pyproject(project_dir: str) -> dict:
 
     check_test_purity = pyci_check.get("check-test-purity", False)
 
-    return {"src": src, "exclude_dirs": exclude_dirs, "exclude_files": exclude_files, "check_test_purity": check_test_purity}
+    # execute 模式 import 耗時預算 (ms), 超過者列為警告
+    import_budget_ms = pyci_check.get("import-budget-ms")
+    if not isinstance(import_budget_ms, (int, float)) or isinstance(import_budget_ms, bool):
+        import_budget_ms = None
+
+    # execute 模式整個 import 階段的 wall-clock 預算 (秒)
+    import_deadline = pyci_check.get("import-deadline")
+    if not isinstance(import_deadline, (int, float)) or isinstance(import_deadline, bool):
+        import_deadline = None
+
+    # syntax 編譯模式: 編譯為 bytecode 並寫入 pyc 快取
+    compile_mode = pyci_check.get("compile", False) is True
+    pyc_prefix = pyci_check.get("pyc-prefix")
+    if not isinstance(pyc_prefix, str) or not pyc_prefix:
+        pyc_prefix = None
+    else:
+        # 相對路徑以 pyproject.toml 所在目錄為準, 不隨執行時的 cwd 改變
+        pyc_prefix = os.path.join(os.path.dirname(os.path.abspath(pyproject_path)), pyc_prefix)
+    pyc_invalidation = pyci_check.get("pyc-invalidation")
+    if pyc_invalidation not in {"timestamp", "checked-hash", "unchecked-hash"}:
+        pyc_invalidation = None
+
+    # 語法檢查的目標 Python 版本: [tool.pyci-check] 優先 (可為列表, 取最低者), 否則沿用 ruff
+    target_version = _parse_target_version(pyci_check.get("target-version", ruff.get("target-version")))
+
+    # lazy-imports: 估計 import 成本低於此值的候選不列出
+    lazy_import_min_size = None
+    with contextlib.suppress(ValueError, TypeError):
+        lazy_import_min_size = parse_size(pyci_check["lazy-import-min-size"]) if "lazy-import-min-size" in pyci_check else None
+
+    return {
+        "src": src,
+        "exclude_dirs": exclude_dirs,
+        "exclude_files": exclude_files,
+        "check_test_purity": check_test_purity,
+        "import_budget_ms": import_budget_ms,
+        "import_deadline": import_deadline,
+        "compile": compile_mode,
+        "pyc_prefix": pyc_prefix,
+        "pyc_invalidation": pyc_invalidation,
+        "target_version": target_version,
+        "lazy_import_min_size": lazy_import_min_size,
+    }
+
+
+def _parse_target_version(value: object) -> tuple[int, int] | None:
+    """
+    解析 ruff 風格的 target-version ("py311" → (3, 11)).
+
+    Args:
+        value: 單一字串或字串列表 (多目標時取最低版本: 最低版本可解析者, 較高版本必定可解析)
+
+    Returns:
+        (major, minor) 或 None (未設定 / 格式不符)
+    """
+    values = value if isinstance(value, list) else [value]
+    versions = []
+    for item in values:
+        match = re.fullmatch(r"py(\d)(\d+)", item) if isinstance(item, str) else None
+        if match:
+            versions.append((int(match.group(1)), int(match.group(2))))
+    return min(versions) if versions else None
 
 
 @lru_cache(maxsize=1)
@@ -244,6 +424,15 @@ def get_venv_from_pyproject(project_dir: str) -> str | None:
     return None
 
 
+# import 的執行時機標記 (ImportVisitor 的 "kind"):
+# - module: 模組層級 (含 class body / if / with 等), import 時執行
+# - optional: import 時執行, 但包在 try/except ImportError 中
+# - function: 函數 body 內, 呼叫時才執行
+# - type_checking: if TYPE_CHECKING 守護下, runtime 不執行
+IMPORT_KINDS = ("module", "optional", "function", "type_checking")
+IMPORT_TIME_KINDS = frozenset({"module", "optional"})
+RUNTIME_IMPORT_KINDS = frozenset({"module", "optional", "function"})
+
 _OPTIONAL_IMPORT_EXC_NAMES = frozenset({"ImportError", "ModuleNotFoundError", "Exception", "BaseException"})
 
 
@@ -290,8 +479,14 @@ def _handle_import_from(visitor: "ImportVisitor", stmt: ast.ImportFrom) -> None:
 
 
 def _handle_if(visitor: "ImportVisitor", stmt: ast.If) -> None:
-    """If 特別處理: TYPE_CHECKING 守護下 body runtime 不執行，只走 orelse."""
+    """If 特別處理: TYPE_CHECKING 守護下 body runtime 不執行，只走 orelse (include_type_checking 時標記後收集)."""
     if _is_type_checking_guard(stmt.test):
+        if visitor.include_type_checking:
+            visitor._type_checking_depth += 1
+            try:
+                visitor._walk(stmt.body)
+            finally:
+                visitor._type_checking_depth -= 1
         visitor._walk(stmt.orelse)
     else:
         visitor._walk(stmt.body)
@@ -303,10 +498,19 @@ def _handle_body_orelse(visitor: "ImportVisitor", stmt: ast.While | ast.For | as
     visitor._walk(stmt.orelse)
 
 
-def _handle_body_only(visitor: "ImportVisitor", stmt: ast.With | ast.AsyncWith | ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef) -> None:
+def _handle_body_only(visitor: "ImportVisitor", stmt: ast.With | ast.AsyncWith | ast.ClassDef) -> None:
     visitor._walk(stmt.body)
 
 
+def _handle_function(visitor: "ImportVisitor", stmt: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+    """函數 body 內的 import 在呼叫時才執行, 標記為 function."""
+    visitor._function_depth += 1
+    try:
+        visitor._walk(stmt.body)
+    finally:
+        visitor._function_depth -= 1
+
+
 def _handle_try(visitor: "ImportVisitor", stmt: ast.Try | ast.TryStar) -> None:
     """Try 特別處理: 若任一 handler 抓 ImportError，try.body 內的 import 標 optional."""
     catches_import = any(_handler_catches_import_error(h) for h in stmt.handlers)
@@ -340,8 +544,8 @@ _DISPATCH: dict[type, "callable"] = {
     ast.AsyncFor: _handle_body_orelse,
     ast.With: _handle_body_only,
     ast.AsyncWith: _handle_body_only,
-    ast.FunctionDef: _handle_body_only,
-    ast.AsyncFunctionDef: _handle_body_only,
+    ast.FunctionDef: _handle_function,
+    ast.AsyncFunctionDef: _handle_function,
     ast.ClassDef: _handle_body_only,
     ast.Try: _handle_try,
     ast.TryStar: _handle_try,
@@ -352,12 +556,26 @@ _DISPATCH: dict[type, "callable"] = {
 class ImportVisitor:
     """提取 import 語句，只下鑽 statement 容器，不訪問 expression."""
 
-    def __init__(self, filepath: str) -> None:
+    def __init__(self, filepath: str, include_type_checking: bool = False) -> None:
         self.filepath = filepath
         self.imports: list[dict] = []
         self.relative_imports: list[dict] = []
+        # 預設不收集 TYPE_CHECKING 守護下的 import (runtime 不執行, 不需檢查是否存在)
+        self.include_type_checking = include_type_checking
         # try/except ImportError 嵌套深度: > 0 表示當前 import 是 optional dep
         self._optional_depth = 0
+        self._function_depth = 0
+        self._type_checking_depth = 0
+
+    def _kind(self) -> str:
+        """目前位置的 import 執行時機 (IMPORT_KINDS), 優先序 type_checking > function > optional > module."""
+        if self._type_checking_depth:
+            return "type_checking"
+        if self._function_depth:
+            return "function"
+        if self._optional_depth:
+            return "optional"
+        return "module"
 
     def _create_import_info(self, module: str, line: int, statement: str, import_type: str) -> dict:
         return {
@@ -367,6 +585,7 @@ class ImportVisitor:
             "file": self.filepath,
             "type": import_type,
             "optional": self._optional_depth > 0,
+            "kind": self._kind(),
         }
 
     def visit(self, tree: ast.Module) -> None:
@@ -381,11 +600,11 @@ class ImportVisitor:
                 handler(self, stmt)
 
 
-def extract_imports_from_code(code: str, filepath: str) -> tuple[list[dict], list[dict]]:
-    """提取程式碼中的 import 語句，並記錄位置資訊."""
+def extract_imports_from_code(code: str, filepath: str, include_type_checking: bool = False) -> tuple[list[dict], list[dict]]:
+    """提取程式碼中的 import 語句，並記錄位置資訊 (include_type_checking: 一併收集 TYPE_CHECKING 守護下的 import)."""
     try:
         tree = ast.parse(code)
-        visitor = ImportVisitor(filepath)
+        visitor = ImportVisitor(filepath, include_type_checking)
         visitor.visit(tree)
         return visitor.imports, visitor.relative_imports
     except SyntaxError:
@@ -420,10 +639,24 @@ def read_file_with_encoding(filepath: str) -> str | None:
         return None
 
 
-def process_single_file(filepath: str) -> tuple[list[dict], list[dict]]:
+def _decode_source(data: bytes) -> str | None:
+    """與 read_file_with_encoding 相同的編碼降級順序, 用於已讀入的 bytes."""
+    for encoding in ("utf-8", "utf-8-sig", "latin-1"):
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def process_single_file(filepath: str, include_type_checking: bool = False) -> tuple[list[dict], list[dict]]:
     """
     處理單一檔案的 import.
 
+    Args:
+        filepath: 檔案路徑
+        include_type_checking: 一併收集 TYPE_CHECKING 守護下的 import (kind 為 type_checking)
+
     Returns:
         (imports列表, relative_imports列表)
         如果檔案讀取失敗或無法解析,回傳空列表
@@ -434,7 +667,47 @@ def process_single_file(filepath: str) -> tuple[list[dict], list[dict]]:
         # 靜默跳過,不中斷整體檢查
         return [], []
 
-    return extract_imports_from_code(code, filepath)
+    return extract_imports_from_code(code, filepath, include_type_checking)
+
+
+# 內容快取中 import 紀錄的欄位格式; 欄位變動時更改, 舊快取自動失效
+_IMPORT_RECORD_FORMAT = "kind"
+
+
+def _process_file_cached(filepath: str, content_cache: ContentCache) -> tuple[list[dict], list[dict]]:
+    """
+    process_single_file + 內容快取: 內容相同的檔案 (不論路徑 / 分支 / checkout) 不重新解析.
+
+    快取的結果不含 "file", 命中後補上目前路徑。
+    """
+    if content_cache.disabled:
+        return process_single_file(filepath)
+    try:
+        with open(filepath, "rb") as f:
+            data = f.read()
+    except OSError:
+        return [], []
+
+    key = content_cache.key_for(data)
+    cached = content_cache.get(key)
+    if cached is not None:
+        imports, relative_imports = cached
+        for info in (*imports, *relative_imports):
+            info["file"] = filepath
+        return imports, relative_imports
+
+    code = _decode_source(data)
+    if code is None:
+        return [], []
+    imports, relative_imports = extract_imports_from_code(code, filepath)
+    content_cache.put(
+        key,
+        (
+            [{k: v for k, v in info.items() if k != "file"} for info in imports],
+            [{k: v for k, v in info.items() if k != "file"} for info in relative_imports],
+        ),
+    )
+    return imports, relative_imports
 
 
 def extract_from_all_files(
@@ -456,25 +729,34 @@ def extract_from_all_files(
     if not python_files:
         return [], []
 
-    max_workers = max_workers or calculate_optimal_workers(len(python_files))
+    cache_dir = cache_dir_for(project_dir)
+    if not should_use_thread_pool(len(python_files), work_kind="cpu"):
+        return _process_files_chunk(python_files, cache_dir)
 
+    max_workers = max_workers or calculate_optimal_workers(len(python_files), work_kind="cpu")
     all_imports: list[dict] = []
     all_relative_imports: list[dict] = []
+    # 每個區塊在自己的 thread 內累積, 最後由主 thread 依檔案順序合併
+    for imports, relative_imports in map_chunks(partial(_process_files_chunk, cache_dir=cache_dir), python_files, max_workers):
+        all_imports.extend(imports)
+        all_relative_imports.extend(relative_imports)
+    return all_imports, all_relative_imports
 
-    if should_use_thread_pool(len(python_files), work_kind="cpu"):
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(process_single_file, fp): fp for fp in python_files}
-            for future in as_completed(futures):
-                imports, relative_imports = future.result()
-                all_imports.extend(imports)
-                all_relative_imports.extend(relative_imports)
-    else:
-        for file_path in python_files:
-            imports, relative_imports = process_single_file(file_path)
-            all_imports.extend(imports)
-            all_relative_imports.extend(relative_imports)
 
-    return all_imports, all_relative_imports
+def _process_files_chunk(file_paths: Sequence[str], cache_dir: str | None = None) -> tuple[list[dict], list[dict]]:
+    """
+    處理一個區塊的檔案, 結果累積在此 thread 私有的 list.
+
+    cache_dir 為字串 (可傳入 subinterpreter); 每個區塊各自開啟內容快取, 結束時寫入並關閉連線。
+    """
+    chunk_imports: list[dict] = []
+    chunk_relative_imports: list[dict] = []
+    with ContentCache(cache_dir, "imports", _IMPORT_RECORD_FORMAT) as content_cache:
+        for file_path in file_paths:
+            imports, relative_imports = _process_file_cached(file_path, content_cache)
+            chunk_imports.extend(imports)
+            chunk_relative_imports.extend(relative_imports)
+    return chunk_imports, chunk_relative_imports
 
 
 def get_dynamic_imports(entry_path: str) -> set[str]:
@@ -568,13 +850,13 @@ def _build_sandbox_env(project_dir: str | None, src_dirs: list[str] | None, venv
     return sandbox_env, find_python_executable(venv_path)
 
 
-@lru_cache(maxsize=1)
+@compute_once
 def _stdlib_top_levels() -> frozenset[str]:
     """Stdlib 全部模組名 (3.10+)，比 sys.builtin_module_names 完整 (含純 Python stdlib)."""
     return frozenset(sys.stdlib_module_names) | frozenset({"__main__", "__future__", "__builtins__"})
 
 
-@lru_cache(maxsize=1)
+@compute_once
 def _installed_top_levels() -> frozenset[str]:
     """
     已安裝第三方 top-level 模組名集合.
@@ -623,32 +905,83 @@ def _installed_top_levels() -> frozenset[str]:
     return frozenset(names)
 
 
+class _DirListingCache:
+    """
+    單次執行內共用的目錄列表快取 (跨 thread 共用).
+
+    每個目錄最多 os.scandir 一次, 之後 isdir / isfile 都改查記憶體內 set;
+    一個 missing module 原本要對每個 root x 每個 suffix 各 stat 一次, 現在只剩 dict lookup。
+    不加鎖: dict.get / setdefault 本身是 atomic, 最壞情況兩個 thread 同時 scan 同一目錄一次。
+    """
+
+    def __init__(self) -> None:
+        # path -> (子目錄名, 檔名); None 表示不存在或不是目錄
+        self._entries: dict[str, tuple[frozenset[str], frozenset[str]] | None] = {}
+
+    def get(self, path: str) -> tuple[frozenset[str], frozenset[str]] | None:
+        listing = self._entries.get(path, _UNSCANNED)
+        if listing is _UNSCANNED:
+            listing = self._entries.setdefault(path, self._scan(path))
+        return listing
+
+    @staticmethod
+    def _scan(path: str) -> tuple[frozenset[str], frozenset[str]] | None:
+        dirs: list[str] = []
+        files: list[str] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    # is_dir / is_file 走 d_type, 只有 symlink 才需額外 stat (與 os.path.isdir 一樣跟隨 symlink)
+                    try:
+                        if entry.is_dir():
+                            dirs.append(entry.name)
+                        elif entry.is_file():
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        return frozenset(dirs), frozenset(files)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_UNSCANNED = object()
+_DIR_LISTINGS = _DirListingCache()
+
+
 def _probe_module_roots(module: str, roots: list[str]) -> bool:
-    """檢查 roots 內是否存在 dotted module (檔案系統純 probe)."""
+    """
+    檢查 roots 內是否存在 dotted module (檔案系統純 probe).
+
+    目錄內容一律查 _DIR_LISTINGS, 不直接 stat; 比對大小寫敏感, 與 import system 在
+    case-insensitive 檔案系統上的行為一致 (os.path.isfile 則會誤判 Foo.py == foo.py)。
+    """
     parts = module.split(".")
+    last = len(parts) - 1
     suffixes = _module_file_suffixes()
+    listings = _DIR_LISTINGS
 
     for root in roots:
-        if not os.path.isdir(root):
-            continue
         # 沿 dotted 一路走下去，途中允許 namespace package (沒 __init__.py 也行)
         cur = root
         for i, part in enumerate(parts):
-            is_last = i == len(parts) - 1
-            dir_path = os.path.join(cur, part)
-            if is_last:
+            listing = listings.get(cur)
+            if listing is None:
+                break
+            dirs, files = listing
+            if i == last:
                 # 葉子: 接受 .py / C extension / 套件目錄 / namespace package 目錄
-                for suffix in suffixes:
-                    if os.path.isfile(os.path.join(cur, part + suffix)):
-                        return True
-                if os.path.isdir(dir_path):
+                if part in dirs:
+                    return True
+                if any(part + suffix in files for suffix in suffixes):
                     return True
                 break
             # 中間段: 一定要是目錄 (regular 或 namespace package 都可)
-            if os.path.isdir(dir_path):
-                cur = dir_path
-                continue
-            break
+            if part not in dirs:
+                break
+            cur = os.path.join(cur, part)
     return False
 
 
@@ -661,7 +994,7 @@ def _probe_local(module: str, project_dir: str, src_dirs: list[str] | None) -> b
 
 
 # .py + 當前 Python 的 C extension 後綴 (含 ABI tag / platform tag)
-@lru_cache(maxsize=1)
+@compute_once
 def _module_file_suffixes() -> tuple[str, ...]:
     import importlib.machinery as _im
 
@@ -684,14 +1017,106 @@ def _venv_site_packages(venv_path: str) -> list[str]:
     return candidates
 
 
-# 大量 dotted import 共享同一路徑查找 → 掃描結果可重用
-@lru_cache(maxsize=512)
-def _probe_sys_path_cached(module: str, paths_tuple: tuple[str, ...]) -> bool:
-    roots = [entry or os.getcwd() for entry in paths_tuple]
-    return _probe_module_roots(module, roots)
+class _PrefixNode:
+    """Trie 節點: 某個 dotted prefix 在所有 roots 底下對應的目錄, 以及是否有同名模組檔."""
+
+    __slots__ = ("children", "dirs", "is_module")
+
+    def __init__(self) -> None:
+        self.dirs: list[str] = []
+        self.is_module = False
+        # None = 尚未展開; 展開後 name -> 子節點
+        self.children: dict[str, _PrefixNode] | None = None
+
+
+class _ModulePrefixTrie:
+    """
+    跨 sys.path roots 的 package prefix trie.
+
+    根節點 = 所有 roots; 每個節點第一次被走到時合併其所有目錄的列表 (_DIR_LISTINGS) 展開子節點,
+    之後同一 prefix 的查詢都只是 dict lookup。dotted module 的解析因此是 O(depth),
+    不再對整個 sys.path tuple 做 hash, 也沒有 LRU eviction。
+    namespace package 跨多個 root 時, 同一節點會帶多個目錄。
+    """
+
+    def __init__(self, roots: list[str]) -> None:
+        self._root = _PrefixNode()
+        self._root.dirs = list(dict.fromkeys(roots))
+
+    @staticmethod
+    def _expand(node: _PrefixNode) -> dict[str, "_PrefixNode"]:
+        children: dict[str, _PrefixNode] = {}
+        suffixes = _module_file_suffixes()
+        for directory in node.dirs:
+            listing = _DIR_LISTINGS.get(directory)
+            if listing is None:
+                continue
+            dirs, files = listing
+            for name in dirs:
+                child = children.get(name)
+                if child is None:
+                    child = children[name] = _PrefixNode()
+                child.dirs.append(os.path.join(directory, name))
+            for filename in files:
+                for suffix in suffixes:
+                    if filename.endswith(suffix):
+                        name = filename[: -len(suffix)]
+                        child = children.get(name)
+                        if child is None:
+                            child = children[name] = _PrefixNode()
+                        child.is_module = True
+                        break
+        # 整個 dict 建好才掛上: 其他 thread 只會看到 None 或完整結果 (最壞重複展開一次)
+        node.children = children
+        return children
+
+    def contains(self, module: str) -> bool:
+        """判斷 dotted module 是否能在任一 root 下定位 (中間段必須是目錄, 葉子可為模組檔或目錄)."""
+        node = self._root
+        parts = module.split(".")
+        last = len(parts) - 1
+        for i, part in enumerate(parts):
+            children = node.children
+            if children is None:
+                children = self._expand(node)
+            child = children.get(part)
+            if child is None:
+                return False
+            if i == last:
+                return True
+            if not child.dirs:
+                return False
+            node = child
+        return False
+
+
+# 非 check_missing_modules 呼叫路徑 (單獨呼叫 check_module_importable_static) 用的 trie;
+# 只在 sys.path / extra_paths 改變時重建
+_SYS_PATH_TRIE: tuple[list[str], _ModulePrefixTrie] | None = None
+
+
+def _build_sys_path_trie(extra_paths: list[str] | None = None) -> _ModulePrefixTrie:
+    paths = [*(extra_paths or []), *sys.path]
+    return _ModulePrefixTrie([entry or os.getcwd() for entry in paths])
 
 
-def _probe_sys_path(module: str, extra_paths: list[str] | None = None) -> bool:
+def _get_sys_path_trie(extra_paths: list[str] | None = None) -> _ModulePrefixTrie:
+    global _SYS_PATH_TRIE
+    paths = [*(extra_paths or []), *sys.path]
+    cached = _SYS_PATH_TRIE
+    if cached is None or cached[0] != paths:
+        cached = _SYS_PATH_TRIE = (paths, _build_sys_path_trie(extra_paths))
+    return cached[1]
+
+
+def _reset_probe_caches() -> None:
+    """新的一輪檢查: 檔案系統可能已變動, 目錄列表與 trie 都要重建."""
+    global _SYS_PATH_TRIE
+    _DIR_LISTINGS.clear()
+    _SYS_PATH_TRIE = None
+
+
+def _probe_sys_path(module: str, extra_paths: list[str] | None = None, trie: _ModulePrefixTrie | None = None) -> bool:
     """
     掃 sys.path (+ extra_paths) 各 entry 純檔案系統檢查; 不觸發任何 finder 或 __init__.py.
 
@@ -705,10 +1130,16 @@ def _probe_sys_path(module: str, extra_paths: list[str] | None = None) -> bool:
     Args:
         module: 模組名稱
         extra_paths: 額外掃描路徑 (例如 --venv 指定的 site-packages)
+        trie: 呼叫端預先建好的 trie (check_missing_modules 每輪建一次); None 則用模組層級共用的
     """
-    # tuple 化 paths 才能進 lru_cache
-    paths_tuple = (*extra_paths, *sys.path) if extra_paths else tuple(sys.path)
-    return _probe_sys_path_cached(module, paths_tuple)
+    if trie is None:
+        trie = _get_sys_path_trie(extra_paths)
+    return trie.contains(module)
+
+
+def _render(error: Message | str | None) -> str | None:
+    """公開函數的回傳值: 延遲翻譯的 Message 在此渲染為字串."""
+    return None if error is None else str(error)
 
 
 def check_module_importable_static(
@@ -716,6 +1147,7 @@ def check_module_importable_static(
     project_dir: str | None = None,
     src_dirs: list[str] | None = None,
     extra_paths: list[str] | None = None,
+    sys_path_trie: _ModulePrefixTrie | None = None,
 ) -> tuple[str, str | None]:
     """
     純靜態檢查模組是否能被找到 (完全不執行任何使用者程式碼).
@@ -735,10 +1167,23 @@ def check_module_importable_static(
         project_dir: 專案根目錄
         src_dirs: 額外的 source 目錄
         extra_paths: 外部虛擬環境 site-packages 路徑 (來自 --venv 參數)
+        sys_path_trie: 已建好的 sys.path + extra_paths trie (批次檢查時共用)
 
     Returns:
         (模組名稱, 錯誤訊息 or None)
     """
+    _, error = _probe_module_static(module, project_dir, src_dirs, extra_paths, sys_path_trie)
+    return module, _render(error)
+
+
+def _probe_module_static(
+    module: str,
+    project_dir: str | None,
+    src_dirs: list[str] | None,
+    extra_paths: list[str] | None,
+    sys_path_trie: _ModulePrefixTrie | None,
+) -> tuple[str, Message | None]:
+    """check_module_importable_static 的本體; 管線內使用, 錯誤為延遲翻譯的 Message."""
     top = module.split(".", 1)[0]
 
     # L1: stdlib
@@ -754,45 +1199,39 @@ def check_module_importable_static(
         return module, None
 
     # L4: sys.path + extra_paths 檔案系統 fallback
-    if _probe_sys_path(module, extra_paths):
+    if _probe_sys_path(module, extra_paths, sys_path_trie):
         return module, None
 
-    return module, t("imports.error.module_not_found", module)
+    return module, Message("imports.error.module_not_found", module)
 
 
-def check_module_importable(
+def _run_import_script(
     module: str,
-    project_dir: str | None = None,
-    src_dirs: list[str] | None = None,
-    timeout: int = 30,
-    venv_path: str | None = None,
-) -> tuple[str, str | None]:
+    script: str,
+    project_dir: str | None,
+    src_dirs: list[str] | None,
+    *,
+    timeout: int,
+    venv_path: str | None,
+    python_flags: tuple[str, ...] = (),
+) -> tuple[subprocess.CompletedProcess | None, Message | None]:
     """
-    檢查模組是否能載入 (會真實執行 import 載入所有程式碼).
-
-    警告: 此函數會實際執行模組的程式碼!
-
-    Args:
-        module: 模組名稱
-        project_dir: 專案根目錄
-        src_dirs: 額外的 source 目錄 (如 src, tests)
-        timeout: 超時秒數
-        venv_path: 虛擬環境路徑 (可選)
+    在 sandbox subprocess 執行 import 腳本.
 
     Returns:
-        (模組名稱, 錯誤訊息 or None)
+        (CompletedProcess, None) 執行完成 (returncode 由呼叫端判斷)
+        (None, 錯誤訊息) 名稱非法 / 超時 / 無法啟動 Python
     """
     # S603: 安全檢查 - 驗證模組名稱僅包含合法字元
     if not MODULE_NAME_PATTERN.match(module):
-        return module, t("imports.error.invalid_module_name", module)
+        return None, Message("imports.error.invalid_module_name", module)
 
     sandbox_env, python_exec = _build_sandbox_env(project_dir, src_dirs, venv_path)
-    import_script = IMPORT_CHECK_SCRIPT.format(module=module)
 
     try:
         # S603: module name 已通過 MODULE_NAME_PATTERN regex 驗證
         result = subprocess.run(  # noqa: S603
-            [python_exec, "-c", import_script],
+            [python_exec, *python_flags, "-c", script],
             check=False,
             capture_output=True,
             text=True,
@@ -800,20 +1239,202 @@ def check_module_importable(
             env=sandbox_env,
             cwd=project_dir,
         )
-        if result.returncode != 0:
-            # 取最後幾行錯誤訊息
-            stderr_lines = result.stderr.strip().split("\n") if result.stderr else []
-            error = stderr_lines[-1] if stderr_lines else "Unknown error"
-            return module, error
-        return module, None
     except subprocess.TimeoutExpired:
-        return module, t("imports.error.import_timeout", timeout)
+        return None, Message("imports.error.import_timeout", timeout)
     except OSError as e:
         # 執行 Python 失敗 (檔案不存在、權限問題等)
-        return module, t("imports.error.failed_to_execute", e)
+        return None, Message("imports.error.failed_to_execute", e)
     except Exception as e:
         # 其他預期外的錯誤
-        return module, t("imports.error.unexpected_error", e)
+        return None, Message("imports.error.unexpected_error", e)
+    return result, None
+
+
+def _parse_peak_rss(stdout: str | None) -> int | None:
+    """取出 import 腳本以 IMPORT_PROFILE_MARKER 行回報的 peak RSS (KB); 沒有回報時為 None."""
+    peak_rss_kb: int | None = None
+    for line in (stdout or "").splitlines():
+        if line.startswith(IMPORT_PROFILE_MARKER):
+            with contextlib.suppress(ValueError):
+                peak_rss_kb = int(line.split()[-1])
+    return peak_rss_kb
+
+
+def _last_stderr_line(stderr: str | None) -> str:
+    # 取最後幾行錯誤訊息
+    stderr_lines = stderr.strip().split("\n") if stderr else []
+    return stderr_lines[-1] if stderr_lines else "Unknown error"
+
+
+def check_module_importable(
+    module: str,
+    project_dir: str | None = None,
+    src_dirs: list[str] | None = None,
+    timeout: int = 30,
+    venv_path: str | None = None,
+) -> tuple[str, str | None]:
+    """
+    檢查模組是否能載入 (會真實執行 import 載入所有程式碼).
+
+    警告: 此函數會實際執行模組的程式碼!
+
+    Args:
+        module: 模組名稱
+        project_dir: 專案根目錄
+        src_dirs: 額外的 source 目錄 (如 src, tests)
+        timeout: 超時秒數
+        venv_path: 虛擬環境路徑 (可選)
+
+    Returns:
+        (模組名稱, 錯誤訊息 or None)
+    """
+    _, error, _ = _import_module(module, project_dir, src_dirs, timeout, venv_path)
+    return module, _render(error)
+
+
+def _import_module(
+    module: str, project_dir: str | None, src_dirs: list[str] | None, timeout: int, venv_path: str | None
+) -> tuple[str, Message | str | None, int | None]:
+    """
+    check_module_importable 的本體.
+
+    Returns:
+        (模組名稱, 錯誤, peak RSS KB or None); import 失敗為 stderr 最後一行, 其他錯誤為延遲翻譯的 Message
+    """
+    script = IMPORT_CHECK_SCRIPT.format(module=module, marker=IMPORT_PROFILE_MARKER)
+    result, error = _run_import_script(module, script, project_dir, src_dirs, timeout=timeout, venv_path=venv_path)
+    if result is None:
+        return module, error, None
+    if result.returncode != 0:
+        return module, _last_stderr_line(result.stderr), None
+    return module, None, _parse_peak_rss(result.stdout)
+
+
+def parse_importtime_output(stderr: str) -> list[tuple[str, int, int, int]]:
+    """
+    解析 -X importtime 輸出.
+
+    只取 IMPORT_PROFILE_MARKER 之後的行 (排除 interpreter startup 自身的 import);
+    沒有 marker 時整段解析。
+
+    Returns:
+        [(imported package, self us, cumulative us, 巢狀深度)], 依輸出順序 (子節點先於父節點)
+    """
+    lines = stderr.splitlines()
+    with contextlib.suppress(ValueError):
+        lines = lines[lines.index(IMPORT_PROFILE_MARKER) + 1 :]
+
+    entries: list[tuple[str, int, int, int]] = []
+    for line in lines:
+        match = IMPORTTIME_LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+
+def profile_module_import(
+    module: str,
+    project_dir: str | None = None,
+    src_dirs: list[str] | None = None,
+    timeout: int = 30,
+    venv_path: str | None = None,
+) -> tuple[str, str | None, ImportProfile | None]:
+    """
+    與 check_module_importable 相同的隔離 import, 額外以 -X importtime 量測耗時與 peak RSS.
+
+    警告: 此函數會實際執行模組的程式碼!
+
+    Returns:
+        (模組名稱, 錯誤訊息 or None, ImportProfile or None)
+        import 失敗時不回傳 profile (失敗模組的耗時沒有比較意義)
+    """
+    _, error, profile = _profile_module(module, project_dir, src_dirs, timeout, venv_path)
+    return module, _render(error), profile
+
+
+def _profile_module(
+    module: str, project_dir: str | None, src_dirs: list[str] | None, timeout: int, venv_path: str | None
+) -> tuple[str, Message | str | None, ImportProfile | None]:
+    """profile_module_import 的本體; 錯誤同 _import_module."""
+    script = IMPORT_PROFILE_SCRIPT.format(module=module, marker=IMPORT_PROFILE_MARKER)
+    result, error = _run_import_script(
+        module, script, project_dir, src_dirs, timeout=timeout, venv_path=venv_path, python_flags=("-X", "importtime")
+    )
+    if result is None:
+        return module, error, None
+    if result.returncode != 0:
+        return module, _last_stderr_line(result.stderr), None
+
+    entries = parse_importtime_output(result.stderr or "")
+    total_us = sum(cumulative for _, _, cumulative, depth in entries if depth == 0)
+    return module, None, ImportProfile(module=module, total_us=total_us, peak_rss_kb=_parse_peak_rss(result.stdout), imports=entries)
+
+
+def summarize_import_profiles(
+    profiles: dict[str, ImportProfile],
+    top: int = 10,
+    budget_ms: float | None = None,
+) -> dict[str, list]:
+    """
+    彙整各模組 profile.
+
+    Returns:
+        {
+            "slowest_imports": [(imported package, self ms)],  # 跨模組取最大 self time, 依耗時排序
+            "heaviest_modules": [ImportProfile],                # 依 total_us 排序
+            "over_budget": [ImportProfile],                     # total_ms > budget_ms
+        }
+    """
+    # 同一個 transitive import 會在多個模組的 profile 出現, 取最大值避免重複計算
+    slowest: dict[str, int] = {}
+    for profile in profiles.values():
+        for name, self_us, _cumulative, _depth in profile.imports:
+            if self_us > slowest.get(name, -1):
+                slowest[name] = self_us
+
+    ranked = sorted(profiles.values(), key=lambda p: p.total_us, reverse=True)
+    return {
+        "slowest_imports": [(name, us / 1000) for name, us in sorted(slowest.items(), key=lambda kv: kv[1], reverse=True)[:top]],
+        "heaviest_modules": ranked[:top],
+        "over_budget": [p for p in ranked if budget_ms is not None and p.total_ms > budget_ms],
+    }
+
+
+def _prepare_static_probe(
+    project_dir: str | None,
+    src_dirs: list[str] | None,
+    venv_path: str | None,
+) -> tuple[_FindSpecCache, list[str] | None, _ModulePrefixTrie]:
+    """
+    準備一輪靜態檢查共用的狀態.
+
+    Returns:
+        (find_spec 結果快取, probe 額外路徑, sys.path trie)
+    """
+    # 目錄列表快取 / trie 以單次執行為範圍: 前一次執行後檔案系統可能已變動
+    _reset_probe_caches()
+    # 計算 effective_sys_path = project src + venv site-packages + 當前 sys.path
+    # 這個 list 同時用於 cache 簽名與 probe extra_paths
+    effective_sys_path: list[str] = []
+    if project_dir and src_dirs:
+        for src in src_dirs:
+            p = os.path.join(project_dir, src)
+            if os.path.exists(p):
+                effective_sys_path.append(p)
+        effective_sys_path.append(project_dir)
+    # --venv 指定的外部虛擬環境 site-packages
+    venv_extra: list[str] = _venv_site_packages(venv_path) if venv_path else []
+    effective_sys_path.extend(venv_extra)
+    # 簽名也納入當前 sys.path 確保 venv 切換能 invalidate
+    cache_signature_paths = list(effective_sys_path) + list(sys.path)
+    cache = _FindSpecCache(project_dir, cache_signature_paths)
+
+    # extra_paths 同時用於 probe (尊重 --venv)
+    probe_extra = venv_extra or None
+    # 整輪共用一棵 trie: 每個 package 目錄最多列一次, 之後的 dotted lookup 只走 dict
+    probe_trie = _build_sys_path_trie(probe_extra)
+    return cache, probe_extra, probe_trie
 
 
 def check_missing_modules(
@@ -824,6 +1445,9 @@ def check_missing_modules(
     timeout: int = 30,
     venv_path: str | None = None,
     use_static: bool = True,
+    *,
+    profile_sink: dict[str, ImportProfile] | None = None,
+    deadline: float | None = None,
 ) -> dict[str, list[dict]]:
     """
     檢查缺少的模組.
@@ -836,6 +1460,8 @@ def check_missing_modules(
         timeout: 每個模組的超時秒數
         venv_path: 虛擬環境路徑 (可選)
         use_static: True=靜態檢查(不執行), False=真實執行(可檢測運行時錯誤)
+        profile_sink: 執行模式下若提供, 改用 -X importtime 量測並把各模組 ImportProfile 寫入此 dict
+        deadline: 執行模式整個階段的 wall-clock 預算 (秒); 超過後尚未開始的模組直接回報失敗
 
     Returns:
         缺少/載入失敗的模組字典
@@ -862,7 +1488,7 @@ def check_missing_modules(
 
     missing_modules: dict[str, list[dict]] = {}
 
-    def _record_error(mod: str, err: str) -> None:
+    def _record_error(mod: str, err: Message | str) -> None:
         # 同模組混合 optional/required 使用: 只報 required 那些 (avoid 雜訊)
         # 全 optional 已被 all_optional_modules 在前面過濾掉，此處 required_infos 必非空
         required_infos = [info for info in modules_by_name[mod] if not info.get("optional", False)]
@@ -872,24 +1498,7 @@ def check_missing_modules(
 
     if use_static:
         # 靜態模式: 4 層 probe + mtime cache
-        # 計算 effective_sys_path = project src + venv site-packages + 當前 sys.path
-        # 這個 list 同時用於 cache 簽名與 probe extra_paths
-        effective_sys_path: list[str] = []
-        if project_dir and src_dirs:
-            for src in src_dirs:
-                p = os.path.join(project_dir, src)
-                if os.path.exists(p):
-                    effective_sys_path.append(p)
-            effective_sys_path.append(project_dir)
-        # --venv 指定的外部虛擬環境 site-packages
-        venv_extra: list[str] = _venv_site_packages(venv_path) if venv_path else []
-        effective_sys_path.extend(venv_extra)
-        # 簽名也納入當前 sys.path 確保 venv 切換能 invalidate
-        cache_signature_paths = list(effective_sys_path) + list(sys.path)
-        cache = _FindSpecCache(project_dir, cache_signature_paths)
-
-        # extra_paths 同時用於 probe (尊重 --venv)
-        probe_extra = venv_extra or None
+        cache, probe_extra, probe_trie = _prepare_static_probe(project_dir, src_dirs, venv_path)
 
         # 先掃 cache 命中,沒命中的才丟並行
         to_check: list[str] = []
@@ -898,13 +1507,13 @@ def check_missing_modules(
             if cached is None:
                 to_check.append(m)
             elif not cached[0]:
-                _record_error(m, cached[1] or "Module not found")
+                _record_error(m, cached[1])
 
         if to_check:
             workers = max_workers or calculate_optimal_workers(len(to_check))
             if should_use_thread_pool(len(to_check), work_kind="cpu"):
                 with ThreadPoolExecutor(max_workers=workers) as executor:
-                    futures = {executor.submit(check_module_importable_static, m, project_dir, src_dirs, probe_extra): m for m in to_check}
+                    futures = {executor.submit(_probe_module_static, m, project_dir, src_dirs, probe_extra, probe_trie): m for m in to_check}
                     for future in as_completed(futures):
                         module, error = future.result()
                         cache.set(module, error)
@@ -912,7 +1521,7 @@ def check_missing_modules(
                             _record_error(module, error)
             else:
                 for m in to_check:
-                    module, error = check_module_importable_static(m, project_dir, src_dirs, probe_extra)
+                    module, error = _probe_module_static(m, project_dir, src_dirs, probe_extra, probe_trie)
                     cache.set(module, error)
                     if error:
                         _record_error(module, error)
@@ -920,23 +1529,193 @@ def check_missing_modules(
         return missing_modules
 
     # 執行模式必須維持每個模組獨立 subprocess，避免前一個 import 污染後續結果。
-    workers = max_workers or calculate_optimal_workers(len(unique_modules))
-    if should_use_thread_pool(len(unique_modules), work_kind="io"):
+    # 排程: 歷史最久的模組先跑 (ThreadPool 依 submit 順序取工作), 避免長尾模組最後才開跑拖長總時間
+    timings = _ImportTimingCache(project_dir)
+    ordered_modules = timings.order_longest_first(unique_modules)
+    deadline_at = time.monotonic() + deadline if deadline else None
+
+    def _check(m: str) -> tuple[str, Message | str | None]:
+        started = time.monotonic()
+        task_timeout: float = timeout
+        if deadline_at is not None:
+            remaining = deadline_at - started
+            if remaining <= 0:
+                return m, Message("imports.error.deadline_exceeded", deadline)
+            # 每個模組的 timeout 不超過整體剩餘時間
+            task_timeout = min(timeout, round(remaining, 1))
+
+        if profile_sink is None:
+            module, error, rss_kb = _import_module(m, project_dir, src_dirs, task_timeout, venv_path)
+        else:
+            module, error, profile = _profile_module(m, project_dir, src_dirs, task_timeout, venv_path)
+            rss_kb = None
+            if profile is not None:
+                profile_sink[module] = profile
+                rss_kb = profile.peak_rss_kb
+        timings.record(module, (time.monotonic() - started) * 1000, rss_kb)
+        return module, error
+
+    workers = max_workers or calculate_execute_workers(len(ordered_modules), timings.peak_rss_kb())
+    if should_use_thread_pool(len(ordered_modules), work_kind="io"):
         with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(check_module_importable, m, project_dir, src_dirs, timeout, venv_path): m for m in unique_modules}
+            futures = {executor.submit(_check, m): m for m in ordered_modules}
             for future in as_completed(futures):
                 module, error = future.result()
                 if error:
                     _record_error(module, error)
     else:
-        for m in unique_modules:
-            module, error = check_module_importable(m, project_dir, src_dirs, timeout, venv_path)
+        for m in ordered_modules:
+            module, error = _check(m)
             if error:
                 _record_error(module, error)
 
+    timings.flush()
     return missing_modules
 
 
+def iter_missing_imports(
+    project_dir: str,
+    ignore_dirs: set[str] | None = None,
+    ignore_files: set[str] | None = None,
+    *,
+    target_files: Iterable[str] | None = None,
+    src_dirs: list[str] | None = None,
+    venv_path: str | None = None,
+    max_workers: int | None = None,
+    max_pending: int | None = None,
+) -> Iterator[tuple[str, dict]]:
+    """
+    靜態模式的串流管線: 探索 → 讀檔 → 解析 → 擷取 → 解析模組, 確認缺少即產出.
+
+    與 extract_from_all_files + check_missing_modules 結果相同 (順序除外), 但不先收集全部 import:
+    - 檔案惰性探索, 同時進行中的任務 (讀檔解析 + 模組解析) 不超過 max_pending;
+      呼叫端不取下一筆時管線就停住 (backpressure)
+    - 常駐記憶體只有「已解析模組 → 結果」與解析中模組的等待列表, 與 import 總數無關
+    - 只出現在 try/except ImportError 內的使用點不回報 (與 check_missing_modules 一致)
+
+    Args:
+        project_dir: 專案根目錄
+        ignore_dirs: 排除目錄
+        ignore_files: 排除檔名
+        target_files: 指定檔案 (可為惰性 iterable); None 或沒有任何檔案時走訪 project_dir (同 extract_from_all_files)
+        src_dirs: 額外的 source 目錄
+        venv_path: 虛擬環境路徑 (可選)
+        max_workers: 最大並行數; free-threaded build 以外預設單執行緒 (ast.parse 受 GIL 限制)
+        max_pending: 同時進行中的任務上限, 預設 workers * 4
+
+    Yields:
+        (模組名稱, import 資訊 (含 error))
+    """
+    files = iter(target_files or ())
+    # 只預讀第一個檔案判斷是否為空, 其餘仍惰性取得
+    first_file = next(files, None)
+    if first_file is None:
+        files = iter_python_files(
+            project_dir,
+            frozenset(get_exclude_dirs_set() if ignore_dirs is None else ignore_dirs),
+            frozenset(ignore_files or ()),
+        )
+    else:
+        files = chain([first_file], files)
+    builtin_modules = frozenset(sys.builtin_module_names) | frozenset({"__main__", "__future__", "__builtins__"})
+    cache, probe_extra, probe_trie = _prepare_static_probe(project_dir, src_dirs, venv_path)
+    cache_dir = cache_dir_for(project_dir)
+    # ContentCache 的緩衝與統計不加鎖: 每個 worker thread 各自一個實例, 結束時逐一 flush 並關閉連線
+    content_caches: list[ContentCache] = []
+    thread_local = threading.local()
+
+    def extract(file_path: str) -> tuple[list[dict], list[dict]]:
+        content_cache = getattr(thread_local, "content_cache", None)
+        if content_cache is None:
+            content_cache = thread_local.content_cache = ContentCache(cache_dir, "imports", _IMPORT_RECORD_FORMAT)
+            content_caches.append(content_cache)  # list.append 在 free-threaded build 上也是原子操作
+        return _process_file_cached(file_path, content_cache)
+
+    # module -> error (None = 找得到); 解析中的模組 -> 等待結果的 import
+    resolved: dict[str, Message | None] = {}
+    waiting: dict[str, list[dict]] = {}
+
+    def _resolve(module: str) -> tuple[str, Message | None, bool]:
+        """解析模組; 第三個值表示結果是否為本次新探測 (需寫入快取)."""
+        cached = cache.get(module)
+        if cached is not None:
+            return module, cached[1], False
+        return (*_probe_module_static(module, project_dir, src_dirs, probe_extra, probe_trie), True)
+
+    def _settle(module: str, error: Message | None, probed: bool = False) -> Iterator[tuple[str, dict]]:
+        if module not in resolved:
+            resolved[module] = error
+            if probed:
+                cache.set(module, error)
+        for info in waiting.pop(module, ()):
+            if error:
+                info["error"] = error
+                yield module, info
+
+    def _route(info: dict) -> str | None:
+        """登記 import; 回傳需要結算的模組名 (已有結果或尚未開始解析), 解析中則回傳 None."""
+        module = info["module"]
+        # optional 使用點永遠不回報; 同模組的 required 使用點仍會被檢查
+        if module in builtin_modules or info.get("optional", False):
+            return None
+        if module in waiting:
+            waiting[module].append(info)
+            return None
+        waiting[module] = [info]
+        return module
+
+    workers = max_workers or (calculate_optimal_workers(256) if IS_FREE_THREADED else 1)
+    try:
+        if workers <= 1:
+            for file_path in files:
+                imports, _ = extract(file_path)
+                for info in imports:
+                    module = _route(info)
+                    if module is not None:
+                        yield from _settle(module, resolved[module]) if module in resolved else _settle(*_resolve(module))
+            return
+
+        limit = max_pending or workers * 4
+        pending: set[Future] = set()
+        resolving: set[Future] = set()
+        exhausted = False
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                # 只在進行中任務未滿時讀下一個檔案 → 模組解析任務也佔名額, 形成 backpressure
+                while not exhausted and len(pending) < limit:
+                    file_path = next(files, None)
+                    if file_path is None:
+                        exhausted = True
+                    else:
+                        pending.add(executor.submit(extract, file_path))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in resolving:
+                        resolving.discard(future)
+                        yield from _settle(*future.result())
+                        continue
+                    imports, _ = future.result()
+                    for info in imports:
+                        module = _route(info)
+                        if module is None:
+                            continue
+                        if module in resolved:
+                            yield from _settle(module, resolved[module])
+                        else:
+                            resolve_future = executor.submit(_resolve, module)
+                            resolving.add(resolve_future)
+                            pending.add(resolve_future)
+    finally:
+        # 呼叫端提前結束也保留已解析的結果
+        cache.flush()
+        cache.close()
+        for content_cache in content_caches:
+            content_cache.flush()
+            content_cache.close()
+
+
 def print_results(
     missing_modules: dict[str, list[dict]],
     all_relative_imports: list[dict],
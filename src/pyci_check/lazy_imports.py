@@ -0,0 +1,241 @@
+"""
+延遲 import 機會偵測 (Lazy-Import Opportunities).
+
+找出 top-level import 的名稱只在函數 body 內使用的情況: 這些 import 可以移進函數,
+或改用 PEP 810 風格的 lazy import, 減少 CLI / serverless handler 的啟動時間。
+
+與 SideEffectVisitor 相同以 scope_depth 區分 import 時執行與延後執行的程式碼, 但只有函數 / lambda
+的 body 會加深: class body、decorator、參數預設值 (以及未延後求值的 annotation) 都在 import 時執行。
+
+候選依估計的遞移 import 成本 (weight.py) 排序; 僅作為警告輸出。
+"""
+
+import ast
+import os
+from dataclasses import dataclass, field
+
+from pyci_check.graph import ImportGraph, is_test_file
+from pyci_check.imports import read_file_with_encoding
+from pyci_check.weight import ImportWeight, installed_module_size
+
+# 預設只列出估計 import 成本 >= 100KB 的候選 (可由 [tool.pyci-check] lazy-import-min-size 覆寫)
+DEFAULT_LAZY_IMPORT_MIN_SIZE = 100 * 1024
+
+
+@dataclass
+class LazyImportCandidate:
+    """可延後的 top-level import."""
+
+    file: str
+    line: int
+    statement: str
+    names: list[str]  # 可延後的綁定名稱 (同一敘述中其他名稱可能仍在 import 時使用)
+    modules: list[str]  # 對應的被 import 模組
+    functions: list[str]  # 使用這些名稱的函數
+    estimated_bytes: int = 0
+    third_party: list[str] = field(default_factory=list)
+
+
+class DeferrableImportVisitor(ast.NodeVisitor):
+    """記錄 top-level import 綁定的名稱, 以及每個名稱在 import 時 / 函數內的使用位置."""
+
+    def __init__(self) -> None:
+        # 綁定名稱 → [(模組名, 行號, 原始敘述)]; import a.b 與 import a.c 都綁定 a
+        self.imports: dict[str, list[tuple[str, int, str]]] = {}
+        self.import_time_uses: set[str] = set()
+        self.deferred_uses: dict[str, set[str]] = {}
+        self.exported: set[str] = set()
+        # 只有函數 body 加深; 0 表示 import 時執行
+        self.scope_depth = 0
+        # 目前所在的 class / 函數名稱 (用於回報使用位置)
+        self._scope_names: list[str] = []
+        self._postponed_annotations = False
+
+    def collect(self, tree: ast.Module) -> None:
+        for stmt in tree.body:
+            if isinstance(stmt, ast.ImportFrom) and stmt.module == "__future__":
+                self._postponed_annotations |= any(alias.name == "annotations" for alias in stmt.names)
+            elif isinstance(stmt, ast.Import):
+                for alias in stmt.names:
+                    # import a.b.c 綁定 a, 但成本以 a.b.c 計
+                    name = alias.asname or alias.name.split(".", 1)[0]
+                    self.imports.setdefault(name, []).append((alias.name, stmt.lineno, ast.unparse(stmt)))
+            elif isinstance(stmt, ast.ImportFrom) and stmt.level == 0 and stmt.module:
+                for alias in stmt.names:
+                    if alias.name != "*":
+                        binding = (f"{stmt.module}.{alias.name}", stmt.lineno, ast.unparse(stmt))
+                        self.imports.setdefault(alias.asname or alias.name, []).append(binding)
+            elif (
+                isinstance(stmt, ast.Assign)
+                and any(isinstance(t, ast.Name) and t.id == "__all__" for t in stmt.targets)
+                and isinstance(stmt.value, (ast.List, ast.Tuple))
+            ):
+                self.exported.update(e.value for e in stmt.value.elts if isinstance(e, ast.Constant) and isinstance(e.value, str))
+        self.visit(tree)
+
+    def _use(self, name: str) -> None:
+        if name not in self.imports:
+            return
+        if self.scope_depth == 0:
+            self.import_time_uses.add(name)
+        else:
+            self.deferred_uses.setdefault(name, set()).add(".".join(self._scope_names))
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if not isinstance(node.ctx, ast.Store):
+            self._use(node.id)
+
+    def _visit_annotation(self, node: ast.expr | None) -> None:
+        # from __future__ import annotations: annotation 不求值, 不算使用
+        if node is not None and not self._postponed_annotations:
+            self.visit(node)
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        # decorator / 預設值 / annotation 在 def 執行時求值
+        for expr in (*node.decorator_list, *node.args.defaults, *(d for d in node.args.kw_defaults if d is not None)):
+            self.visit(expr)
+        all_args = [*node.args.posonlyargs, *node.args.args, *node.args.kwonlyargs, node.args.vararg, node.args.kwarg]
+        if self.scope_depth == 0:
+            for arg in all_args:
+                if arg is not None:
+                    self._visit_annotation(arg.annotation)
+            self._visit_annotation(node.returns)
+
+        self.scope_depth += 1
+        self._scope_names.append(node.name)
+        for stmt in node.body:
+            self.visit(stmt)
+        self._scope_names.pop()
+        self.scope_depth -= 1
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._visit_function(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._visit_function(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        # class body 在 import 時執行, 不加深; 只記錄名稱
+        for expr in (*node.decorator_list, *node.bases, *(kw.value for kw in node.keywords)):
+            self.visit(expr)
+        self._scope_names.append(node.name)
+        for stmt in node.body:
+            self.visit(stmt)
+        self._scope_names.pop()
+
+    def visit_Lambda(self, node: ast.Lambda) -> None:
+        for expr in (*node.args.defaults, *(d for d in node.args.kw_defaults if d is not None)):
+            self.visit(expr)
+        self.scope_depth += 1
+        self._scope_names.append("<lambda>")
+        self.visit(node.body)
+        self._scope_names.pop()
+        self.scope_depth -= 1
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        # 函數內的變數 annotation 不求值; 模組 / class 層級則在 import 時求值
+        if self.scope_depth == 0:
+            self._visit_annotation(node.annotation)
+        if node.value is not None:
+            self.visit(node.value)
+
+    def deferrable(self) -> dict[str, list[str]]:
+        """只在函數 body 內使用的 import 名稱 → 使用它的函數 (排除 __all__ 匯出與完全未使用者)."""
+        return {
+            name: sorted(functions)
+            for name, functions in self.deferred_uses.items()
+            if name not in self.import_time_uses and name not in self.exported
+        }
+
+
+def find_deferrable_imports(filepath: str) -> list[LazyImportCandidate]:
+    """
+    單一檔案中可延後的 top-level import.
+
+    __init__.py 的 import 通常是重新匯出, 不列入。
+
+    Returns:
+        未估算成本的候選列表
+    """
+    if os.path.basename(filepath) == "__init__.py":
+        return []
+    code = read_file_with_encoding(filepath)
+    if not code:
+        return []
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return []
+
+    visitor = DeferrableImportVisitor()
+    visitor.collect(tree)
+    # 同一敘述 (例如 from m import a, b) 合併為一個候選
+    by_statement: dict[tuple[int, str], LazyImportCandidate] = {}
+    for name, functions in sorted(visitor.deferrable().items()):
+        for module, line, statement in visitor.imports[name]:
+            key = (line, statement)
+            candidate = by_statement.setdefault(key, LazyImportCandidate(filepath, line, statement, [], [], []))
+            if name not in candidate.names:
+                candidate.names.append(name)
+            candidate.modules.append(module)
+            candidate.functions = sorted({*candidate.functions, *functions})
+    return [by_statement[key] for key in sorted(by_statement)]
+
+
+def _resolve_local(module: str, module_to_file: dict[str, str]) -> str | None:
+    """模組名 (可能是 `from pkg import name` 的 pkg.name) → 最長的本地模組檔案."""
+    current = module
+    while current:
+        if current in module_to_file:
+            return module_to_file[current]
+        current = current.rpartition(".")[0]
+    return None
+
+
+def find_lazy_import_candidates(
+    graph: ImportGraph,
+    weights: dict[str, ImportWeight],
+    roots: tuple[str, ...],
+    min_bytes: int = 0,
+) -> list[LazyImportCandidate]:
+    """
+    專案中可延後的 top-level import, 依估計 import 成本由大到小排序.
+
+    成本估計 (同一敘述的多個名稱取最大者):
+    - 本地模組: 遞移閉包的本地原始碼大小 + 閉包內外部模組在磁碟上的大小
+    - 外部模組: 在磁碟上的大小 (site-packages / stdlib)
+
+    測試檔與 conftest.py 不列入。
+
+    Args:
+        graph: import 圖
+        weights: weight.compute_import_weights 的結果
+        roots: 外部模組搜尋根目錄 (weight.external_module_roots)
+        min_bytes: 低於此估計值的候選不列出
+
+    Returns:
+        LazyImportCandidate 列表
+    """
+    module_to_file = {mod: fp for fp, mod in graph.modules.items()}
+
+    def estimate(module: str) -> tuple[int, list[str]]:
+        local = _resolve_local(module, module_to_file)
+        if local is None or local not in weights:
+            return installed_module_size(module, roots), []
+        weight = weights[local]
+        return weight.source_bytes + sum(installed_module_size(top, roots) for top in weight.external), weight.third_party
+
+    results = []
+    for filepath in sorted(graph.modules):
+        # 測試檔的 import 幾乎都只在測試函數內使用, 且與啟動時間無關
+        if is_test_file(filepath) or os.path.basename(filepath) == "conftest.py":
+            continue
+        for candidate in find_deferrable_imports(filepath):
+            for module in candidate.modules:
+                size, third_party = estimate(module)
+                candidate.estimated_bytes = max(candidate.estimated_bytes, size)
+                candidate.third_party = sorted({*candidate.third_party, *third_party})
+            if candidate.estimated_bytes >= min_bytes:
+                results.append(candidate)
+    results.sort(key=lambda c: (-c.estimated_bytes, c.file, c.line))
+    return results
@@ -9,16 +9,42 @@ TRANSLATIONS = {
     "cli.help.check_relative": "Forbid relative imports (fail if found)",
     "cli.help.venv": "Virtual environment path (e.g., . or /path/to/project)",
     "cli.help.i_understand": "I understand that import checking will actually load and execute all module code",
+    "cli.help.profile_imports": "Measure import time (-X importtime) and peak RSS per module (execute mode only)",
+    "cli.help.import_budget_ms": "Warn when a module takes longer than this many milliseconds to import (execute mode only)",
+    "cli.help.import_deadline": "Wall-clock budget in seconds for the whole execute-mode import phase",
+    "cli.help.compile": "Compile files to bytecode (catches compile-time errors) and write pyc files",
+    "cli.help.pyc_prefix": "Root directory for the pyc tree (PYTHONPYCACHEPREFIX layout); default: __pycache__ next to sources",
+    "cli.help.pyc_invalidation": "pyc invalidation mode (default: timestamp, or checked-hash when SOURCE_DATE_EPOCH is set)",
     "cli.help.subcommand": "Subcommand",
     "cli.help.syntax": "Check Python syntax",
     "cli.help.imports": "Check import dependencies",
     "cli.help.dependency": "Check dependency health (Phantom/Orphan)",
     "cli.help.cycles": "Check import cycles",
+    "cli.help.cycles_include_deferred": "Also count function-local imports as cycle edges (default: import-time edges only)",
+    "cli.help.contracts": "Check architecture contracts ([[tool.pyci-check.contracts]])",
+    "cli.help.impact": "List files that transitively import the given files (for test selection)",
+    "cli.help.impact_files": "Changed files",
+    "cli.help.impact_tests": "Only list test files (test_*.py / *_test.py)",
+    "cli.help.graph": "Export the import graph with per-node metrics (fan-in/out, SCC, layer, transitive size)",
+    "cli.help.graph_format": "Output format (default: json)",
+    "cli.help.graph_level": "Graph granularity: file or package (default: file)",
+    "cli.help.graph_output": "Write to this file instead of stdout",
+    "cli.help.weight": "Estimate static import cost (transitive modules, third-party packages, source bytes)",
+    "cli.help.weight_entry": "Entry module to check (repeatable); default: [tool.pyci-check.import-weight] entry-points or [project.scripts]",
+    "cli.help.weight_top": "Number of heaviest modules to list (default: 10, 0 to disable)",
+    "cli.help.weight_verbose": "Also list the third-party packages pulled in",
+    "cli.help.lazy_imports": "Find top-level imports only used inside functions, ranked by estimated import cost (warning only)",
+    "cli.help.lazy_imports_min_size": "Only list candidates whose estimated import cost is at least this size (default: 100KB)",
     "cli.help.deadcode": "Scan for dead code",
     "cli.help.signature": "Check local cross-file function signatures",
     "cli.help.install_hooks": "Install Git hooks",
     "cli.help.uninstall_hooks": "Remove Git hooks",
     "cli.help.hook_type": "Hook type (default: pre-commit)",
+    "cli.help.cache": "Manage the result cache (stats / gc / clear)",
+    "cli.help.cache_stats": "Show cache size and hit rate per phase",
+    "cli.help.cache_gc": "Evict least recently used entries until the cache fits its size budget",
+    "cli.help.cache_clear": "Remove all cached results",
+    "cli.help.cache_max_size": "Size budget (e.g. 512MB); default: [tool.pyci-check] cache-max-size or 256MB",
     "cli.examples": """Examples:
   pyci-check syntax                                        # Check syntax only
   pyci-check imports --i-understand-this-will-execute-code # Check imports (will execute code)
@@ -26,11 +52,17 @@ TRANSLATIONS = {
   pyci-check install-hooks                                 # Install pre-commit hook
   pyci-check install-hooks --type pre-push                 # Install pre-push hook
   pyci-check uninstall-hooks                               # Remove all hooks
+  pyci-check cache stats                                   # Show cache size and hit rates
+  pyci-check impact src/pkg/mod.py --tests                 # List tests affected by a change
+  pyci-check graph --format dot --level package            # Export the package-level import graph
+  pyci-check weight --entry pkg.cli                        # Estimate what importing pkg.cli pulls in
 """,
     # Syntax check
     "syntax.no_files": "No Python files found",
     "syntax.checking": "Checking syntax of {} files...",
     "syntax.success": "✓ All files have correct syntax",
+    "syntax.compile_mode": "Compile mode: writing bytecode to {}",
+    "syntax.target_version": "Target Python version: {}",
     # Import check - execution
     "imports.checking": "Checking import dependencies...",
     "imports.pythonpath": "PYTHONPATH: {}",
@@ -49,6 +81,9 @@ TRANSLATIONS = {
     "imports.success": "✓ All import dependencies are correct",
     "imports.summary.failed_modules": "Failed modules: {}",
     "imports.summary.total_errors": "Total errors: {}",
+    "imports.profile.heaviest": "Heaviest modules (import time):",
+    "imports.profile.slowest": "Slowest transitive imports (self time):",
+    "imports.profile.over_budget": "⚠️  {} modules exceeded the import budget of {} ms (Warning only):",
     # Dependency check
     "dependency.checking": "Checking dependency health...",
     "dependency.phantom": "❌ Phantom dependencies (Used but not declared):",
@@ -57,6 +92,8 @@ TRANSLATIONS = {
     # Cycle check
     "cycles.checking": "Checking import cycles...",
     "cycles.found": "❌ Found {} import cycles:",
+    "cycles.breaks": "  Suggested fix: move these {} import statement(s) into functions (or under TYPE_CHECKING) to break every cycle:",
+    "cycles.break_component": "    [{}] {} files in cycle, move {} import(s):",
     "cycles.success": "✓ No import cycles found",
     # Side Effects check
     "side_effects.checking": "Checking global side effects...",
@@ -76,6 +113,7 @@ TRANSLATIONS = {
     "check_all.imports_phase": "[2/7] Import check",
     "check_all.dependency_phase": "[3/7] Dependency health check",
     "check_all.cycles_phase": "[4/7] Import cycle check",
+    "check_all.contracts_phase": "[*] Architecture contract check",
     "check_all.signature_phase": "[5/7] Local signature check",
     "check_all.side_effects_phase": "[6/7] Global side effects check (Warning only)",
     "check_all.deadcode_phase": "[7/7] Dead code scan (Warning only)",
@@ -124,6 +162,7 @@ TRANSLATIONS = {
     "imports.error.module_not_found": "Static analysis cannot find module: {}",
     "imports.error.invalid_module_name": "Invalid module name: {}",
     "imports.error.import_timeout": "Import timeout ({}s)",
+    "imports.error.deadline_exceeded": "Not started: import phase deadline ({}s) exceeded",
     "imports.error.failed_to_execute": "Failed to execute Python: {}",
     "imports.error.unexpected_error": "Unexpected error: {}",
     # Syntax error messages
@@ -132,4 +171,39 @@ TRANSLATIONS = {
     "syntax.error.file_error": "File Error: {}",
     "syntax.error.unexpected_error": "Unexpected Error: {}",
     "syntax.error.exception": "Exception: {}",
+    # Cache management
+    "cache.location": "Cache: {}",
+    "cache.empty": "No cache at {}",
+    "cache.summary": "Size: {} ({} entries, budget {})",
+    "cache.phase_row": "  {:<24} {:>8} entries {:>10}   hit rate {:>4} ({}/{})",
+    "cache.gc_done": "Evicted {} least recently used entries, freed {}",
+    "cache.gc_within_budget": "Cache size {} is within budget {}, nothing to evict",
+    "cache.cleared": "Cache cleared: {}",
+    # Impact analysis
+    "impact.unknown_file": "Warning: {} is not a Python file in the project import graph",
+    "graph.written": "Wrote {} nodes and {} edges to {}",
+    # Architecture contracts
+    "contracts.none": "No contracts configured ([[tool.pyci-check.contracts]])",
+    "contracts.checking": "Checking {} architecture contracts...",
+    "contracts.found": "❌ Found {} contract violations:",
+    "contracts.violation": "  [{}] {} must not import {}:",
+    "contracts.unmatched": "Warning: contract module {} matches no file in the project",
+    "contracts.success": "✓ All {} contracts kept",
+    "contracts.error.not_a_list": "Invalid config: [tool.pyci-check] contracts must be an array of tables",
+    "contracts.error.not_a_table": "Invalid config: contract #{} is not a table",
+    "contracts.error.unknown_type": "Invalid config: contract #{} has unknown type {!r} (expected one of: {})",
+    "contracts.error.missing_field": "Invalid config: contract {!r} is missing or has an invalid {}",
+    "contracts.error.nested_module": "Invalid config: contract {!r}: {} is part of {}, so imports between them cannot be checked",
+    # Import weight
+    "weight.entry_points": "Entry points (module / local modules / third-party packages / source bytes):",
+    "weight.heaviest": "Top {} heaviest modules:",
+    "weight.row": "  {:<48} {:>6} {:>4} {:>10}",
+    "weight.unknown_entry": "  Warning: entry point {} is not a local module",
+    "weight.over_budget": "    ❌ {} exceeded: {} > {}",
+    # Lazy-import opportunities
+    "lazy_imports.checking": "Looking for deferrable top-level imports (estimated cost >= {})...",
+    "lazy_imports.found": "⚠️  Found {} top-level imports only used inside functions (Warning only):",
+    "lazy_imports.used_in": "      {} used only in: {}",
+    "lazy_imports.hint": "  Hint: Move these imports into the functions that use them (or make them lazy) to cut import-time cost. Estimates are upper bounds: savings are smaller if the module is also imported elsewhere at import time.",
+    "lazy_imports.success": "✓ No heavy deferrable imports found",
 }
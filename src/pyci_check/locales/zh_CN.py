@@ -9,16 +9,42 @@ TRANSLATIONS = {
     "cli.help.check_relative": "禁止相对导入 (发现时视为错误)",
     "cli.help.venv": "虚拟环境路径 (如: . 或 /path/to/project)",
     "cli.help.i_understand": "我理解 import 检查会实际载入并执行所有模块的代码",
+    "cli.help.profile_imports": "测量每个模块的 import 耗时 (-X importtime) 与 peak RSS (仅执行模式)",
+    "cli.help.import_budget_ms": "模块 import 耗时超过此毫秒数时发出警告 (仅执行模式)",
+    "cli.help.import_deadline": "execute 模式整个 import 阶段的 wall-clock 预算 (秒)",
+    "cli.help.compile": "编译为 bytecode (可捕获编译期错误) 并写入 pyc",
+    "cli.help.pyc_prefix": "pyc 树根目录 (PYTHONPYCACHEPREFIX 布局); 默认为源码旁的 __pycache__",
+    "cli.help.pyc_invalidation": "pyc 失效模式 (默认 timestamp; 设置 SOURCE_DATE_EPOCH 时为 checked-hash)",
     "cli.help.subcommand": "子命令",
     "cli.help.syntax": "检查 Python 语法",
     "cli.help.imports": "检查 import 依赖",
     "cli.help.dependency": "检查依赖健康度 (幽灵/冗余依赖)",
     "cli.help.cycles": "检查循环引用",
+    "cli.help.cycles_include_deferred": "函数内的 import 也视为循环引用的边 (默认只看 import 时执行的边)",
+    "cli.help.contracts": "检查架构契约 ([[tool.pyci-check.contracts]])",
+    "cli.help.impact": "列出直接或间接 import 指定文件的文件 (供测试挑选)",
+    "cli.help.impact_files": "变更的文件",
+    "cli.help.impact_tests": "只列出测试文件 (test_*.py / *_test.py)",
+    "cli.help.graph": "导出 import 图与节点指标 (fan-in/out、SCC、拓扑层、传递 import 数)",
+    "cli.help.graph_format": "输出格式 (默认: json)",
+    "cli.help.graph_level": "图的粒度: file 或 package (默认: file)",
+    "cli.help.graph_output": "写入指定文件而非 stdout",
+    "cli.help.weight": "估算静态 import 成本 (传递模块数、第三方包数、源码大小)",
+    "cli.help.weight_entry": "要检查的入口模块 (可重复); 默认: [tool.pyci-check.import-weight] entry-points 或 [project.scripts]",
+    "cli.help.weight_top": "列出最重的前 N 个模块 (默认: 10, 0 为不列出)",
+    "cli.help.weight_verbose": "同时列出连带加载的第三方包",
+    "cli.help.lazy_imports": "找出只在函数内使用的 top-level import, 按估计 import 成本排序 (警告级别)",
+    "cli.help.lazy_imports_min_size": "只列出估计 import 成本不低于此值的候选 (默认: 100KB)",
     "cli.help.deadcode": "扫描死代码",
     "cli.help.signature": "检查跨文件本地签名",
     "cli.help.install_hooks": "安装 Git hooks",
     "cli.help.uninstall_hooks": "移除 Git hooks",
     "cli.help.hook_type": "Hook 类型 (默认: pre-commit)",
+    "cli.help.cache": "管理结果缓存 (stats / gc / clear)",
+    "cli.help.cache_stats": "显示缓存容量与各阶段命中率",
+    "cli.help.cache_gc": "淘汰最久未使用的条目, 直到缓存符合容量上限",
+    "cli.help.cache_clear": "清除所有缓存结果",
+    "cli.help.cache_max_size": "容量上限 (例如 512MB); 默认: [tool.pyci-check] cache-max-size 或 256MB",
     "cli.examples": """示例:
   pyci-check syntax                                        # 仅检查语法
   pyci-check imports --i-understand-this-will-execute-code # 检查 import (会执行代码)
@@ -26,11 +52,17 @@ TRANSLATIONS = {
   pyci-check install-hooks                                 # 安装 pre-commit hook
   pyci-check install-hooks --type pre-push                 # 安装 pre-push hook
   pyci-check uninstall-hooks                               # 移除所有 hooks
+  pyci-check cache stats                                   # 显示缓存容量与命中率
+  pyci-check impact src/pkg/mod.py --tests                 # 列出受变更影响的测试
+  pyci-check graph --format dot --level package            # 导出包层级 import 图
+  pyci-check weight --entry pkg.cli                        # 估算 import pkg.cli 连带加载的量
 """,
     # Syntax check
     "syntax.no_files": "未找到 Python 文件",
     "syntax.checking": "检查 {} 个文件的语法...",
     "syntax.success": "✓ 所有文件语法正确",
+    "syntax.compile_mode": "编译模式: bytecode 写入 {}",
+    "syntax.target_version": "目标 Python 版本: {}",
     # Import check - execution
     "imports.checking": "检查 import 依赖...",
     "imports.pythonpath": "PYTHONPATH: {}",
@@ -49,6 +81,9 @@ TRANSLATIONS = {
     "imports.success": "✓ 所有 import 依赖正确",
     "imports.summary.failed_modules": "失败的模块数: {}",
     "imports.summary.total_errors": "总错误数量: {}",
+    "imports.profile.heaviest": "最重的模块 (import 耗时):",
+    "imports.profile.slowest": "最慢的间接 import (self time):",
+    "imports.profile.over_budget": "⚠️  {} 个模块超过 import 预算 {} ms (仅警告):",
     # Dependency check
     "dependency.checking": "检查依赖健康度...",
     "dependency.phantom": "❌ 幽灵依赖 (已使用但未宣告):",
@@ -57,6 +92,8 @@ TRANSLATIONS = {
     # Cycle check
     "cycles.checking": "检查循环引用...",
     "cycles.found": "❌ 发现 {} 个循环引用:",
+    "cycles.breaks": "  建议: 将以下 {} 个 import 语句移进函数 (或改为 TYPE_CHECKING) 即可打破所有循环:",
+    "cycles.break_component": "    [{}] 循环涉及 {} 个文件, 需移动 {} 个 import:",
     "cycles.success": "✓ 未发现循环引用",
     # Side Effects check
     "side_effects.checking": "检查全局副作用...",
@@ -76,6 +113,7 @@ TRANSLATIONS = {
     "check_all.imports_phase": "[2/7] Import 检查",
     "check_all.dependency_phase": "[3/7] 依赖健康度检查",
     "check_all.cycles_phase": "[4/7] 循环引用检查",
+    "check_all.contracts_phase": "[*] 架构契约检查",
     "check_all.signature_phase": "[5/7] 跨文件签名验证",
     "check_all.side_effects_phase": "[6/7] 全局副作用检查 (仅警告)",
     "check_all.deadcode_phase": "[7/7] 深层死代码扫描 (仅警告)",
@@ -124,6 +162,7 @@ TRANSLATIONS = {
     "imports.error.module_not_found": "静态分析找不到模块: {}",
     "imports.error.invalid_module_name": "Invalid module name: {}",
     "imports.error.import_timeout": "Import timeout ({}s)",
+    "imports.error.deadline_exceeded": "未执行: 已超过 import 阶段总时限 ({}s)",
     "imports.error.failed_to_execute": "Failed to execute Python: {}",
     "imports.error.unexpected_error": "Unexpected error: {}",
     # Syntax error messages
@@ -132,4 +171,39 @@ TRANSLATIONS = {
     "syntax.error.file_error": "File Error: {}",
     "syntax.error.unexpected_error": "Unexpected Error: {}",
     "syntax.error.exception": "Exception: {}",
+    # 缓存管理
+    "cache.location": "缓存: {}",
+    "cache.empty": "{} 没有缓存",
+    "cache.summary": "容量: {} ({} 个条目, 上限 {})",
+    "cache.phase_row": "  {:<24} {:>8} 个条目 {:>10}   命中率 {:>4} ({}/{})",
+    "cache.gc_done": "已淘汰 {} 个最久未使用的条目, 释放 {}",
+    "cache.gc_within_budget": "缓存容量 {} 未超过上限 {}, 无需淘汰",
+    "cache.cleared": "已清除缓存: {}",
+    # 影响分析
+    "impact.unknown_file": "警告: {} 不是项目 import 图中的 Python 文件",
+    "graph.written": "已写入 {} 个节点、{} 条边至 {}",
+    # 架构契约
+    "contracts.none": "未配置任何契约 ([[tool.pyci-check.contracts]])",
+    "contracts.checking": "检查 {} 个架构契约...",
+    "contracts.found": "❌ 发现 {} 个契约违规:",
+    "contracts.violation": "  [{}] {} 不得 import {}:",
+    "contracts.unmatched": "警告: 契约中的模块 {} 在项目中找不到任何文件",
+    "contracts.success": "✓ {} 个契约全部遵守",
+    "contracts.error.not_a_list": "配置错误: [tool.pyci-check] contracts 必须是 table 数组",
+    "contracts.error.not_a_table": "配置错误: 第 {} 个契约不是 table",
+    "contracts.error.unknown_type": "配置错误: 第 {} 个契约的 type {!r} 不支持 (可用: {})",
+    "contracts.error.missing_field": "配置错误: 契约 {!r} 缺少或配置了无效的 {}",
+    "contracts.error.nested_module": "配置错误: 契约 {!r} 中 {} 位于 {} 之内, 无法检查两者之间的 import",
+    # Import 成本
+    "weight.entry_points": "入口模块 (模块 / 本地模块数 / 第三方包数 / 源码大小):",
+    "weight.heaviest": "最重的前 {} 个模块:",
+    "weight.row": "  {:<48} {:>6} {:>4} {:>10}",
+    "weight.unknown_entry": "  警告: 入口模块 {} 不是本地模块",
+    "weight.over_budget": "    ❌ 超过 {}: {} > {}",
+    # 延迟 import 机会
+    "lazy_imports.checking": "寻找可延后的 top-level import (估计成本 >= {})...",
+    "lazy_imports.found": "⚠️  发现 {} 个只在函数内使用的 top-level import (仅警告):",
+    "lazy_imports.used_in": "      {} 只用于: {}",
+    "lazy_imports.hint": "  提示: 将这些 import 移进使用它们的函数 (或改为 lazy import) 可降低 import 成本。估计值为上限: 若模块在其他地方仍于 import 时加载, 实际节省较少。",
+    "lazy_imports.success": "✓ 未发现可延后的大型 import",
 }
@@ -9,16 +9,42 @@ TRANSLATIONS = {
     "cli.help.check_relative": "禁止相對導入 (發現時視為錯誤)",
     "cli.help.venv": "虛擬環境路徑 (如: . 或 /path/to/project)",
     "cli.help.i_understand": "我理解 import 檢查會實際載入並執行所有模組的程式碼",
+    "cli.help.profile_imports": "量測每個模組的 import 耗時 (-X importtime) 與 peak RSS (僅執行模式)",
+    "cli.help.import_budget_ms": "模組 import 耗時超過此毫秒數時發出警告 (僅執行模式)",
+    "cli.help.import_deadline": "execute 模式整個 import 階段的 wall-clock 預算 (秒)",
+    "cli.help.compile": "編譯為 bytecode (可抓到編譯期錯誤) 並寫入 pyc",
+    "cli.help.pyc_prefix": "pyc 樹根目錄 (PYTHONPYCACHEPREFIX 佈局); 預設為原始碼旁的 __pycache__",
+    "cli.help.pyc_invalidation": "pyc 失效模式 (預設 timestamp; 設定 SOURCE_DATE_EPOCH 時為 checked-hash)",
     "cli.help.subcommand": "子指令",
     "cli.help.syntax": "檢查 Python 語法",
     "cli.help.imports": "檢查 import 依賴",
     "cli.help.dependency": "檢查依賴健康度 (幽靈/冗餘依賴)",
     "cli.help.cycles": "檢查循環引用",
+    "cli.help.cycles_include_deferred": "函數內的 import 也視為循環引用的邊 (預設只看 import 時執行的邊)",
+    "cli.help.contracts": "檢查架構契約 ([[tool.pyci-check.contracts]])",
+    "cli.help.impact": "列出直接或間接 import 指定檔案的檔案 (供測試挑選)",
+    "cli.help.impact_files": "變更的檔案",
+    "cli.help.impact_tests": "只列出測試檔 (test_*.py / *_test.py)",
+    "cli.help.graph": "匯出 import 圖與節點指標 (fan-in/out、SCC、拓撲層、遞移 import 數)",
+    "cli.help.graph_format": "輸出格式 (預設: json)",
+    "cli.help.graph_level": "圖的粒度: file 或 package (預設: file)",
+    "cli.help.graph_output": "寫入指定檔案而非 stdout",
+    "cli.help.weight": "估算靜態 import 成本 (遞移模組數、第三方套件數、原始碼大小)",
+    "cli.help.weight_entry": "要檢查的入口模組 (可重複); 預設: [tool.pyci-check.import-weight] entry-points 或 [project.scripts]",
+    "cli.help.weight_top": "列出最重的前 N 個模組 (預設: 10, 0 為不列出)",
+    "cli.help.weight_verbose": "同時列出連帶載入的第三方套件",
+    "cli.help.lazy_imports": "找出只在函數內使用的 top-level import, 依估計 import 成本排序 (警告層級)",
+    "cli.help.lazy_imports_min_size": "只列出估計 import 成本不低於此值的候選 (預設: 100KB)",
     "cli.help.deadcode": "掃描死代碼",
     "cli.help.signature": "檢查跨檔案本地簽章",
     "cli.help.install_hooks": "安裝 Git hooks",
     "cli.help.uninstall_hooks": "移除 Git hooks",
     "cli.help.hook_type": "Hook 類型 (預設: pre-commit)",
+    "cli.help.cache": "管理結果快取 (stats / gc / clear)",
+    "cli.help.cache_stats": "顯示快取容量與各階段命中率",
+    "cli.help.cache_gc": "淘汰最久未使用的項目, 直到快取符合容量上限",
+    "cli.help.cache_clear": "清除所有快取結果",
+    "cli.help.cache_max_size": "容量上限 (例如 512MB); 預設: [tool.pyci-check] cache-max-size 或 256MB",
     "cli.examples": """範例:
   pyci-check syntax                                        # 僅檢查語法
   pyci-check imports --i-understand-this-will-execute-code # 檢查 import (會執行程式碼)
@@ -26,11 +52,17 @@ TRANSLATIONS = {
   pyci-check install-hooks                                 # 安裝 pre-commit hook
   pyci-check install-hooks --type pre-push                 # 安裝 pre-push hook
   pyci-check uninstall-hooks                               # 移除所有 hooks
+  pyci-check cache stats                                   # 顯示快取容量與命中率
+  pyci-check impact src/pkg/mod.py --tests                 # 列出受變更影響的測試
+  pyci-check graph --format dot --level package            # 匯出套件層級 import 圖
+  pyci-check weight --entry pkg.cli                        # 估算 import pkg.cli 連帶載入的量
 """,
     # Syntax check
     "syntax.no_files": "未找到 Python 檔案",
     "syntax.checking": "檢查 {} 個檔案的語法...",
     "syntax.success": "✓ 所有檔案語法正確",
+    "syntax.compile_mode": "編譯模式: bytecode 寫入 {}",
+    "syntax.target_version": "目標 Python 版本: {}",
     # Import check - execution
     "imports.checking": "檢查 import 依賴...",
     "imports.pythonpath": "PYTHONPATH: {}",
@@ -49,6 +81,9 @@ TRANSLATIONS = {
     "imports.success": "✓ 所有 import 依賴正確",
     "imports.summary.failed_modules": "失敗的模組數: {}",
     "imports.summary.total_errors": "總錯誤數量: {}",
+    "imports.profile.heaviest": "最重的模組 (import 耗時):",
+    "imports.profile.slowest": "最慢的間接 import (self time):",
+    "imports.profile.over_budget": "⚠️  {} 個模組超過 import 預算 {} ms (僅警告):",
     # Dependency check
     "dependency.checking": "檢查依賴健康度...",
     "dependency.phantom": "❌ 幽靈依賴 (已使用但未宣告):",
@@ -57,6 +92,8 @@ TRANSLATIONS = {
     # Cycle check
     "cycles.checking": "檢查循環引用...",
     "cycles.found": "❌ 發現 {} 個循環引用:",
+    "cycles.breaks": "  建議: 將以下 {} 個 import 敘述移進函數 (或改為 TYPE_CHECKING) 即可打破所有循環:",
+    "cycles.break_component": "    [{}] 循環涉及 {} 個檔案, 需移動 {} 個 import:",
     "cycles.success": "✓ 未發現循環引用",
     # Side Effects check
     "side_effects.checking": "檢查全局副作用...",
@@ -76,6 +113,7 @@ TRANSLATIONS = {
     "check_all.imports_phase": "[2/7] Import 檢查",
     "check_all.dependency_phase": "[3/7] 依賴健康度檢查",
     "check_all.cycles_phase": "[4/7] 循環引用檢查",
+    "check_all.contracts_phase": "[*] 架構契約檢查",
     "check_all.signature_phase": "[5/7] 跨檔案簽章驗證",
     "check_all.side_effects_phase": "[6/7] 全局副作用檢查 (僅警告)",
     "check_all.deadcode_phase": "[7/7] 深層死代碼掃描 (僅警告)",
@@ -124,6 +162,7 @@ TRANSLATIONS = {
     "imports.error.module_not_found": "靜態分析找不到模組: {}",
     "imports.error.invalid_module_name": "Invalid module name: {}",
     "imports.error.import_timeout": "Import timeout ({}s)",
+    "imports.error.deadline_exceeded": "未執行: 已超過 import 階段總時限 ({}s)",
     "imports.error.failed_to_execute": "Failed to execute Python: {}",
     "imports.error.unexpected_error": "Unexpected error: {}",
     # Syntax error messages
@@ -132,4 +171,39 @@ TRANSLATIONS = {
     "syntax.error.file_error": "File Error: {}",
     "syntax.error.unexpected_error": "Unexpected Error: {}",
     "syntax.error.exception": "Exception: {}",
+    # 快取管理
+    "cache.location": "快取: {}",
+    "cache.empty": "{} 沒有快取",
+    "cache.summary": "容量: {} ({} 個項目, 上限 {})",
+    "cache.phase_row": "  {:<24} {:>8} 個項目 {:>10}   命中率 {:>4} ({}/{})",
+    "cache.gc_done": "已淘汰 {} 個最久未使用的項目, 釋放 {}",
+    "cache.gc_within_budget": "快取容量 {} 未超過上限 {}, 無需淘汰",
+    "cache.cleared": "已清除快取: {}",
+    # 影響分析
+    "impact.unknown_file": "警告: {} 不是專案 import 圖中的 Python 檔案",
+    "graph.written": "已寫入 {} 個節點、{} 條邊至 {}",
+    # 架構契約
+    "contracts.none": "未設定任何契約 ([[tool.pyci-check.contracts]])",
+    "contracts.checking": "檢查 {} 個架構契約...",
+    "contracts.found": "❌ 發現 {} 個契約違規:",
+    "contracts.violation": "  [{}] {} 不得 import {}:",
+    "contracts.unmatched": "警告: 契約中的模組 {} 在專案中找不到任何檔案",
+    "contracts.success": "✓ {} 個契約全部遵守",
+    "contracts.error.not_a_list": "設定錯誤: [tool.pyci-check] contracts 必須是 table 陣列",
+    "contracts.error.not_a_table": "設定錯誤: 第 {} 個契約不是 table",
+    "contracts.error.unknown_type": "設定錯誤: 第 {} 個契約的 type {!r} 不支援 (可用: {})",
+    "contracts.error.missing_field": "設定錯誤: 契約 {!r} 缺少或設定了無效的 {}",
+    "contracts.error.nested_module": "設定錯誤: 契約 {!r} 中 {} 位於 {} 之內, 無法檢查兩者之間的 import",
+    # Import 成本
+    "weight.entry_points": "入口模組 (模組 / 本地模組數 / 第三方套件數 / 原始碼大小):",
+    "weight.heaviest": "最重的前 {} 個模組:",
+    "weight.row": "  {:<48} {:>6} {:>4} {:>10}",
+    "weight.unknown_entry": "  警告: 入口模組 {} 不是本地模組",
+    "weight.over_budget": "    ❌ 超過 {}: {} > {}",
+    # 延遲 import 機會
+    "lazy_imports.checking": "尋找可延後的 top-level import (估計成本 >= {})...",
+    "lazy_imports.found": "⚠️  發現 {} 個只在函數內使用的 top-level import (僅警告):",
+    "lazy_imports.used_in": "      {} 只用於: {}",
+    "lazy_imports.hint": "  提示: 將這些 import 移進使用它們的函數 (或改為 lazy import) 可降低 import 成本。估計值為上限: 若模組在其他地方仍於 import 時載入, 實際節省較少。",
+    "lazy_imports.success": "✓ 未發現可延後的大型 import",
 }
@@ -3,11 +3,22 @@
 
 透過純靜態 AST 分析，抓出本地專案中函數與類別呼叫時的參數不匹配錯誤。
 （例如：少傳必填參數、多傳了不存在的 kwargs 等）
+
+方法呼叫 (obj.method()) 依接收者推論: 方法內的 self / cls、函數內只以建構子賦值的區域變數
+(x = Foo())，再經 ClassHierarchy 預先攤平的 MRO 方法表找到定義。
+
+相對 import 依所在模組換算為絕對名稱; 經 __init__ 等模組重新匯出的名稱 (from pkg import helper)
+由 ModuleExports 沿模組層級的 import 綁定追到定義處, 兩者都只用第一階段已收集的資訊, 不另外解析檔案。
 """
 
 import ast
 import os
-from dataclasses import dataclass
+from collections.abc import Container, Iterator, Sequence
+from dataclasses import dataclass, field, replace
+from functools import partial
+from itertools import chain
+
+from pyci_check.utils import calculate_optimal_workers, map_chunks, should_use_thread_pool
 
 
 @dataclass
@@ -24,45 +35,211 @@ class Signature:
     has_varargs: bool
     has_varkw: bool
     is_method: bool = False
+    # classmethod / staticmethod: 經由類別存取 (Foo.m()、cls.m()) 時也不需另傳 self
+    binds_on_class: bool = False
+    # 有其他 decorator: 實際綁定的物件可能已被取代 (例如 @replaced_by_pep8(...)), 簽章不一定可信
+    is_wrapped: bool = False
 
     @property
     def all_arg_names(self) -> set[str]:
         return self.pos_arg_names | self.kwonly_args
 
 
-class DefinitionCollector(ast.NodeVisitor):
-    """第一階段：收集檔案內的函數與類別簽章."""
+@dataclass
+class ClassInfo:
+    """類別的繼承資訊 (第一階段收集, 供 ClassHierarchy 攤平)."""
+
+    bases: list[str]  # 基底類別完整名稱; 無法靜態解析的基底記為 ""
+    members: set[str]  # 類別本體直接定義的名稱 (方法、屬性), 會遮蔽基底的同名方法
+    has_constructor: bool  # 自行定義 __init__ / __new__, 或由 @dataclass 產生
+
+
+@dataclass
+class ModuleBindings:
+    """模組層級的 import 綁定 (第一階段收集, 供 ModuleExports 追蹤重新匯出)."""
 
-    def __init__(self, module_name: str):
+    names: dict[str, str] = field(default_factory=dict)  # 區域名稱 -> 完整名稱
+    stars: list[str] = field(default_factory=list)  # from x import * 的來源模組
+
+
+class ModuleExports:
+    """
+    沿模組層級 import 綁定追蹤重新匯出, 將名稱換成定義處的完整名稱.
+
+    例如 pkg/__init__.py 有 from .utils import helper 時, pkg.helper -> pkg.utils.helper。
+    結果以名稱記憶 (兩階段所有檔案共用), 同一個 import 在每個模組只需追一次。
+    """
+
+    def __init__(self, modules: dict[str, ModuleBindings], defined: Container[str]):
+        """
+        Args:
+            modules: 模組名稱 -> 模組層級 import 綁定 (專案內每個模組都有一筆)
+            defined: 已知定義的完整名稱 (簽章表), 追到這些名稱即停止
+        """
+        self.modules = modules
+        self.defined = defined
+        self._memo: dict[str, str] = {}
+
+    def canonical(self, name: str) -> str:
+        """名稱定義處的完整名稱; 不是經由重新匯出取得時原樣回傳."""
+        result = self._memo.get(name)
+        if result is None:
+            result = self._memo[name] = self._follow(name, set())
+        return result
+
+    def _follow(self, name: str, visiting: set[str]) -> str:
+        if name in self.defined or name in visiting:
+            return name
+        visiting.add(name)
+        parts = name.split(".")
+        # 最長的模組前綴: 下一段是該模組內的名稱
+        for i in range(len(parts) - 1, 0, -1):
+            bindings = self.modules.get(".".join(parts[:i]))
+            if bindings is None:
+                continue
+            target = bindings.names.get(parts[i])
+            if target is not None:
+                return self._follow(".".join([target, *parts[i + 1 :]]), visiting)
+            for source in bindings.stars:
+                resolved = self._follow(".".join([source, *parts[i:]]), visiting)
+                if resolved in self.defined:
+                    return resolved
+            break
+        return name
+
+
+# 屬性存取而非呼叫的 decorator: 不記錄簽章, 但名稱仍會遮蔽基底方法
+_PROPERTY_DECORATORS = frozenset({"property", "cached_property", "setter", "getter", "deleter"})
+# 不改變呼叫簽章的 decorator; 其他 decorator 都可能把函數換成別的物件
+_TRANSPARENT_DECORATORS = frozenset({"staticmethod", "classmethod", "abstractmethod", "overload", "override", "final"})
+
+
+def _decorator_name(node: ast.expr) -> str:
+    """取 decorator 的末段名稱 (@a.b.c(...) -> "c")."""
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return ""
+
+
+class _ImportResolver(ast.NodeVisitor):
+    """追蹤檔案內的 import, 將名稱解析為完整名稱 (兩階段共用)."""
+
+    def __init__(self, module_name: str, *, is_package: bool = False):
         self.module_name = module_name
+        self.is_package = is_package  # __init__.py: 相對 import 以模組本身為基準
+        # 追蹤檔案內的 import： local_name -> fully_qualified_name
+        # e.g., "safe_relpath" -> "pyci_check.utils.safe_relpath"
+        self.imports: dict[str, str] = {}
+
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            if alias.asname:
+                self._bind(alias.asname, alias.name)
+            else:
+                # import a.b.c 綁定 a
+                top = alias.name.split(".", 1)[0]
+                self._bind(top, top)
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        module = self._absolute_module(node)
+        if module is None:
+            self.generic_visit(node)
+            return
+
+        for alias in node.names:
+            if alias.name == "*":
+                self._bind_star(module)
+            else:
+                self._bind(alias.asname or alias.name, f"{module}.{alias.name}")
+        self.generic_visit(node)
+
+    def _absolute_module(self, node: ast.ImportFrom) -> str | None:
+        """計算 from 敘述的來源模組絕對名稱; 相對 import 超出頂層套件時回傳 None."""
+        if not node.level:
+            return node.module
+        parts = self.module_name.split(".")
+        if not self.is_package:
+            parts = parts[:-1]
+        if node.level - 1 >= len(parts):
+            return None
+        parts = parts[: len(parts) - (node.level - 1)]
+        return ".".join([*parts, node.module] if node.module else parts)
+
+    def _bind(self, local_name: str, full_name: str):
+        self.imports[local_name] = full_name
+
+    def _bind_star(self, module: str):
+        """記錄 star import 來源; 無法得知綁定的名稱, 由子類別決定是否保留."""
+
+    def _resolve_name(self, node: ast.expr) -> str | None:
+        """嘗試將 AST 節點解析為 Full Qualified Name."""
+        if isinstance(node, ast.Name):
+            # 1. 可能是 import 進來的
+            if node.id in self.imports:
+                return self.imports[node.id]
+            # 2. 可能是同一個檔案內定義的 (module.func)
+            return f"{self.module_name}.{node.id}"
+
+        if isinstance(node, ast.Attribute):
+            # 例如 os.path.join -> 我們先解析 os.path
+            base = self._resolve_name(node.value)
+            if base:
+                return f"{base}.{node.attr}"
+        return None
+
+
+class DefinitionCollector(_ImportResolver):
+    """第一階段：收集檔案內的函數與類別簽章."""
+
+    def __init__(self, module_name: str, *, is_package: bool = False):
+        super().__init__(module_name, is_package=is_package)
         # name -> Signature
         self.signatures: dict[str, Signature] = {}
+        # class name -> ClassInfo
+        self.classes: dict[str, ClassInfo] = {}
+        # 模組層級的 import 綁定 (可被其他模組重新匯出)
+        self.bindings = ModuleBindings()
         self.current_class: str | None = None
+        self.function_depth = 0
+
+    def _bind(self, local_name: str, full_name: str):
+        super()._bind(local_name, full_name)
+        if self.current_class is None and not self.function_depth:
+            self.bindings.names[local_name] = full_name
+
+    def _bind_star(self, module: str):
+        if self.current_class is None and not self.function_depth:
+            self.bindings.stars.append(module)
 
     def visit_ClassDef(self, node: ast.ClassDef):
         prev_class = self.current_class
         self.current_class = node.name
 
         # 檢查是否為 dataclass
-        is_dataclass = any(
-            (isinstance(d, ast.Name) and d.id == "dataclass") or (isinstance(d, ast.Call) and getattr(d.func, "id", "") == "dataclass")
-            for d in node.decorator_list
-        )
+        is_dataclass = any(_decorator_name(d) == "dataclass" for d in node.decorator_list)
+        self.classes[node.name] = self._class_info(node, is_dataclass=is_dataclass)
 
         if is_dataclass:
             # 蒐集所有的 field
             fields = [stmt.target.id for stmt in node.body if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name)]
+            # 有基底類別時可能繼承其他 dataclass 的 field, 本體看不到全部參數, 不限制數量與名稱
+            inherits_fields = bool(node.bases)
 
             self.signatures[node.name] = Signature(
                 module=self.module_name,
                 name=node.name,
                 min_pos=0,  # dataclass 的 default 值較難靜態推導，這裡放寬必填檢查
-                max_pos=len(fields),
+                max_pos=-1 if inherits_fields else len(fields),
                 pos_arg_names=set(fields),
                 kwonly_args=set(),
                 required_kwonly=set(),
-                has_varargs=False,
-                has_varkw=False,
+                has_varargs=inherits_fields,
+                has_varkw=inherits_fields,
             )
         else:
             # 預設一個空的建構子
@@ -81,16 +258,44 @@ class DefinitionCollector(ast.NodeVisitor):
         self.generic_visit(node)
         self.current_class = prev_class
 
+    def _class_info(self, node: ast.ClassDef, *, is_dataclass: bool) -> ClassInfo:
+        """解析基底類別 (Generic[T] 取 Generic; object 略過) 並收集類別本體定義的名稱."""
+        bases = []
+        for base in node.bases:
+            expr = base.value if isinstance(base, ast.Subscript) else base
+            if isinstance(expr, ast.Name) and expr.id == "object" and "object" not in self.imports:
+                continue
+            bases.append(self._resolve_name(expr) or "")
+
+        members: set[str] = set()
+        for stmt in node.body:
+            if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                members.add(stmt.name)
+            elif isinstance(stmt, ast.Assign):
+                members.update(target.id for target in stmt.targets if isinstance(target, ast.Name))
+            elif isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name):
+                members.add(stmt.target.id)
+        return ClassInfo(bases=bases, members=members, has_constructor=is_dataclass or bool(members & {"__init__", "__new__"}))
+
     def visit_FunctionDef(self, node: ast.FunctionDef):
         self._parse_function(node)
-        self.generic_visit(node)
+        self._visit_body(node)
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
         self._parse_function(node)
+        self._visit_body(node)
+
+    def _visit_body(self, node: ast.FunctionDef | ast.AsyncFunctionDef):
+        self.function_depth += 1
         self.generic_visit(node)
+        self.function_depth -= 1
 
     def _parse_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef):
         is_method = self.current_class is not None
+        decorators = {_decorator_name(d) for d in node.decorator_list}
+        if is_method and decorators & _PROPERTY_DECORATORS:
+            return
+        is_static = is_method and "staticmethod" in decorators
 
         # 收集參數
         pos_args = []
@@ -98,8 +303,8 @@ class DefinitionCollector(ast.NodeVisitor):
             pos_args.extend(node.args.posonlyargs)
         pos_args.extend(node.args.args)
 
-        # 扣掉 self/cls
-        if is_method and pos_args and not (node.name == "__new__" and not pos_args):
+        # 扣掉 self/cls (staticmethod 沒有)
+        if is_method and pos_args and not is_static:
             pos_args = pos_args[1:]
 
         pos_arg_names = {a.arg for a in pos_args}
@@ -131,6 +336,8 @@ class DefinitionCollector(ast.NodeVisitor):
             has_varargs=has_varargs,
             has_varkw=has_varkw,
             is_method=is_method,
+            binds_on_class=is_static or (is_method and "classmethod" in decorators),
+            is_wrapped=not decorators <= _TRANSPARENT_DECORATORS,
         )
 
         if is_method:
@@ -146,60 +353,277 @@ class DefinitionCollector(ast.NodeVisitor):
             self.signatures[node.name] = sig
 
 
-class CallValidator(ast.NodeVisitor):
+def _c3_merge(sequences: list[list[str]]) -> list[str] | None:
+    """C3 線性化的 merge 步驟; 基底順序不一致 (Python 會拒絕的繼承) 時回傳 None."""
+    sequences = [seq for seq in sequences if seq]
+    merged: list[str] = []
+    while sequences:
+        for seq in sequences:
+            head = seq[0]
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            return None
+        merged.append(head)
+        sequences = [rest for seq in sequences if (rest := seq[1:] if seq[0] == head else seq)]
+    return merged
+
+
+class ClassHierarchy:
+    """
+    專案內類別的繼承索引.
+
+    建立時一次以 C3 線性化 (MRO) 攤平每個類別的方法表與建構子來源, 第二階段每次查詢只是 dict 查找。
+    MRO 上遇到專案外 (或無法解析) 的基底後, 其後的名稱可能被該外部類別遮蔽, 一律視為未知。
+    """
+
+    def __init__(self, classes: dict[str, ClassInfo], exports: ModuleExports | None = None):
+        """
+        攤平所有類別.
+
+        Args:
+            classes: 類別完整名稱 -> ClassInfo
+            exports: 有提供時, 經重新匯出取得的基底類別名稱換成定義處
+        """
+        if exports is not None:
+            classes = {name: replace(info, bases=[exports.canonical(base) for base in info.bases]) for name, info in classes.items()}
+        # class -> {方法名稱: 定義該方法的簽章 key ("module.Class.method")}
+        self.methods: dict[str, dict[str, str]] = {}
+        # class -> 建構子簽章 key; None 代表建構子來自專案外的基底, 無法檢查
+        self.constructors: dict[str, str | None] = {}
+
+        linearized: dict[str, list[str]] = {}
+        for name in classes:
+            methods: dict[str, str] = {}
+            constructor: str | None = name  # 一路到 object 都沒有 __init__: 不接受參數
+            found_constructor = False
+            for owner in self._linearize(name, classes, linearized, set()):
+                info = classes.get(owner)
+                if info is None:
+                    if not found_constructor:
+                        constructor = None
+                    break
+                for member in info.members:
+                    methods.setdefault(member, f"{owner}.{member}")
+                if info.has_constructor and not found_constructor:
+                    constructor, found_constructor = owner, True
+            self.methods[name] = methods
+            self.constructors[name] = constructor
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.constructors
+
+    def _linearize(self, name: str, classes: dict[str, ClassInfo], linearized: dict[str, list[str]], visiting: set[str]) -> list[str]:
+        """計算 MRO; 專案外的類別視為沒有基底, 繼承成環時中斷該分支."""
+        if name in linearized:
+            return linearized[name]
+        info = classes.get(name)
+        if info is None or name in visiting:
+            return [name]
+        visiting.add(name)
+        sequences = [self._linearize(base, classes, linearized, visiting) for base in info.bases]
+        visiting.discard(name)
+        merged = _c3_merge([*sequences, list(info.bases)])
+        if merged is None:
+            merged = list(dict.fromkeys(chain.from_iterable(sequences)))
+        linearized[name] = [name, *merged]
+        return linearized[name]
+
+    def method(self, class_name: str, attr: str) -> str | None:
+        """類別 (含繼承) 上 attr 的簽章 key; 無法確定時回傳 None."""
+        return self.methods.get(class_name, {}).get(attr)
+
+    def constructor(self, class_name: str) -> str | None:
+        """呼叫類別時對應的建構子簽章 key; 建構子來自外部基底時回傳 None."""
+        return self.constructors.get(class_name)
+
+
+# 接收者型別: (類別完整名稱, 是否為實例); None 代表該名稱在此作用域被其他值遮蔽
+Receiver = tuple[str, bool]
+
+
+def _iter_scope(nodes: list[ast.stmt]) -> Iterator[ast.AST]:
+    """走訪單一作用域內的節點, 不進入巢狀函數 / 類別 / lambda 的本體 (但會產出該定義節點本身)."""
+    stack: list[ast.AST] = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
+        yield node
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)):
+            continue
+        stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
+
+class CallValidator(_ImportResolver):
     """第二階段：驗證檔案內的函數呼叫."""
 
-    def __init__(self, filepath: str, module_name: str, global_signatures: dict[str, Signature]):
+    def __init__(
+        self,
+        filepath: str,
+        module_name: str,
+        global_signatures: dict[str, Signature],
+        hierarchy: ClassHierarchy | None = None,
+        exports: ModuleExports | None = None,
+    ):
+        super().__init__(module_name, is_package=os.path.basename(filepath) == "__init__.py")
         self.filepath = filepath
-        self.module_name = module_name
         self.global_signatures = global_signatures
+        self.hierarchy = hierarchy or ClassHierarchy({})
+        self.exports = exports or ModuleExports({}, global_signatures)
         self.errors: list[dict] = []
 
-        # 追蹤檔案內的 import： local_name -> fully_qualified_name
-        # e.g., "safe_relpath" -> "pyci_check.utils.safe_relpath"
-        self.imports: dict[str, str] = {}
-
-    def visit_Import(self, node: ast.Import):
-        for alias in node.names:
-            local_name = alias.asname or alias.name
-            self.imports[local_name] = alias.name
-        self.generic_visit(node)
+        # 函數作用域堆疊: 區域名稱 -> 接收者型別
+        self.scopes: list[dict[str, Receiver | None]] = []
+        # 直接包住目前節點的 class (其中的函數才是方法)
+        self.enclosing_class: str | None = None
 
-    def visit_ImportFrom(self, node: ast.ImportFrom):
-        if not node.module or node.level > 0:
-            # 暫時略過相對導入的精確計算 (可以透過 level + module_name 算，但較複雜)
-            self.generic_visit(node)
-            return
-
-        for alias in node.names:
-            local_name = alias.asname or alias.name
-            self.imports[local_name] = f"{node.module}.{alias.name}"
+    def visit_ClassDef(self, node: ast.ClassDef):
+        prev_class = self.enclosing_class
+        self.enclosing_class = node.name
         self.generic_visit(node)
+        self.enclosing_class = prev_class
 
-    def _resolve_name(self, node: ast.expr) -> str | None:
-        """嘗試將 AST 節點解析為 Full Qualified Name."""
-        if isinstance(node, ast.Name):
-            # 1. 可能是 import 進來的
-            if node.id in self.imports:
-                return self.imports[node.id]
-            # 2. 可能是同一個檔案內定義的 (module.func)
-            return f"{self.module_name}.{node.id}"
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self._visit_function(node)
 
-        if isinstance(node, ast.Attribute):
-            # 例如 os.path.join -> 我們先解析 os.path
-            base = self._resolve_name(node.value)
-            if base:
-                return f"{base}.{node.attr}"
-        return None
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        self._visit_function(node)
+
+    def visit_Lambda(self, node: ast.Lambda):
+        # lambda 參數遮蔽外層同名變數
+        self.visit(node.args)
+        self.scopes.append(dict.fromkeys((a.arg for a in self._all_args(node.args)), None))
+        self.visit(node.body)
+        self.scopes.pop()
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef):
+        # decorator / 預設值 / annotation 在外層作用域求值
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        self.visit(node.args)
+        if node.returns:
+            self.visit(node.returns)
+
+        self.scopes.append(self._scope_receivers(node))
+        prev_class = self.enclosing_class
+        self.enclosing_class = None
+        for stmt in node.body:
+            self.visit(stmt)
+        self.enclosing_class = prev_class
+        self.scopes.pop()
+
+    @staticmethod
+    def _all_args(args: ast.arguments) -> list[ast.arg]:
+        return [*args.posonlyargs, *args.args, *args.kwonlyargs, *(a for a in (args.vararg, args.kwarg) if a)]
+
+    def _scope_receivers(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> dict[str, Receiver | None]:
+        """
+        推論函數作用域內名稱的接收者型別.
+
+        方法的第一個參數為所屬類別 (classmethod / __new__ 為類別本身, staticmethod 沒有);
+        區域變數只有在作用域內每次綁定都是同一個專案類別的建構子呼叫時才有型別 (不做流程分析)。
+
+        Returns:
+            區域名稱 -> 接收者型別 (None 代表遮蔽外層、型別未知)
+        """
+        receivers: dict[str, Receiver | None] = dict.fromkeys((a.arg for a in self._all_args(node.args)), None)
+        positional = [*node.args.posonlyargs, *node.args.args]
+        if self.enclosing_class is not None and positional:
+            class_name = f"{self.module_name}.{self.enclosing_class}"
+            decorators = {_decorator_name(d) for d in node.decorator_list}
+            if class_name in self.hierarchy and "staticmethod" not in decorators:
+                is_instance = "classmethod" not in decorators and node.name != "__new__"
+                receivers[positional[0].arg] = (class_name, is_instance)
+
+        constructed: dict[int, str | None] = {}  # id(賦值目標 Name) -> 建構的類別
+        bound: dict[str, set[str | None]] = {}
+        for child in _iter_scope(node.body):
+            if isinstance(child, (ast.Assign, ast.AnnAssign)):
+                targets = child.targets if isinstance(child, ast.Assign) else [child.target]
+                if len(targets) == 1 and isinstance(targets[0], ast.Name) and isinstance(child.value, ast.Call):
+                    class_name = self._qualify(child.value.func)
+                    constructed[id(targets[0])] = class_name if class_name in self.hierarchy else None
+            elif isinstance(child, ast.Name) and not isinstance(child.ctx, ast.Load):
+                bound.setdefault(child.id, set()).add(constructed.get(id(child)))
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                bound.setdefault(child.name, set()).add(None)
+            elif isinstance(child, (ast.Import, ast.ImportFrom)):
+                for alias in child.names:
+                    bound.setdefault((alias.asname or alias.name).partition(".")[0], set()).add(None)
+            elif isinstance(child, (ast.Global, ast.Nonlocal)):
+                for name in child.names:
+                    bound.setdefault(name, set()).add(None)
+            elif isinstance(child, (ast.ExceptHandler, ast.MatchAs, ast.MatchStar)) and child.name:
+                bound.setdefault(child.name, set()).add(None)
+            elif isinstance(child, ast.MatchMapping) and child.rest:
+                bound.setdefault(child.rest, set()).add(None)
+
+        for name, classes in bound.items():
+            only = next(iter(classes)) if len(classes) == 1 else None
+            receivers[name] = (only, True) if only is not None and name not in receivers else None
+        return receivers
+
+    def _qualify(self, node: ast.expr) -> str | None:
+        """解析為完整名稱, 並追蹤重新匯出到定義處."""
+        name = self._resolve_name(node)
+        return self.exports.canonical(name) if name else None
+
+    def _local_binding(self, name: str) -> tuple[bool, Receiver | None]:
+        """
+        查詢函數作用域內的綁定.
+
+        Returns:
+            (是否為區域綁定, 接收者型別); 區域綁定但型別未知時為 (True, None), 不在任何作用域為 (False, None)
+        """
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return True, scope[name]
+        return False, None
+
+    def _method_key(self, receiver: Receiver, attr: str) -> str | None:
+        """接收者上 attr 方法的簽章 key; 經類別存取的一般方法 (需另傳 self) 不檢查."""
+        class_name, is_instance = receiver
+        key = self.hierarchy.method(class_name, attr)
+        sig = self.global_signatures.get(key) if key else None
+        if sig is None or not (is_instance or sig.binds_on_class):
+            return None
+        return key
+
+    def _resolve_callee(self, func: ast.expr) -> str | None:
+        """將被呼叫的運算式解析為簽章表的 key; 無法確定時回傳 None."""
+        root = func
+        while isinstance(root, ast.Attribute):
+            root = root.value
+        if isinstance(root, ast.Name):
+            is_local, receiver = self._local_binding(root.id)
+            if is_local:
+                # 參數 / 區域變數遮蔽模組層級同名定義: 只有推論出型別的接收者才檢查
+                if receiver is None:
+                    return None
+                if func is root:
+                    class_name, is_instance = receiver
+                    return None if is_instance else self.hierarchy.constructor(class_name)
+                return self._method_key(receiver, func.attr) if func.value is root else None
+        if isinstance(func, ast.Attribute):
+            owner = self._qualify(func.value)
+            if owner in self.hierarchy:
+                return self._method_key((owner, False), func.attr)
+
+        full_name = self._qualify(func)
+        if full_name in self.hierarchy:
+            return self.hierarchy.constructor(full_name)
+        return full_name
 
     def visit_Call(self, node: ast.Call):
         self.generic_visit(node)
 
-        full_name = self._resolve_name(node.func)
+        full_name = self._resolve_callee(node.func)
         if not full_name or full_name not in self.global_signatures:
             return
 
         sig = self.global_signatures[full_name]
+        # 被 decorator 取代的定義 (不論直接呼叫、import 或經重新匯出): 實際簽章未知
+        if sig.is_wrapped:
+            return
 
         # 如果呼叫包含了 *args 或是 **kwargs，我們放棄嚴格檢查，避免誤判
         has_starred = any(isinstance(a, ast.Starred) for a in node.args)
@@ -299,6 +723,60 @@ def _get_module_name(filepath: str, project_dir: str, src_dirs: list[str]) -> st
     return best_mod or os.path.basename(filepath).removesuffix(".py")
 
 
+def _collect_signatures_chunk(
+    python_files: Sequence[str], project_dir: str, src_dirs: list[str]
+) -> tuple[dict[str, Signature], dict[str, ClassInfo], dict[str, ModuleBindings], list[tuple[str, str]]]:
+    """
+    並行版第一階段: 收集一個區塊檔案的簽章、類別繼承資訊與模組層級 import 綁定.
+
+    不回傳 AST (跨 subinterpreter 傳遞 AST 比重新解析還貴), 第二階段再解析一次。
+
+    Returns:
+        (完整名稱 -> Signature, 類別完整名稱 -> ClassInfo, 模組名 -> ModuleBindings, [(檔案, 模組名), ...])
+    """
+    from pyci_check.imports import read_file_with_encoding
+
+    signatures: dict[str, Signature] = {}
+    classes: dict[str, ClassInfo] = {}
+    modules: dict[str, ModuleBindings] = {}
+    parsed: list[tuple[str, str]] = []
+    for filepath in python_files:
+        code = read_file_with_encoding(filepath)
+        if not code:
+            continue
+        try:
+            tree = ast.parse(code)
+        except SyntaxError:
+            continue
+        mod_name = _get_module_name(filepath, project_dir, src_dirs)
+        collector = DefinitionCollector(mod_name, is_package=os.path.basename(filepath) == "__init__.py")
+        collector.visit(tree)
+        for local_name, sig in collector.signatures.items():
+            signatures[f"{mod_name}.{local_name}"] = sig
+        for local_name, info in collector.classes.items():
+            classes[f"{mod_name}.{local_name}"] = info
+        modules[mod_name] = collector.bindings
+        parsed.append((filepath, mod_name))
+    return signatures, classes, modules, parsed
+
+
+def _validate_calls_chunk(
+    files: Sequence[tuple[str, str]], global_signatures: dict[str, Signature], hierarchy: ClassHierarchy, exports: ModuleExports
+) -> list[dict]:
+    """並行版第二階段: 驗證一個區塊檔案內的呼叫."""
+    from pyci_check.imports import read_file_with_encoding
+
+    errors: list[dict] = []
+    for filepath, mod_name in files:
+        code = read_file_with_encoding(filepath)
+        if not code:
+            continue
+        validator = CallValidator(filepath, mod_name, global_signatures, hierarchy, exports)
+        validator.visit(ast.parse(code))
+        errors.extend(validator.errors)
+    return errors
+
+
 def check_signatures(python_files: list[str], project_dir: str, src_dirs: list[str]) -> list[dict]:
     """
     掃描專案，執行本地簽章驗證.
@@ -306,10 +784,15 @@ def check_signatures(python_files: list[str], project_dir: str, src_dirs: list[s
     Returns:
         包含錯誤資訊的列表
     """
+    if should_use_thread_pool(len(python_files), work_kind="cpu"):
+        return _check_signatures_parallel(python_files, project_dir, src_dirs)
+
     from pyci_check.imports import read_file_with_encoding
 
     # 1. 收集所有的簽章 (Full Qualified Name -> Signature)
     global_signatures: dict[str, Signature] = {}
+    global_classes: dict[str, ClassInfo] = {}
+    global_modules: dict[str, ModuleBindings] = {}
     file_asts = {}
     file_modules = {}
 
@@ -321,22 +804,52 @@ def check_signatures(python_files: list[str], project_dir: str, src_dirs: list[s
             tree = ast.parse(code)
             mod_name = _get_module_name(filepath, project_dir, src_dirs)
 
-            collector = DefinitionCollector(mod_name)
+            collector = DefinitionCollector(mod_name, is_package=os.path.basename(filepath) == "__init__.py")
             collector.visit(tree)
 
             for local_name, sig in collector.signatures.items():
                 global_signatures[f"{mod_name}.{local_name}"] = sig
+            for local_name, info in collector.classes.items():
+                global_classes[f"{mod_name}.{local_name}"] = info
+            global_modules[mod_name] = collector.bindings
 
             file_asts[filepath] = tree
             file_modules[filepath] = mod_name
         except SyntaxError:
             pass
 
-    # 2. 驗證所有檔案
+    # 2. 驗證所有檔案 (重新匯出索引與類別繼承索引只建一次, 所有檔案共用)
+    exports = ModuleExports(global_modules, global_signatures)
+    hierarchy = ClassHierarchy(global_classes, exports)
     all_errors = []
     for filepath, tree in file_asts.items():
-        validator = CallValidator(filepath, file_modules[filepath], global_signatures)
+        validator = CallValidator(filepath, file_modules[filepath], global_signatures, hierarchy, exports)
         validator.visit(tree)
         all_errors.extend(validator.errors)
 
     return all_errors
+
+
+def _check_signatures_parallel(python_files: list[str], project_dir: str, src_dirs: list[str]) -> list[dict]:
+    """大型專案: 兩階段各自分區塊並行 (thread 或 subinterpreter), 區塊間只交換簽章表與共用索引."""
+    workers = calculate_optimal_workers(len(python_files), work_kind="cpu")
+
+    global_signatures: dict[str, Signature] = {}
+    global_classes: dict[str, ClassInfo] = {}
+    global_modules: dict[str, ModuleBindings] = {}
+    parsed_files: list[tuple[str, str]] = []
+    for signatures, classes, modules, parsed in map_chunks(
+        partial(_collect_signatures_chunk, project_dir=project_dir, src_dirs=src_dirs), python_files, workers
+    ):
+        global_signatures.update(signatures)
+        global_classes.update(classes)
+        global_modules.update(modules)
+        parsed_files.extend(parsed)
+
+    exports = ModuleExports(global_modules, global_signatures)
+    hierarchy = ClassHierarchy(global_classes, exports)
+    all_errors: list[dict] = []
+    validate = partial(_validate_calls_chunk, global_signatures=global_signatures, hierarchy=hierarchy, exports=exports)
+    for errors in map_chunks(validate, parsed_files, workers):
+        all_errors.extend(errors)
+    return all_errors
@@ -1,12 +1,28 @@
 """檢查專案中所有 Python 檔案的語法是否正確."""
 
 import ast
+import contextlib
+import importlib.util
+import io
+import marshal
 import os
+import re
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import tempfile
+import tokenize
+from collections.abc import Sequence
+from functools import partial
 
-from pyci_check.i18n import t
-from pyci_check.utils import calculate_optimal_workers, get_exclude_dirs_set, safe_relpath, should_use_thread_pool, walk_python_files
+from pyci_check.cache import ContentCache
+from pyci_check.i18n import Message
+from pyci_check.utils import (
+    calculate_optimal_workers,
+    get_exclude_dirs_set,
+    map_chunks,
+    safe_relpath,
+    should_use_thread_pool,
+    walk_python_files,
+)
 
 
 def find_python_files(directory: str, exclude_dirs: list[str] | None = None) -> list[str]:
@@ -28,35 +44,292 @@ def find_python_files(directory: str, exclude_dirs: list[str] | None = None) ->
     return walk_python_files(directory, exclude_set, ignore_files)
 
 
-def check_file_syntax(file_path: str) -> tuple[bool, str]:
+# ast.parse 支援的最低 feature_version
+_MIN_FEATURE_VERSION = (3, 7)
+
+
+def _effective_feature_version(target_version: tuple[int, int] | None) -> tuple[int, int] | None:
+    """
+    目標版本 → ast.parse 的 feature_version.
+
+    高於執行中 interpreter 的目標沒有意義 (parser 本身不認得更新的語法), 視為不限制;
+    低於 parser 支援下限者以下限代替。
+    """
+    if target_version is None or target_version >= sys.version_info[:2]:
+        return None
+    return max(target_version, _MIN_FEATURE_VERSION)
+
+
+# PEP 701 (3.12) 放寬 f-string 的語法; 3.12+ 的 parser 即使指定 feature_version 也不會拒絕
+_PEP701_VERSION = (3, 12)
+# 可能含 f-string 的原始碼 (前綴 f / rf / fr, 不分大小寫)
+_FSTRING_PREFIX_RE = re.compile(r"(?<![\w])(?:[fF][rR]?|[rR][fF])['\"]")
+
+
+def _string_quote(token_text: str) -> str:
+    """字串 token (或 FSTRING_START) 的引號: 去掉前綴字母, 取三引號或單一引號字元."""
+    body = token_text.lstrip("rRbBuUfFtT")
+    return body[:3] if body[:3] in {'"""', "'''"} else body[:1]
+
+
+def find_pep701_fstring(source: str) -> tuple[int, int, str] | None:
+    """
+    找出 3.12 之前不合法的 f-string 寫法 (PEP 701).
+
+    3.12+ 的 tokenizer 把 f-string 拆成 FSTRING_START ... FSTRING_END, 替換欄位內的運算式為一般 token。
+    舊版 parser 把整個 f-string 當一個字串字面值, 因此替換欄位內不可以:
+    - 出現與外層相同的引號 (例如 f"{f"{x}"}"、f"{d["k"]}")
+    - 在字串中使用反斜線
+    - 出現註解
+
+    只在 3.12+ 執行時有意義 (更舊的 interpreter 本身就拒絕這些寫法, 也沒有 FSTRING_START token)。
+
+    Args:
+        source: 原始碼
+
+    Returns:
+        (行號, 欄位 (從 0 起算), 原因) 或 None
+    """
+    fstring_start = getattr(tokenize, "FSTRING_START", None)
+    if fstring_start is None or not _FSTRING_PREFIX_RE.search(source):
+        return None
+    fstring_end = tokenize.FSTRING_END
+    outer_quotes: list[str] = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(source).readline):
+            if token.type == fstring_end:
+                outer_quotes.pop()
+                continue
+            if outer_quotes and token.type in {tokenize.STRING, fstring_start}:
+                quote = _string_quote(token.string)
+                if any(quote[0] == outer[0] and (len(outer) == 1 or quote == outer) for outer in outer_quotes):
+                    return (
+                        token.start[0],
+                        token.start[1],
+                        "f-string: reusing the enclosing quote inside a replacement field requires Python 3.12+",
+                    )
+                if token.type == tokenize.STRING and "\\" in token.string:
+                    return token.start[0], token.start[1], "f-string: backslash in a replacement field requires Python 3.12+"
+            elif len(outer_quotes) > 1 and token.type == tokenize.FSTRING_MIDDLE and "\\" in token.line[token.start[1] : token.end[1]]:
+                # 巢狀 f-string 的文字部分也在外層的替換欄位內
+                return token.start[0], token.start[1], "f-string: backslash in a replacement field requires Python 3.12+"
+            elif outer_quotes and token.type == tokenize.COMMENT:
+                return token.start[0], token.start[1], "f-string: comment in a replacement field requires Python 3.12+"
+            if token.type == fstring_start:
+                outer_quotes.append(_string_quote(token.string))
+    except (tokenize.TokenError, SyntaxError):
+        return None
+    return None
+
+
+def _parse_for_target(source: str, file_path: str, feature_version: tuple[int, int] | None) -> ast.Module:
+    """
+    以目標版本解析; 目標低於 3.12 時另以 tokenize 檢查 parser 不會拒絕的 PEP 701 f-string.
+
+    Raises:
+        SyntaxError: 語法錯誤或使用目標版本不支援的語法
+    """
+    tree = ast.parse(source, filename=file_path, feature_version=feature_version)
+    if feature_version is not None and feature_version < _PEP701_VERSION and (found := find_pep701_fstring(source)):
+        lineno, col, reason = found
+        raise SyntaxError(reason, (file_path, lineno, col + 1, source.splitlines()[lineno - 1]))
+    return tree
+
+
+def check_file_syntax(
+    file_path: str,
+    target_version: tuple[int, int] | None = None,
+    content_cache: ContentCache | None = None,
+) -> tuple[bool, str]:
     """
     檢查單一檔案的語法 (優化版本 - 僅讀取一次).
 
     Args:
         file_path: 檔案路徑
+        target_version: 目標 Python 版本 (例如 (3, 11)); 使用較新版本才有的語法視為錯誤
+        content_cache: 內容快取 (選項需含 target_version); 只記錄通過的內容, 錯誤訊息含路徑不快取
 
     Returns:
         (是否正確, 錯誤訊息)
     """
+    is_valid, error = _check_file_syntax(file_path, target_version, content_cache)
+    return is_valid, str(error)
+
+
+def _check_file_syntax(
+    file_path: str, target_version: tuple[int, int] | None, content_cache: ContentCache | None
+) -> tuple[bool, Message | str]:
+    """檢查單一檔案語法的本體; 管線內使用, 錯誤為延遲翻譯的 Message."""
     try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+        key = None
+        if content_cache is not None and not content_cache.disabled:
+            key = content_cache.key_for(data)
+            if content_cache.get(key) is not None:
+                return True, ""
         # 使用 utf-8-sig 自動處理 BOM
-        with open(file_path, encoding="utf-8-sig") as f:
-            source = f.read()
-        ast.parse(source, filename=file_path)
+        source = data.decode("utf-8-sig")
+        _parse_for_target(source, file_path, _effective_feature_version(target_version))
+        if key is not None:
+            content_cache.put(key, True)
         return True, ""
 
     except SyntaxError as e:
-        return False, t("syntax.error.syntax_error", e)
+        return False, Message("syntax.error.syntax_error", e)
     except UnicodeDecodeError as e:
-        return False, t("syntax.error.encoding_error", e)
+        return False, Message("syntax.error.encoding_error", e)
     except OSError as e:
-        return False, t("syntax.error.file_error", e)
+        return False, Message("syntax.error.file_error", e)
     except Exception as e:
         # 預期外的錯誤,但仍需報告
-        return False, t("syntax.error.unexpected_error", e)
+        return False, Message("syntax.error.unexpected_error", e)
+
+
+# pyc 失效模式 (對應 py_compile.PycInvalidationMode)
+PYC_INVALIDATION_MODES = ("timestamp", "checked-hash", "unchecked-hash")
+
 
+def default_pyc_invalidation() -> str:
+    """與 py_compile 相同: 設定 SOURCE_DATE_EPOCH (reproducible build) 時改用 checked-hash."""
+    return "checked-hash" if os.environ.get("SOURCE_DATE_EPOCH") else "timestamp"
 
-def check_files_parallel(python_files: list[str]) -> tuple[int, int, list]:
+
+def pyc_path_for(source_path: str, pyc_prefix: str | None = None) -> str:
+    """
+    計算與 importlib 相同的 pyc 路徑.
+
+    等同 importlib.util.cache_from_source, 但 prefix 由參數決定而非全域 sys.pycache_prefix:
+    - 無 prefix: <dir>/__pycache__/<name>.<cache_tag>.pyc
+    - 有 prefix: <prefix>/<原絕對路徑目錄>/<name>.<cache_tag>.pyc (PYTHONPYCACHEPREFIX 佈局)
+    以 -O / -OO 執行時檔名加上 .opt-1 / .opt-2 (compile 預設沿用 sys.flags.optimize 的最佳化等級)。
+
+    Args:
+        source_path: .py 檔案路徑
+        pyc_prefix: pyc 樹根目錄 (可選)
+
+    Returns:
+        pyc 檔案路徑
+    """
+    head, tail = os.path.split(os.path.abspath(source_path))
+    base = tail.rpartition(".")[0] or tail
+    optimization = f".opt-{sys.flags.optimize}" if sys.flags.optimize else ""
+    filename = f"{base}.{sys.implementation.cache_tag}{optimization}.pyc"
+    if not pyc_prefix:
+        return os.path.join(head, "__pycache__", filename)
+    # Windows: C:\a\b → <prefix>\a\b (與 importlib 相同, 捨棄磁碟機代號)
+    head = os.path.splitdrive(head)[1].lstrip("\\/")
+    return os.path.join(os.path.abspath(pyc_prefix), head, filename)
+
+
+def _pyc_header(source_bytes: bytes, source_stat: os.stat_result, invalidation: str) -> bytes:
+    """PEP 552 pyc header: magic + flags + (mtime, size) 或 source hash."""
+    if invalidation == "timestamp":
+        return (
+            importlib.util.MAGIC_NUMBER
+            + (0).to_bytes(4, "little")
+            + (int(source_stat.st_mtime) & 0xFFFFFFFF).to_bytes(4, "little")
+            + (source_stat.st_size & 0xFFFFFFFF).to_bytes(4, "little")
+        )
+    flags = 0b01 | (0b10 if invalidation == "checked-hash" else 0)
+    return importlib.util.MAGIC_NUMBER + flags.to_bytes(4, "little") + importlib.util.source_hash(source_bytes)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """寫入暫存檔再 os.replace: 並行的 interpreter 不會讀到寫一半的 pyc."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".pyci-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def compile_file(
+    file_path: str,
+    pyc_prefix: str | None = None,
+    invalidation: str | None = None,
+    target_version: tuple[int, int] | None = None,
+) -> tuple[bool, str]:
+    """
+    編譯單一檔案為 bytecode 並寫入 pyc (編譯模式的語法檢查).
+
+    比 ast.parse 多抓到只在編譯期才報的錯誤 (例如 'return' outside function、
+    nonlocal 找不到綁定、重複參數)。寫出的 pyc 與 importlib 相容, 之後 import / pytest 可直接使用。
+    既有 pyc 的 header 與原始碼相符時視為已通過 (上次編譯成功), 不重新編譯。
+    指定 target_version 時, 以該版本解析一次 AST 並直接編譯同一棵 AST (不重複解析);
+    pyc 不記錄目標版本, 因此即使 pyc 已是最新仍會做版本解析。
+
+    Args:
+        file_path: 檔案路徑
+        pyc_prefix: pyc 樹根目錄; None 則寫到原始碼旁的 __pycache__
+        invalidation: "timestamp" / "checked-hash" / "unchecked-hash"; None 依 SOURCE_DATE_EPOCH 決定
+        target_version: 目標 Python 版本 (例如 (3, 11))
+
+    Returns:
+        (是否正確, 錯誤訊息)
+    """
+    is_valid, error = _compile_file(file_path, pyc_prefix, invalidation, target_version)
+    return is_valid, str(error)
+
+
+def _compile_file(
+    file_path: str, pyc_prefix: str | None, invalidation: str | None, target_version: tuple[int, int] | None
+) -> tuple[bool, Message | str]:
+    """編譯單一檔案的本體; 管線內使用, 錯誤為延遲翻譯的 Message."""
+    invalidation = invalidation or default_pyc_invalidation()
+    try:
+        with open(file_path, "rb") as f:
+            source_bytes = f.read()
+            source_stat = os.fstat(f.fileno())
+        header = _pyc_header(source_bytes, source_stat, invalidation)
+        pyc_path = pyc_path_for(file_path, pyc_prefix)
+        up_to_date = False
+        with contextlib.suppress(OSError), open(pyc_path, "rb") as f:
+            up_to_date = f.read(len(header)) == header
+
+        feature_version = _effective_feature_version(target_version)
+        if feature_version is None:
+            if up_to_date:
+                return True, ""
+            # bytes 交給 compile: 自行處理 BOM 與 coding cookie, 與 import 行為一致
+            code = compile(source_bytes, file_path, "exec", dont_inherit=True)
+        else:
+            tree = _parse_for_target(importlib.util.decode_source(source_bytes), file_path, feature_version)
+            if up_to_date:
+                return True, ""
+            code = compile(tree, file_path, "exec", dont_inherit=True)
+        # 唯讀檔案系統等: 編譯已成功, 只是無法寫入快取
+        with contextlib.suppress(OSError):
+            _write_atomic(pyc_path, header + marshal.dumps(code))
+        return True, ""
+
+    except SyntaxError as e:
+        return False, Message("syntax.error.syntax_error", e)
+    except (UnicodeDecodeError, ValueError) as e:
+        # compile 對無法解碼的原始碼拋 SyntaxError 或 ValueError (含 null byte)
+        return False, Message("syntax.error.encoding_error", e)
+    except OSError as e:
+        return False, Message("syntax.error.file_error", e)
+    except Exception as e:
+        # 預期外的錯誤,但仍需報告
+        return False, Message("syntax.error.unexpected_error", e)
+
+
+def check_files_parallel(
+    python_files: list[str],
+    *,
+    compile_mode: bool = False,
+    pyc_prefix: str | None = None,
+    invalidation: str | None = None,
+    target_version: tuple[int, int] | None = None,
+    cache_dir: str | None = None,
+) -> tuple[int, int, list]:
     """
     檢查多個檔案的語法 (自適應並行).
 
@@ -65,6 +338,11 @@ def check_files_parallel(python_files: list[str]) -> tuple[int, int, list]:
 
     Args:
         python_files: Python 檔案列表
+        compile_mode: True 則編譯為 bytecode 並寫入 pyc (見 compile_file)
+        pyc_prefix: 編譯模式的 pyc 樹根目錄
+        invalidation: 編譯模式的 pyc 失效模式
+        target_version: 目標 Python 版本 (例如 (3, 11))
+        cache_dir: 快取目錄; 指定時內容未變的檔案不重新解析 (編譯模式改由 pyc header 判斷)
 
     Returns:
         (成功數量, 錯誤數量, 錯誤列表)
@@ -73,38 +351,73 @@ def check_files_parallel(python_files: list[str]) -> tuple[int, int, list]:
         return 0, 0, []
 
     current_dir = os.getcwd()
-    errors: list[tuple[str, str]] = []
+    errors: list[tuple[str, Message | str]] = []
     success_count = 0
 
     if should_use_thread_pool(len(python_files), work_kind="cpu"):
-        max_workers = calculate_optimal_workers(len(python_files))
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_file = {executor.submit(check_file_syntax, fp): fp for fp in python_files}
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    is_valid, error_msg = future.result()
-                    if is_valid:
-                        success_count += 1
-                    else:
-                        errors.append((safe_relpath(file_path, current_dir), error_msg))
-                except Exception as exc:
-                    errors.append((safe_relpath(file_path, current_dir), t("syntax.error.exception", exc)))
+        max_workers = calculate_optimal_workers(len(python_files), work_kind="cpu")
+        # 區塊化: 每個 thread 自己累積成功數與錯誤, 最後依檔案順序合併
+        chunk_func = partial(
+            _check_files_chunk,
+            current_dir=current_dir,
+            compile_mode=compile_mode,
+            pyc_prefix=pyc_prefix,
+            invalidation=invalidation,
+            target_version=target_version,
+            cache_dir=cache_dir,
+        )
+        for chunk_success, chunk_errors in map_chunks(chunk_func, python_files, max_workers):
+            success_count += chunk_success
+            errors.extend(chunk_errors)
     else:
         # 小 repo serial: 省 thread bootstrap 開銷
-        for fp in python_files:
-            try:
-                is_valid, error_msg = check_file_syntax(fp)
-                if is_valid:
-                    success_count += 1
-                else:
-                    errors.append((safe_relpath(fp, current_dir), error_msg))
-            except Exception as exc:
-                errors.append((safe_relpath(fp, current_dir), t("syntax.error.exception", exc)))
+        success_count, errors = _check_files_chunk(
+            python_files,
+            current_dir,
+            compile_mode=compile_mode,
+            pyc_prefix=pyc_prefix,
+            invalidation=invalidation,
+            target_version=target_version,
+            cache_dir=cache_dir,
+        )
 
     return success_count, len(errors), errors
 
 
+def _check_files_chunk(
+    file_paths: Sequence[str],
+    current_dir: str,
+    *,
+    compile_mode: bool = False,
+    pyc_prefix: str | None = None,
+    invalidation: str | None = None,
+    target_version: tuple[int, int] | None = None,
+    cache_dir: str | None = None,
+) -> tuple[int, list[tuple[str, Message | str]]]:
+    """檢查一個區塊的檔案, 結果累積在此 thread 私有的計數與 list."""
+    content_cache = None
+    if cache_dir is not None and not compile_mode:
+        content_cache = ContentCache(cache_dir, "syntax", options=repr(_effective_feature_version(target_version)))
+    success_count = 0
+    errors: list[tuple[str, Message | str]] = []
+    for fp in file_paths:
+        try:
+            if compile_mode:
+                is_valid, error_msg = _compile_file(fp, pyc_prefix, invalidation, target_version)
+            else:
+                is_valid, error_msg = _check_file_syntax(fp, target_version, content_cache)
+            if is_valid:
+                success_count += 1
+            else:
+                errors.append((safe_relpath(fp, current_dir), error_msg))
+        except Exception as exc:
+            errors.append((safe_relpath(fp, current_dir), Message("syntax.error.exception", exc)))
+    if content_cache is not None:
+        content_cache.flush()
+        content_cache.close()
+    return success_count, errors
+
+
 def main() -> None:
     """主程式."""
     current_dir = os.getcwd()
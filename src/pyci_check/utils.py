@@ -1,11 +1,15 @@
 """共用工具函數."""
 
 import fnmatch
+import functools
 import os
+import pickle
 import sys
 import sysconfig
-from functools import lru_cache
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TypeVar
 
 
 # Free-threaded build 偵測 (PEP 703, **Python 3.13t / 3.14t / ...** — 必須是含 't' 後綴的 build)。
@@ -23,6 +27,9 @@ def _is_free_threaded_build() -> bool:
 
 IS_FREE_THREADED: bool = _is_free_threaded_build()
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 def should_use_thread_pool(task_count: int, work_kind: str = "cpu") -> bool:
     """
@@ -47,22 +54,219 @@ def should_use_thread_pool(task_count: int, work_kind: str = "cpu") -> bool:
     return task_count >= 200
 
 
-def calculate_optimal_workers(task_count: int) -> int:
+def calculate_optimal_workers(task_count: int, work_kind: str = "io") -> int:
     """
     計算最佳的 worker 數量.
 
     Args:
         task_count: 任務數量
+        work_kind: "cpu" 或 "io"
 
     Returns:
         最佳的 worker 數量
     """
+    if work_kind == "cpu" and (IS_FREE_THREADED or parallel_backend() == "interpreter"):
+        # 真並行的 CPU-bound 工作: 超過實體可用核心只會增加切換與 cache 抖動
+        return max(1, min(_usable_cpu_count(), task_count))
     cpu_count = os.cpu_count() or 1
     # I/O 密集: CPU * 2,上限 32
     return max(1, min(cpu_count * 2, 32, task_count))
 
 
-@lru_cache(maxsize=1)
+def chunk_evenly(items: Sequence[T], chunk_count: int) -> list[Sequence[T]]:
+    """
+    把 items 切成至多 chunk_count 個連續、大小相差不超過 1 的區塊.
+
+    Args:
+        items: 要切分的序列
+        chunk_count: 區塊數上限
+
+    Returns:
+        區塊列表 (保持原順序, 不含空區塊)
+    """
+    chunk_count = max(1, min(chunk_count, len(items)))
+    size, extra = divmod(len(items), chunk_count)
+    chunks: list[Sequence[T]] = []
+    start = 0
+    for i in range(chunk_count):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def map_chunks(func: Callable[[Sequence[T]], R], items: Sequence[T], max_workers: int) -> list[R]:
+    """
+    以區塊為單位並行處理: 每個區塊在單一 worker 內累積結果, 全部完成後由呼叫端合併.
+
+    相較每個項目一個 future, 區塊化省下大量 future / queue 同步,
+    且 worker 之間不共享任何可變狀態 (free-threaded build 上不會互搶同一個 list / set)。
+    區塊數取 worker * 4, 讓大小不一的檔案仍能平均分攤。
+    worker 由 parallel_backend() 決定是 thread 或 subinterpreter; 後者要求 func 為可 pickle 的
+    模組層級函式 (或其 partial), 區塊與結果也以 pickle 傳遞。
+
+    Args:
+        func: 處理單一區塊並回傳該區塊累積結果的函式
+        items: 全部項目
+        max_workers: 最大並行數
+
+    Returns:
+        各區塊結果, 順序與 items 一致
+    """
+    chunks = chunk_evenly(items, max_workers * 4)
+    if max_workers <= 1 or len(chunks) <= 1:
+        return [func(chunk) for chunk in chunks]
+    executor_cls = ThreadPoolExecutor
+    if parallel_backend() == "interpreter" and _is_shareable(func):
+        executor_cls = _interpreter_pool_class()
+    with executor_cls(max_workers=max_workers) as executor:
+        return list(executor.map(func, chunks))
+
+
+def compute_once(func: Callable[[], R]) -> Callable[[], R]:
+    """
+    無參數函式的無鎖記憶化 (取代 lru_cache(maxsize=1)).
+
+    lru_cache 每次呼叫都要進入同一個 cache 物件的臨界區; free-threaded build 上熱路徑
+    (每個模組 / 每個目錄都會呼叫) 會在此互搶。這裡只讀一個 closure 變數:
+    首次並行呼叫可能重複計算, 但結果相同且不可變, 最後寫入者勝出也無妨。
+    """
+    result: list[R] = []
+
+    @functools.wraps(func)
+    def wrapper() -> R:
+        if result:
+            return result[0]
+        value = func()
+        result[:] = [value]
+        return value
+
+    def cache_clear() -> None:
+        result.clear()
+
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+# 環境變數: auto (預設) / thread / interpreter
+PARALLEL_BACKEND_ENV = "PYCI_CHECK_BACKEND"
+
+
+def _interpreter_pool_class() -> type | None:
+    """PEP 734 subinterpreter pool (Python 3.14+); 不支援時回傳 None."""
+    try:
+        from concurrent.futures import InterpreterPoolExecutor
+    except ImportError:
+        return None
+    return InterpreterPoolExecutor
+
+
+def _probe_interpreter_worker() -> bool:
+    """在 subinterpreter 內執行: 確認 pyci_check 與其依賴可在隔離的 interpreter 載入."""
+    import pyci_check.imports  # noqa: F401
+
+    return True
+
+
+def _is_shareable(func: Callable) -> bool:
+    """
+    Subinterpreter 之間以 pickle 傳遞函式; lambda / closure 無法傳遞時改用 thread.
+
+    partial 只檢查底層函式 (以模組 + 名稱參照, 成本固定): 綁定的參數可能是整份簽章表,
+    為了探測而整個序列化一次太貴, 參數本身由呼叫端保證為可 pickle 的資料。
+    """
+    try:
+        pickle.dumps(func.func if isinstance(func, functools.partial) else func)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+    return True
+
+
+@compute_once
+def parallel_backend() -> str:
+    """
+    CPU-bound 階段 (ast.parse 類) 的並行後端.
+
+    - free-threaded build: "thread" (thread 已是真並行, 不需付 interpreter 啟動成本)
+    - GIL build + Python 3.14+: "interpreter" (PEP 684 每個 subinterpreter 有自己的 GIL,
+      不需 spawn process; 首次使用時實際啟動一個 interpreter 驗證可用)
+    - 其他: "thread"
+
+    可用環境變數 PYCI_CHECK_BACKEND=thread / interpreter 強制指定; 指定 interpreter 但不支援時仍退回 thread。
+
+    Returns:
+        "thread" 或 "interpreter"
+    """
+    requested = os.environ.get(PARALLEL_BACKEND_ENV, "auto").strip().lower()
+    if requested == "thread" or (requested != "interpreter" and IS_FREE_THREADED):
+        return "thread"
+    pool_cls = _interpreter_pool_class()
+    if pool_cls is None:
+        return "thread"
+    try:
+        with pool_cls(max_workers=1) as pool:
+            pool.submit(_probe_interpreter_worker).result(timeout=30)
+    except Exception:
+        # 某些 C extension 不支援 subinterpreter, 或 pyci_check 不在預設 sys.path
+        return "thread"
+    return "interpreter"
+
+
+def _usable_cpu_count() -> int:
+    """目前 process 可用的 CPU 數 (尊重 affinity / cgroup cpuset), 扣掉系統 1 分鐘負載 (至少保留一半)."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        # macOS / Windows 沒有 sched_getaffinity
+        cpus = os.cpu_count() or 1
+    try:
+        load = os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return cpus
+    return max(1, cpus // 2, cpus - int(load))
+
+
+def _available_memory_kb() -> int | None:
+    """可用實體記憶體 (KB); 無法量測的平台回傳 None."""
+    # Linux: MemAvailable 含可回收的 page cache, 比 free pages 準
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def calculate_execute_workers(task_count: int, per_worker_rss_kb: int | None = None) -> int:
+    """
+    計算 execute 模式 (每模組一個 subprocess) 的 worker 數.
+
+    上限由實測資源決定而非固定值:
+    - CPU: 可用 CPU * 2 (subprocess 啟動有大量 I/O 等待)
+    - 記憶體: 可用記憶體的 75% / 單一 worker 歷史 peak RSS
+
+    Args:
+        task_count: 任務數量
+        per_worker_rss_kb: 歷史量測的單一 import subprocess peak RSS (KB), None 表示尚未量測
+
+    Returns:
+        worker 數量
+    """
+    workers = _usable_cpu_count() * 2
+    if per_worker_rss_kb:
+        available_kb = _available_memory_kb()
+        if available_kb is not None:
+            workers = min(workers, available_kb * 3 // 4 // per_worker_rss_kb)
+    return max(1, min(workers, task_count))
+
+
+@compute_once
 def get_exclude_dirs_set() -> frozenset[str]:
     """取得預設排除目錄集合 (快取)."""
     return frozenset(
@@ -102,6 +306,31 @@ def should_exclude_path(file_path: str, exclude_dirs: frozenset[str]) -> bool:
     return False
 
 
+def iter_python_files(
+    directory: str,
+    exclude_dirs: frozenset[str],
+    ignore_files: frozenset[str] = frozenset(),
+) -> Iterator[str]:
+    """
+    walk_python_files 的惰性版本: 邊走訪邊產出, 不先收集整個列表.
+
+    同一目錄內依檔名排序、子目錄依名稱排序, 產出順序穩定 (但不等於全域排序)。
+
+    Args:
+        directory: 要搜尋的目錄
+        exclude_dirs: 排除目錄集合 (支援萬用字元如 *.egg-info)
+        ignore_files: 排除檔名集合 (basename match)
+
+    Yields:
+        .py 檔案路徑
+    """
+    for dirpath, dirnames, filenames in os.walk(directory, followlinks=False):
+        dirnames[:] = sorted(d for d in dirnames if not any(fnmatch.fnmatch(d, pattern) for pattern in exclude_dirs))
+        for f in sorted(filenames):
+            if f.endswith(".py") and f not in ignore_files:
+                yield os.path.join(dirpath, f)
+
+
 def walk_python_files(
     directory: str,
     exclude_dirs: frozenset[str],
@@ -0,0 +1,276 @@
+"""
+靜態 import 成本估算 (Import Weight).
+
+以 import 圖 + site-packages 索引估算每個模組被 import 時連帶載入的量:
+- modules: 遞移閉包內的本地模組數 (含自身)
+- third_party: 閉包內直接 import 的第三方套件 (以 dist-info 對應到發行套件名)
+- source_bytes: 閉包內本地原始碼總位元組數
+
+不執行任何程式碼, 作為 CLI / serverless 冷啟動時間的廉價替代指標; 入口模組
+([project.scripts] 或 [tool.pyci-check.import-weight] entry-points) 超過預算時回報錯誤。
+"""
+
+import contextlib
+import importlib.machinery
+import os
+import sys
+import sysconfig
+import tomllib
+from dataclasses import dataclass, field
+from functools import cache
+from itertools import compress
+
+from pyci_check.cache import parse_size
+from pyci_check.dependency import _find_site_packages, get_module_package_index
+from pyci_check.graph import ImportGraph, condensation
+from pyci_check.imports import _stdlib_top_levels, find_pyproject_toml
+
+# bin() 字串 '0' / '1' → 0 / 1, 供 itertools.compress 當 selector
+_BIT_SELECTORS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+@dataclass
+class ImportWeight:
+    """單一模組的遞移 import 成本."""
+
+    module: str
+    file: str
+    modules: int
+    third_party: list[str]
+    source_bytes: int
+    # 閉包內 import 的非 stdlib 外部頂層模組名 (third_party 為其對應的發行套件)
+    external: list[str] = field(default_factory=list)
+
+
+@dataclass
+class WeightBudget:
+    """入口模組的 import 成本預算; None 表示不限制."""
+
+    entry_points: list[str] = field(default_factory=list)
+    max_modules: int | None = None
+    max_packages: int | None = None
+    max_bytes: int | None = None
+
+
+def _positive_int(value: object) -> int | None:
+    return value if isinstance(value, int) and not isinstance(value, bool) and value > 0 else None
+
+
+def load_weight_budget(project_dir: str) -> WeightBudget:
+    """
+    讀取 [tool.pyci-check.import-weight]; 未設定 entry-points 時使用 [project.scripts] / [project.gui-scripts] 的模組.
+
+    Returns:
+        WeightBudget
+    """
+    pyproject_path = find_pyproject_toml(project_dir)
+    if not pyproject_path:
+        return WeightBudget()
+    try:
+        with open(pyproject_path, "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return WeightBudget()
+
+    config = data.get("tool", {}).get("pyci-check", {}).get("import-weight", {})
+    if not isinstance(config, dict):
+        config = {}
+    entry_points = config.get("entry-points")
+    if isinstance(entry_points, str):
+        entry_points = [entry_points]
+    if not isinstance(entry_points, list):
+        # "pkg.cli:main" → "pkg.cli"
+        project = data.get("project", {})
+        scripts = {**project.get("scripts", {}), **project.get("gui-scripts", {})}
+        entry_points = sorted({value.split(":", 1)[0].strip() for value in scripts.values() if isinstance(value, str)})
+
+    max_bytes = None
+    if "max-bytes" in config:
+        try:
+            max_bytes = parse_size(config["max-bytes"])
+        except (ValueError, TypeError):
+            max_bytes = None
+    return WeightBudget(
+        entry_points=[ep for ep in entry_points if isinstance(ep, str) and ep],
+        max_modules=_positive_int(config.get("max-modules")),
+        max_packages=_positive_int(config.get("max-packages")),
+        max_bytes=max_bytes,
+    )
+
+
+def compute_import_weights(graph: ImportGraph, module_to_packages: dict[str, list[str]]) -> dict[str, ImportWeight]:
+    """
+    計算每個本地模組的遞移 import 成本.
+
+    在 SCC 縮點 DAG 上依相依順序傳遞兩個位元集合 (本地檔案 / 外部頂層模組), 同一 SCC 共用結果;
+    原始碼位元組數以 itertools.compress 對檔案位元集合加總 (C 層迴圈)。
+
+    Args:
+        graph: import 圖
+        module_to_packages: 頂層模組名 → 發行套件名 (dependency.get_module_package_index)
+
+    Returns:
+        {檔案絕對路徑: ImportWeight}
+    """
+    components, _, dag = condensation(graph.edges)
+    stdlib = _stdlib_top_levels()
+
+    # 檔案位元依元件順序連續排列
+    file_order = [fp for members in components for fp in members]
+    sizes = []
+    for fp in file_order:
+        try:
+            sizes.append(os.path.getsize(fp))
+        except OSError:
+            sizes.append(0)
+
+    external_bit: dict[str, int] = {}
+    externals: list[str] = []
+
+    def externals_of(fp: str) -> int:
+        bits = 0
+        for top in graph.external.get(fp, ()):
+            if top in stdlib:
+                continue
+            if top not in external_bit:
+                external_bit[top] = len(externals)
+                externals.append(top)
+            bits |= 1 << external_bit[top]
+        return bits
+
+    file_reach: list[int] = []
+    external_reach: list[int] = []
+    offset = 0
+    for idx, members in enumerate(components):
+        files = ((1 << len(members)) - 1) << offset
+        offset += len(members)
+        tops = 0
+        for fp in members:
+            tops |= externals_of(fp)
+        for dep in dag[idx]:
+            files |= file_reach[dep]
+            tops |= external_reach[dep]
+        file_reach.append(files)
+        external_reach.append(tops)
+
+    weights: dict[str, ImportWeight] = {}
+    for idx, members in enumerate(components):
+        files = file_reach[idx]
+        selectors = bin(files)[:1:-1].encode().translate(_BIT_SELECTORS)
+        source_bytes = sum(compress(sizes, selectors))
+        tops = sorted(externals[i] for i, bit in enumerate(bin(external_reach[idx])[:1:-1]) if bit == "1")
+        third_party = sorted({pkg for top in tops for pkg in module_to_packages.get(top, [top])})
+        for fp in members:
+            weights[fp] = ImportWeight(
+                module=graph.modules[fp],
+                file=fp,
+                modules=files.bit_count(),
+                third_party=third_party,
+                source_bytes=source_bytes,
+                external=tops,
+            )
+    return weights
+
+
+def import_weights_for_project(graph: ImportGraph, venv_path: str | None = None) -> dict[str, ImportWeight]:
+    """compute_import_weights 的便利版: 自動取得專案的 模組 → 套件 索引."""
+    return compute_import_weights(graph, get_module_package_index(graph.project_dir, venv_path))
+
+
+def external_module_roots(project_dir: str, venv_path: str | None = None) -> tuple[str, ...]:
+    """
+    外部模組的搜尋根目錄: 目標環境 site-packages (找不到時用當前 interpreter 的) + stdlib.
+
+    Returns:
+        依搜尋順序排列的目錄
+    """
+    site_dirs = _find_site_packages(project_dir, venv_path)
+    if not site_dirs:
+        site_dirs = [p for p in sys.path if os.path.basename(p) in {"site-packages", "dist-packages"}]
+    paths = sysconfig.get_paths()
+    return (*site_dirs, paths["stdlib"], os.path.join(paths["platstdlib"], "lib-dynload"))
+
+
+@cache
+def _list_dir(path: str) -> tuple[str, ...]:
+    try:
+        return tuple(os.listdir(path))
+    except OSError:
+        return ()
+
+
+@cache
+def _tree_size(path: str) -> int:
+    """目錄下所有模組檔 (原始碼 + 擴充模組, 不含 __pycache__) 的大小."""
+    suffixes = tuple(importlib.machinery.all_suffixes())
+    total = 0
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        for name in filenames:
+            if name.endswith(suffixes):
+                with contextlib.suppress(OSError):
+                    total += os.path.getsize(os.path.join(dirpath, name))
+    return total
+
+
+def _module_file(directory: str, name: str) -> str | None:
+    """目錄中模組 name 的檔案 (name.py / name.cpython-311-x86_64-linux-gnu.so 等)."""
+    suffixes = tuple(importlib.machinery.all_suffixes())
+    for entry in _list_dir(directory):
+        if entry.split(".", 1)[0] == name and entry.endswith(suffixes):
+            return os.path.join(directory, entry)
+    return None
+
+
+@cache
+def installed_module_size(module: str, roots: tuple[str, ...]) -> int:
+    """
+    外部模組在磁碟上的大小, 作為 import 成本估計.
+
+    import a.b.c 會執行 a/__init__ 與 a/b/__init__ 再載入 c: 計入沿路各層 __init__ 與 c 本身;
+    c 為套件時計入整個目錄 (套件 __init__ 常會連帶 import 子模組, 以上限估計)。
+    `from a import name` 的 a.name 不是子模組時停在 a。
+    取第一個找得到頂層模組的根目錄; 找不到時為 0。
+    """
+    parts = module.split(".")
+    for root in roots:
+        directory = root
+        total = 0
+        for depth, part in enumerate(parts):
+            package_dir = os.path.join(directory, part)
+            last = depth == len(parts) - 1
+            if os.path.isdir(package_dir) and (depth == 0 or os.path.isfile(os.path.join(package_dir, "__init__.py"))):
+                if last:
+                    return total + _tree_size(package_dir)
+                init = os.path.join(package_dir, "__init__.py")
+                with contextlib.suppress(OSError):
+                    total += os.path.getsize(init)
+                directory = package_dir
+                continue
+            module_file = _module_file(directory, part)
+            if module_file is not None:
+                with contextlib.suppress(OSError):
+                    total += os.path.getsize(module_file)
+                return total
+            if depth == 0:
+                break
+            # 不是子模組 (from pkg import attr): 以已載入的套件為準
+            return total
+    return 0
+
+
+def over_budget(weight: ImportWeight, budget: WeightBudget) -> list[tuple[str, int, int]]:
+    """
+    超出預算的項目.
+
+    Returns:
+        [(項目名稱, 實際值, 上限)]; 項目名稱為 max-modules / max-packages / max-bytes
+    """
+    exceeded = []
+    if budget.max_modules is not None and weight.modules > budget.max_modules:
+        exceeded.append(("max-modules", weight.modules, budget.max_modules))
+    if budget.max_packages is not None and len(weight.third_party) > budget.max_packages:
+        exceeded.append(("max-packages", len(weight.third_party), budget.max_packages))
+    if budget.max_bytes is not None and weight.source_bytes > budget.max_bytes:
+        exceeded.append(("max-bytes", weight.source_bytes, budget.max_bytes))
+    return exceeded
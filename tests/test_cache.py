@@ -0,0 +1,366 @@
+"""測試快取儲存."""
+
+import os
+import sys
+import threading
+
+import pytest
+
+from pyci_check.cache import DB_FILENAME, CacheNamespace
+
+
+def test_roundtrip_and_lazy_get(tmp_path):
+    """寫入後可逐鍵讀取, 也可讀取整個 namespace."""
+    cache_dir = str(tmp_path / "cache")
+    CacheNamespace(cache_dir, "ns", 1, "sig").update({"a": True, "b": ["key", 1, 2.5], "c": {"ms": 3.0}})
+
+    store = CacheNamespace(cache_dir, "ns", 1, "sig")
+
+    assert store.get("a") is True
+    assert store.get("b") == ["key", 1, 2.5]
+    assert store.get("missing") is None
+    assert store.items() == {"a": True, "b": ["key", 1, 2.5], "c": {"ms": 3.0}}
+
+
+def test_signature_or_version_mismatch_is_miss(tmp_path):
+    """簽名 / 版本不符: 讀取 miss, 寫入時清空舊內容."""
+    cache_dir = str(tmp_path)
+    CacheNamespace(cache_dir, "ns", 1, "old").update({"a": 1, "b": 2})
+
+    assert CacheNamespace(cache_dir, "ns", 1, "new").get("a") is None
+    assert CacheNamespace(cache_dir, "ns", 2, "old").items() is None
+
+    CacheNamespace(cache_dir, "ns", 1, "new").update({"c": 3})
+
+    assert CacheNamespace(cache_dir, "ns", 1, "new").items() == {"c": 3}
+    assert CacheNamespace(cache_dir, "ns", 1, "old").get("a") is None
+
+
+def test_namespaces_are_independent(tmp_path):
+    """不同 namespace 共用同一個檔案但互不影響; replace 只清空自己的 namespace."""
+    cache_dir = str(tmp_path)
+    CacheNamespace(cache_dir, "one", 1).update({"k": "one"})
+    CacheNamespace(cache_dir, "two", 1).update({"k": "two", "x": 0})
+    CacheNamespace(cache_dir, "two", 1).update({"y": 1}, replace=True)
+
+    assert CacheNamespace(cache_dir, "one", 1).items() == {"k": "one"}
+    assert CacheNamespace(cache_dir, "two", 1).items() == {"y": 1}
+
+
+def test_corrupt_file_is_rebuilt(tmp_path):
+    """快取檔損毀 (例如被截斷或非 SQLite 檔): 捨棄重建, 不拋例外."""
+    (tmp_path / DB_FILENAME).write_bytes(b"definitely not a database" * 100)
+
+    store = CacheNamespace(str(tmp_path), "ns", 1)
+    assert store.get("a") is None
+    store.update({"a": 1})
+
+    assert CacheNamespace(str(tmp_path), "ns", 1).get("a") == 1
+
+
+def test_disabled_without_cache_dir():
+    """未指定快取目錄: 所有操作皆為 no-op."""
+    store = CacheNamespace(None, "ns", 1)
+    store.update({"a": 1})
+
+    assert store.get("a") is None
+    assert store.items() is None
+
+
+def test_concurrent_writers(tmp_path):
+    """多個寫入者 (各自的連線) 同時寫入不會遺失或損毀資料."""
+    cache_dir = str(tmp_path)
+
+    def writer(index: int) -> None:
+        store = CacheNamespace(cache_dir, "ns", 1)
+        for batch in range(10):
+            store.update({f"w{index}-{batch}-{n}": n for n in range(20)})
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    items = CacheNamespace(cache_dir, "ns", 1).items()
+    assert items is not None
+    assert len(items) == 4 * 10 * 20
+    assert os.path.exists(os.path.join(cache_dir, DB_FILENAME))
+
+
+def _track_connections(monkeypatch) -> list:
+    """記錄 _open_database 開啟的連線."""
+    from pyci_check import cache as cache_mod
+
+    opened = []
+    original = cache_mod._open_database
+
+    def tracking(cache_dir):
+        conn = original(cache_dir)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(cache_mod, "_open_database", tracking)
+    return opened
+
+
+def _is_closed(conn) -> bool:
+    import sqlite3
+
+    try:
+        conn.execute("SELECT 1")
+    except sqlite3.ProgrammingError:
+        return True
+    return False
+
+
+def test_close_releases_connections_of_all_threads(tmp_path, monkeypatch):
+    """CacheNamespace.close 關閉各 thread 開啟的連線; 之後再存取會重新開啟."""
+    cache_dir = str(tmp_path)
+    CacheNamespace(cache_dir, "ns", 1).update({"a": 1})
+    opened = _track_connections(monkeypatch)
+    store = CacheNamespace(cache_dir, "ns", 1)
+
+    threads = [threading.Thread(target=store.get, args=("a",)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.close()
+
+    assert len(opened) == 3
+    assert all(_is_closed(conn) for conn in opened)
+    assert store.get("a") == 1
+
+
+def test_content_cache_closes_connections(tmp_path, monkeypatch):
+    """ContentCache 離開 with 時寫入並關閉連線; 逐區塊處理的檔案不殘留連線."""
+    from pyci_check.cache import ContentCache
+    from pyci_check.imports import _process_files_chunk
+    from pyci_check.syntax import _check_files_chunk
+
+    opened = _track_connections(monkeypatch)
+    cache_dir = str(tmp_path / "cache")
+    with ContentCache(cache_dir, "phase") as content_cache:
+        key = content_cache.key_for(b"data")
+        content_cache.put(key, True)
+    with ContentCache(cache_dir, "phase") as content_cache:
+        assert content_cache.get(key) is True
+
+    source = tmp_path / "mod.py"
+    source.write_text("import os\n", encoding="utf-8")
+    _process_files_chunk([str(source)], cache_dir)
+    _check_files_chunk([str(source)], str(tmp_path), cache_dir=cache_dir)
+
+    assert len(opened) == 4
+    assert all(_is_closed(conn) for conn in opened)
+
+
+def test_cache_dir_resolution(tmp_path, monkeypatch):
+    """快取目錄: 環境變數 > [tool.pyci-check] cache-dir > 專案內 .pyci-check-cache."""
+    from pyci_check import cache as cache_mod
+
+    project = tmp_path / "project"
+    project.mkdir()
+    monkeypatch.delenv(cache_mod.CACHE_DIR_ENV, raising=False)
+    cache_mod._load_cache_config.cache_clear()
+    assert cache_mod.cache_dir_for(str(project)) == str(project / ".pyci-check-cache")
+
+    (project / "pyproject.toml").write_text('[tool.pyci-check]\ncache-dir = "../shared"\n', encoding="utf-8")
+    cache_mod._load_cache_config.cache_clear()
+    assert os.path.normpath(cache_mod.cache_dir_for(str(project))) == str(tmp_path / "shared")
+
+    (project / "pyproject.toml").write_text('[tool.pyci-check]\ncache-dir = "user"\n', encoding="utf-8")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    cache_mod._load_cache_config.cache_clear()
+    assert cache_mod.cache_dir_for(str(project)) == str(tmp_path / "xdg" / "pyci-check")
+
+    monkeypatch.setenv(cache_mod.CACHE_DIR_ENV, str(tmp_path / "from-env"))
+    assert cache_mod.cache_dir_for(str(project)) == str(tmp_path / "from-env")
+    cache_mod._load_cache_config.cache_clear()
+
+
+def test_project_namespaces_do_not_collide_in_shared_dir(tmp_path, monkeypatch):
+    """共用快取目錄時, 不同專案的同名快取 (簽名不同) 互不覆蓋."""
+    from pyci_check.cache import CACHE_DIR_ENV, project_namespace
+
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "shared"))
+    project_namespace(str(tmp_path / "a"), "find_spec", 1, "sig-a").update({"m": True})
+    project_namespace(str(tmp_path / "b"), "find_spec", 1, "sig-b").update({"m": False})
+
+    assert project_namespace(str(tmp_path / "a"), "find_spec", 1, "sig-a").get("m") is True
+    assert project_namespace(str(tmp_path / "b"), "find_spec", 1, "sig-b").get("m") is False
+
+
+def test_content_cache_shared_across_checkouts(tmp_path, monkeypatch):
+    """內容相同的檔案在另一個 checkout 直接命中, 結果帶目前路徑."""
+    from pyci_check import imports as imports_mod
+    from pyci_check.cache import CACHE_DIR_ENV
+
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "shared"))
+    source = "import os\ntry:\n    import optional_dep\nexcept ImportError:\n    pass\nfrom . import sibling\n"
+    for checkout in ("worktree-a", "worktree-b"):
+        (tmp_path / checkout).mkdir()
+        (tmp_path / checkout / "mod.py").write_text(source, encoding="utf-8")
+
+    first_imports, first_relative = imports_mod.extract_from_all_files(str(tmp_path / "worktree-a"))
+
+    def fail_parse(_code, filepath):
+        raise AssertionError(f"unexpected re-parse of {filepath}")
+
+    monkeypatch.setattr(imports_mod, "extract_imports_from_code", fail_parse)
+    second_imports, second_relative = imports_mod.extract_from_all_files(str(tmp_path / "worktree-b"))
+
+    def strip(infos):
+        return [{k: v for k, v in info.items() if k != "file"} for info in infos]
+
+    assert strip(second_imports) == strip(first_imports)
+    assert strip(second_relative) == strip(first_relative)
+    assert {info["file"] for info in second_imports} == {str(tmp_path / "worktree-b" / "mod.py")}
+
+
+def test_syntax_content_cache_skips_unchanged_files(tmp_path, monkeypatch):
+    """語法檢查: 通過的內容記錄後不再解析; 內容或目標版本改變則重新檢查."""
+    import ast
+
+    from pyci_check.syntax import check_files_parallel
+
+    good = tmp_path / "good.py"
+    good.write_text("x = 1\n", encoding="utf-8")
+    bad = tmp_path / "bad.py"
+    bad.write_text("def f(:\n", encoding="utf-8")
+    cache_dir = str(tmp_path / "cache")
+    parsed: list[str] = []
+    real_parse = ast.parse
+
+    def counting_parse(source, filename="<unknown>", *args, **kwargs):
+        parsed.append(os.path.basename(filename))
+        return real_parse(source, filename, *args, **kwargs)
+
+    monkeypatch.setattr(ast, "parse", counting_parse)
+    files = [str(good), str(bad)]
+
+    assert check_files_parallel(files, cache_dir=cache_dir)[:2] == (1, 1)
+    parsed.clear()
+    assert check_files_parallel(files, cache_dir=cache_dir)[:2] == (1, 1)
+    # 錯誤不快取 (訊息含路徑), 通過的檔案不再解析
+    assert parsed == ["bad.py"]
+
+    parsed.clear()
+    check_files_parallel(files, target_version=(3, 8), cache_dir=cache_dir)
+    assert sorted(parsed) == ["bad.py", "good.py"]
+
+
+def test_parse_and_format_size():
+    """容量設定解析 (以 1024 為底) 與顯示."""
+    from pyci_check.cache import format_size, parse_size
+
+    assert parse_size("512MB") == 512 * 1024**2
+    assert parse_size("1g") == 1024**3
+    assert parse_size("1.5 KiB") == 1536
+    assert parse_size(4096) == 4096
+    assert format_size(512) == "512 B"
+    assert format_size(1536) == "1.5 KB"
+
+
+def test_access_time_and_hit_stats(tmp_path):
+    """命中的項目更新存取時間; 命中 / 未命中次數累計於 stats."""
+    import sqlite3
+
+    from pyci_check.cache import cache_stats
+
+    cache_dir = str(tmp_path)
+    CacheNamespace(cache_dir, "content:syntax", 1).update({"a": True, "b": True})
+    with sqlite3.connect(tmp_path / DB_FILENAME) as conn:
+        conn.execute("UPDATE entries SET atime = 0")
+
+    store = CacheNamespace(cache_dir, "content:syntax", 1)
+    assert store.get("a") is True
+    assert store.get("missing") is None
+    store.update()
+
+    with sqlite3.connect(tmp_path / DB_FILENAME) as conn:
+        atimes = dict(conn.execute("SELECT key, atime FROM entries"))
+    assert atimes["a"] > 0
+    assert atimes["b"] == 0
+
+    stats = cache_stats(cache_dir)
+    assert stats["entries"] == 2
+    assert stats["phases"]["content:syntax"]["hits"] == 1
+    assert stats["phases"]["content:syntax"]["misses"] == 1
+
+
+def test_gc_evicts_least_recently_used(tmp_path):
+    """超過容量上限時, 最久未存取的項目先淘汰, 最近使用的保留."""
+    import sqlite3
+
+    from pyci_check.cache import cache_stats, collect_garbage
+
+    cache_dir = str(tmp_path)
+    payload = "x" * 2000
+    CacheNamespace(cache_dir, "ns", 1).update({f"k{i:03d}": payload for i in range(300)})
+    with sqlite3.connect(tmp_path / DB_FILENAME) as conn:
+        # k000 最舊 ... k299 最新
+        conn.executemany("UPDATE entries SET atime = ? WHERE key = ?", [(i, f"k{i:03d}") for i in range(300)])
+
+    size = cache_stats(cache_dir)["size"]
+    assert collect_garbage(cache_dir, size * 2) == (0, 0)
+
+    removed, freed = collect_garbage(cache_dir, size // 2)
+
+    remaining = CacheNamespace(cache_dir, "ns", 1).items()
+    assert removed > 150
+    assert freed >= removed * 2000
+    assert "k000" not in remaining
+    assert "k299" in remaining
+    assert len(remaining) == 300 - removed
+    assert cache_stats(cache_dir)["size"] <= size // 2
+
+
+def test_cli_cache_commands(tmp_path, capsys, monkeypatch):
+    """pyci-check cache stats / clear."""
+    import argparse
+
+    from pyci_check.cli import manage_cache
+    from pyci_check.i18n import t
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("PYCI_CHECK_CACHE_DIR", raising=False)
+    assert manage_cache(argparse.Namespace(cache_command="stats")) == 0
+    assert t("cache.empty", str(tmp_path / ".pyci-check-cache")) in capsys.readouterr().out
+
+    store = CacheNamespace(str(tmp_path / ".pyci-check-cache"), "content:imports", 1)
+    store.get("nope")
+    store.update({"k": ([], [])})
+    assert manage_cache(argparse.Namespace(cache_command="stats")) == 0
+    out = capsys.readouterr().out
+    assert "content:imports" in out
+    assert "0%" in out
+
+    assert manage_cache(argparse.Namespace(cache_command="clear")) == 0
+    assert CacheNamespace(str(tmp_path / ".pyci-check-cache"), "content:imports", 1).get("k") is None
+
+
+def test_cli_collects_garbage_after_check_commands(tmp_path, monkeypatch):
+    """所有檢查子指令結束後都檢查容量上限, 不只 check/syntax/imports/dependency; 管理指令不觸發."""
+    from pyci_check import cli
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PYCI_CHECK_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / "mod.py").write_text("import os\n", encoding="utf-8")
+    collected: list[str] = []
+    monkeypatch.setattr(cli, "_collect_cache_garbage", lambda: collected.append("gc"))
+
+    for command in ("impact", "graph", "contracts", "cycles", "deadcode", "weight", "lazy-imports"):
+        collected.clear()
+        argv = ["pyci-check", command, "mod.py"] if command == "impact" else ["pyci-check", command]
+        monkeypatch.setattr(sys, "argv", argv)
+        with pytest.raises(SystemExit):
+            cli.main()
+        assert collected == ["gc"], command
+
+    collected.clear()
+    monkeypatch.setattr(sys, "argv", ["pyci-check", "cache", "stats"])
+    with pytest.raises(SystemExit):
+        cli.main()
+    assert collected == []
@@ -66,3 +66,48 @@ src = ["src"]
     stdout = captured.out.replace("\\", "/")
 
     assert "a.py -> src/b.py -> src/a.py" in stdout or "b.py -> src/a.py -> src/b.py" in stdout
+
+
+def test_cli_imports_streaming_respects_exclude_config(tmp_path: Path, capsys, monkeypatch):
+    """指定路徑沒有任何檔案而改走訪整個專案時, 仍套用 [tool.pyci-check] exclude."""
+    from pyci_check.cli import check_imports
+    from pyci_check.imports import get_ruff_config_from_pyproject
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text('[tool.pyci-check]\nexclude = ["skipme", "skip_file.py"]\n', encoding="utf-8")
+    (tmp_path / "skipme").mkdir()
+    (tmp_path / "skipme" / "a.py").write_text("import missing_in_excluded_dir\n", encoding="utf-8")
+    (tmp_path / "skip_file.py").write_text("import missing_in_excluded_file\n", encoding="utf-8")
+    (tmp_path / "ok.py").write_text("import os\n", encoding="utf-8")
+    get_ruff_config_from_pyproject.cache_clear()
+
+    args = argparse.Namespace(paths=["nonexist"], quiet=True, check_relative=False, venv=None)
+    exit_code = check_imports(args)
+
+    out = capsys.readouterr().out
+    assert "missing_in_excluded" not in out
+    assert exit_code == 0
+
+
+def test_cli_import_deadline_zero_overrides_config(tmp_path: Path, monkeypatch):
+    """明確指定 --import-deadline 0 (停用時限) 時不可退回 [tool.pyci-check] import-deadline."""
+    from pyci_check import cli
+    from pyci_check.imports import get_ruff_config_from_pyproject
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text("[tool.pyci-check]\nimport-deadline = 5\n", encoding="utf-8")
+    (tmp_path / "ok.py").write_text("import os\n", encoding="utf-8")
+    get_ruff_config_from_pyproject.cache_clear()
+    deadlines: list[float | None] = []
+
+    def fake_check(*_args, deadline=None, **_kwargs):
+        deadlines.append(deadline)
+        return {}
+
+    monkeypatch.setattr(cli, "check_missing_modules", fake_check)
+    for value in (0.0, None):
+        args = argparse.Namespace(paths=["."], quiet=True, check_relative=False, venv=None, timeout=10, import_deadline=value)
+        args.i_understand_this_will_execute_code = True
+        cli.check_imports(args)
+
+    assert deadlines == [0.0, 5]
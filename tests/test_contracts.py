@@ -0,0 +1,138 @@
+"""測試架構契約."""
+
+import argparse
+
+from pyci_check.cli import check_contracts
+from pyci_check.contracts import Contract, evaluate_contracts, load_contracts
+from pyci_check.graph import load_import_graph
+
+
+def _write_app(tmp_path, contracts: str = ""):
+    """
+    app.api -> app.service -> app.domain.model
+    app.domain.model -> app.domain.rules
+    app.domain.rules -> app.infra.db  (間接違規: domain 經由 rules 依賴 infra)
+    app.billing -> app.shipping
+    """
+    files = {
+        "app/__init__.py": "",
+        "app/api.py": "import app.service\n",
+        "app/service.py": "import app.domain.model\n",
+        "app/domain/__init__.py": "",
+        "app/domain/model.py": "from .rules import RULES\n",
+        "app/domain/rules.py": "import app.infra.db\n\nRULES = []\n",
+        "app/infra/__init__.py": "",
+        "app/infra/db.py": "",
+        "app/billing.py": "import app.shipping\n",
+        "app/shipping.py": "",
+    }
+    for rel, content in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    (tmp_path / "pyproject.toml").write_text(contracts, encoding="utf-8")
+
+
+def test_forbidden_indirect_and_direct(tmp_path):
+    """預設抓間接 import 並附最短路徑; indirect=False 只看直接 import."""
+    _write_app(tmp_path)
+    graph = load_import_graph(str(tmp_path), [])
+
+    contract = Contract(name="pure domain", type="forbidden", source=["app.service"], forbidden=["app.infra"])
+    violations, unmatched = evaluate_contracts(graph, [contract])
+    assert unmatched == set()
+    assert len(violations) == 1
+    assert violations[0].chain == ["app.service", "app.domain.model", "app.domain.rules", "app.infra.db"]
+
+    contract.indirect = False
+    assert evaluate_contracts(graph, [contract])[0] == []
+
+
+def test_layers_and_independence(tmp_path):
+    """下層不得 import 上層; 獨立模組彼此不得 import."""
+    _write_app(tmp_path)
+    graph = load_import_graph(str(tmp_path), [])
+
+    layers_ok = Contract(name="layers", type="layers", layers=[["app.api"], ["app.service"], ["app.domain"]])
+    assert evaluate_contracts(graph, [layers_ok])[0] == []
+
+    inverted = Contract(name="inverted", type="layers", layers=[["app.domain"], ["app.api"]])
+    violations = evaluate_contracts(graph, [inverted])[0]
+    assert [(v.importer, v.imported) for v in violations] == [("app.api", "app.domain")]
+
+    independence = Contract(name="indep", type="independence", modules=["app.billing", "app.shipping", "app.nope"])
+    violations, unmatched = evaluate_contracts(graph, [independence])
+    assert [(v.importer, v.imported) for v in violations] == [("app.billing", "app.shipping")]
+    assert unmatched == {"app.nope"}
+
+
+def test_load_contracts_reports_invalid_entries(tmp_path):
+    """格式錯誤的契約回報為錯誤, 其餘照常載入."""
+    _write_app(
+        tmp_path,
+        """
+[[tool.pyci-check.contracts]]
+type = "forbidden"
+source = "app.domain"
+forbidden = ["app.infra"]
+
+[[tool.pyci-check.contracts]]
+type = "nonsense"
+
+[[tool.pyci-check.contracts]]
+type = "layers"
+layers = ["app.api"]
+""",
+    )
+    contracts, errors = load_contracts(str(tmp_path))
+    assert [(c.name, c.source) for c in contracts] == [("forbidden #1", ["app.domain"])]
+    assert [e.key for e in errors] == ["contracts.error.unknown_type", "contracts.error.missing_field"]
+
+
+def test_load_contracts_rejects_nested_modules(tmp_path):
+    """被檢查的模組位於 importer 之內 (子模組或同名) 時回報設定錯誤, 而非靜默略過."""
+    _write_app(
+        tmp_path,
+        """
+[[tool.pyci-check.contracts]]
+name = "no db in app"
+type = "forbidden"
+source = ["app"]
+forbidden = ["app.infra.db"]
+
+[[tool.pyci-check.contracts]]
+type = "layers"
+layers = [["app.domain.rules"], ["app.domain"]]
+
+[[tool.pyci-check.contracts]]
+type = "forbidden"
+source = ["app.api"]
+forbidden = ["app"]
+""",
+    )
+    contracts, errors = load_contracts(str(tmp_path))
+    assert [c.name for c in contracts] == ["forbidden #3"]
+    assert [(e.key, e.args) for e in errors] == [
+        ("contracts.error.nested_module", ("no db in app", "app.infra.db", "app")),
+        ("contracts.error.nested_module", ("layers #2", "app.domain.rules", "app.domain")),
+    ]
+
+
+def test_cli_contracts(tmp_path, capsys, monkeypatch):
+    """測試 contracts 指令: 違規時回傳 1 並印出 import 路徑."""
+    _write_app(
+        tmp_path,
+        """
+[[tool.pyci-check.contracts]]
+name = "pure domain"
+type = "forbidden"
+source = ["app.domain"]
+forbidden = ["app.infra"]
+""",
+    )
+    monkeypatch.chdir(tmp_path)
+
+    assert check_contracts(argparse.Namespace(quiet=True)) == 1
+    out = capsys.readouterr().out
+    assert "pure domain" in out
+    assert "app.domain.rules -> app.infra.db" in out
@@ -2,7 +2,8 @@
 
 import os
 
-from pyci_check.cycles import find_import_cycles
+from pyci_check.cycles import find_import_cycles, suggest_cycle_breaks
+from pyci_check.graph import build_import_graph
 
 
 def test_find_import_cycles_absolute(tmp_path):
@@ -99,3 +100,37 @@ def test_self_reference_ignored(tmp_path):
 
     cycles = find_import_cycles(all_imports, [], str(tmp_path), [])
     assert len(cycles) == 0
+
+
+def test_find_import_cycles_ignores_deferred_imports(tmp_path):
+    """函數內的 import 預設不構成循環; 指定 kinds 時才納入."""
+    a_py = tmp_path / "a.py"
+    b_py = tmp_path / "b.py"
+    a_py.write_text("import b", encoding="utf-8")
+    b_py.write_text("def f():\n    import a", encoding="utf-8")
+
+    all_imports = [
+        {"file": str(a_py), "module": "b", "line": 1, "statement": "import b", "type": "absolute", "optional": False, "kind": "module"},
+        {"file": str(b_py), "module": "a", "line": 2, "statement": "import a", "type": "absolute", "optional": False, "kind": "function"},
+    ]
+
+    assert find_import_cycles(all_imports, [], str(tmp_path), []) == []
+    assert find_import_cycles(all_imports, [], str(tmp_path), [], kinds={"module", "function"})
+
+
+def test_suggest_cycle_breaks_points_at_statements(tmp_path):
+    """斷環建議指出 import 敘述 (檔案 / 行號), 優先選擇敘述較少的邊."""
+    files = {name: str(tmp_path / f"{name}.py") for name in ("a", "b")}
+    for path in files.values():
+        open(path, "w", encoding="utf-8").close()
+
+    all_imports = [
+        {"file": files["a"], "module": "b", "line": 1, "statement": "import b", "kind": "module"},
+        {"file": files["a"], "module": "b", "line": 2, "statement": "from b import x", "kind": "module"},
+        {"file": files["b"], "module": "a", "line": 3, "statement": "import a", "kind": "module"},
+    ]
+    graph = build_import_graph(all_imports, [], str(tmp_path), [], keep_imports=True)
+
+    (cycle_break,) = suggest_cycle_breaks(graph)
+    assert sorted(cycle_break.files) == sorted(files.values())
+    assert [(imp["file"], imp["line"], imp["target"]) for imp in cycle_break.imports] == [(files["b"], 3, files["a"])]
@@ -0,0 +1,130 @@
+"""測試以限定名解析的死代碼掃描."""
+
+import pyci_check.deadcode as deadcode_module
+from pyci_check.deadcode import build_symbol_index, scan_dead_code
+
+
+def _write(tmp_path, files: dict[str, str]) -> list[str]:
+    paths = []
+    for name, code in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(code, encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def _dead(tmp_path, files: dict[str, str]) -> set[tuple[str, str]]:
+    warnings = scan_dead_code(_write(tmp_path, files), str(tmp_path))
+    return {(w["file"][len(str(tmp_path)) + 1 :].replace("\\", "/"), w["name"]) for w in warnings}
+
+
+def test_same_name_functions_resolved_per_module(tmp_path):
+    """同名函數依 import 解析區分; 接收者未知的 .process() 只算方法, 不算模組層級函數."""
+    dead = _dead(
+        tmp_path,
+        {
+            "a.py": "def process():\n    pass\n",
+            "b.py": "def process():\n    pass\n\nclass Worker:\n    def process(self):\n        pass\n",
+            "c.py": "from a import process\nimport b\n\nprocess()\nb.Worker().process()\n",
+        },
+    )
+    assert dead == {("b.py", "process")}
+
+
+def test_aliases_reexports_and_all(tmp_path):
+    """別名與重新匯出: import as、__init__ 重新匯出鏈、相對 import 與 __all__."""
+    dead = _dead(
+        tmp_path,
+        {
+            "pkg/__init__.py": "from .impl import helper as public_helper\n__all__ = ['exported']\n\ndef exported():\n    pass\n",
+            "pkg/impl.py": "def helper():\n    pass\n\ndef other():\n    pass\n\ndef unused():\n    pass\n",
+            "app.py": "import pkg.impl as impl_mod\nfrom pkg import public_helper\n\npublic_helper()\nimpl_mod.other()\n",
+        },
+    )
+    assert dead == {("pkg/impl.py", "unused")}
+
+
+def test_transitively_unreachable(tmp_path):
+    """只被死代碼呼叫的函數也是死代碼; 繼承外部類別的 class 其方法隨 class 到達."""
+    dead = _dead(
+        tmp_path,
+        {
+            "m.py": (
+                "import ast\n\n"
+                "def leaf():\n    pass\n\n"
+                "def dead_caller():\n    leaf()\n\n"
+                "class Visitor(ast.NodeVisitor):\n    def visit_Name(self, node):\n        pass\n\n"
+                "class Plain:\n    def hook(self):\n        pass\n\n"
+                "Visitor()\nPlain()\n"
+            ),
+        },
+    )
+    assert dead == {("m.py", "leaf"), ("m.py", "dead_caller"), ("m.py", "Plain.hook")}
+
+
+def test_symbol_summaries_cached(tmp_path, monkeypatch):
+    """未變動的檔案不重新解析; 修改過的檔案重新解析."""
+    paths = _write(tmp_path, {"a.py": "def f():\n    pass\n", "b.py": "from a import f\n"})
+    build_symbol_index(paths, str(tmp_path))
+
+    parsed = []
+    original = deadcode_module.summarize_module
+
+    def tracking(code, module, is_package):
+        parsed.append(module)
+        return original(code, module, is_package)
+
+    monkeypatch.setattr(deadcode_module, "summarize_module", tracking)
+    build_symbol_index(paths, str(tmp_path))
+    assert parsed == []
+
+    (tmp_path / "b.py").write_text("import a\n", encoding="utf-8")
+    index = build_symbol_index(paths, str(tmp_path))
+    assert parsed == ["b"]
+    assert "a.f" not in index.reachable(index.roots())
+
+
+def test_entry_points_root_reachability(tmp_path):
+    """宣告入口時只有入口可到達的模組算使用; __main__ 守護與測試檔為根."""
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\n\n[project.scripts]\ndemo = "pkg.cli:main"\n\n'
+        '[project.entry-points."demo.plugins"]\nextra = "pkg.plugin:Plugin"\n',
+        encoding="utf-8",
+    )
+    dead = _dead(
+        tmp_path,
+        {
+            "pkg/__init__.py": "",
+            "pkg/cli.py": "from pkg.util import helper\n\ndef main():\n    helper()\n",
+            "pkg/util.py": "def helper():\n    pass\n\ndef unused_util():\n    pass\n",
+            "pkg/plugin.py": "class Plugin:\n    pass\n",
+            "pkg/orphan.py": "def orphan():\n    pass\n\nORPHAN = orphan()\n",
+            "tools/script.py": "def go():\n    pass\n\nif __name__ == '__main__':\n    go()\n",
+            "tests/test_cli.py": "def make_args():\n    pass\n\nclass TestCli:\n    def check(self):\n        pass\n",
+        },
+    )
+    assert dead == {("pkg/util.py", "unused_util"), ("pkg/orphan.py", "orphan")}
+
+
+def test_framework_decorators_are_roots(tmp_path):
+    """框架註冊用 decorator (含經 import 展開的名稱與自訂樣式) 裝飾的定義為根."""
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\n\n[project.scripts]\ndemo = "app:main"\n\n[tool.pyci-check]\ndeadcode-root-decorators = ["bus.subscribe"]\n',
+        encoding="utf-8",
+    )
+    dead = _dead(
+        tmp_path,
+        {
+            "app.py": (
+                "import bus\nfrom flask import Flask\nfrom pytest import fixture\nfrom functools import cache\n\n"
+                "app = Flask(__name__)\n\n"
+                "def main():\n    pass\n\n"
+                '@app.route("/")\ndef index():\n    pass\n\n'
+                "@fixture\ndef db():\n    pass\n\n"
+                "@bus.subscribe\ndef on_event():\n    pass\n\n"
+                "@cache\ndef cached():\n    pass\n"
+            ),
+        },
+    )
+    assert dead == {("app.py", "cached")}
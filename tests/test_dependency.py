@@ -1,6 +1,15 @@
 """測試依賴健康度檢查."""
 
-from pyci_check.dependency import find_dependency_issues, get_declared_dependencies, parse_pyproject_dependencies, parse_requirements_txt
+from pyci_check.dependency import (
+    _find_site_packages,
+    _PackageIndexCache,
+    build_module_index,
+    find_dependency_issues,
+    get_declared_dependencies,
+    parse_lockfile_packages,
+    parse_pyproject_dependencies,
+    parse_requirements_txt,
+)
 
 
 def test_parse_pyproject_dependencies(tmp_path):
@@ -135,3 +144,73 @@ def test_get_declared_dependencies_integration(tmp_path):
 
     all_deps = get_declared_dependencies(str(tmp_path))
     assert all_deps == {"httpx", "black"}
+
+
+def _make_dist(site, dist_dir, files, top_level=None):
+    """在假 site-packages 建立 dist-info (RECORD / top_level.txt)."""
+    d = site / dist_dir
+    d.mkdir(parents=True)
+    (d / "RECORD").write_text("".join(f"{f},sha256=x,1\n" for f in files), encoding="utf-8")
+    if top_level is not None:
+        (d / "top_level.txt").write_text("\n".join(top_level) + "\n", encoding="utf-8")
+
+
+def test_build_module_index_reads_record_and_top_level(tmp_path):
+    """直接讀 dist-info, 不需 import 目標環境."""
+    site = tmp_path / "site-packages"
+    _make_dist(
+        site,
+        "beautifulsoup4-4.12.0.dist-info",
+        ["bs4/__init__.py", "bs4/element.py", "beautifulsoup4-4.12.0.dist-info/RECORD"],
+    )
+    _make_dist(site, "python_dateutil-2.9.0.dist-info", [], top_level=["dateutil"])
+    _make_dist(
+        site,
+        "six-1.16.0.dist-info",
+        ["six.py", "__pycache__/six.cpython-311.pyc", "../../bin/six-tool", "six-1.16.0.dist-info/RECORD"],
+    )
+
+    index = build_module_index([str(site)])
+
+    assert index == {"bs4": ["beautifulsoup4"], "dateutil": ["python-dateutil"], "six": ["six"]}
+
+
+def test_parse_lockfile_packages(tmp_path):
+    """uv.lock 的 [[package]] 與 pip-tools 產出的 requirements.txt; 專案自身不列入."""
+    (tmp_path / "uv.lock").write_text(
+        """
+version = 1
+
+[[package]]
+name = "myproj"
+version = "0.1.0"
+source = { editable = "." }
+
+[[package]]
+name = "Requests"
+version = "2.32.0"
+source = { registry = "https://pypi.org/simple" }
+""",
+        encoding="utf-8",
+    )
+    (tmp_path / "requirements.in").write_text("httpx\n", encoding="utf-8")
+    (tmp_path / "requirements.txt").write_text("httpx==0.27.0\nanyio==4.0.0\n    # via httpx\n", encoding="utf-8")
+
+    assert parse_lockfile_packages(str(tmp_path)) == {"requests", "httpx", "anyio"}
+    # pip-compile 產出的 .txt 是鎖定清單, 宣告以 .in 為準
+    assert get_declared_dependencies(str(tmp_path)) == {"httpx"}
+
+
+def test_find_dependency_issues_uses_target_venv(tmp_path):
+    """以目標 venv 的 dist-info 判斷 (模組名與套件名不同), 並寫入索引快取."""
+    (tmp_path / "pyproject.toml").write_text("[project]\ndependencies=['beautifulsoup4', 'attrs']\n", encoding="utf-8")
+    site = tmp_path / "venv" / "lib" / "python3.11" / "site-packages"
+    _make_dist(site, "beautifulsoup4-4.12.0.dist-info", ["bs4/__init__.py"])
+    _make_dist(site, "python_dateutil-2.9.0.dist-info", [], top_level=["dateutil"])
+    _make_dist(site, "attrs-23.1.0.dist-info", ["attr/__init__.py", "attrs/__init__.py"])
+
+    issues = find_dependency_issues(str(tmp_path), {"bs4", "dateutil", "attrs"}, set(), venv_path="venv")
+
+    assert issues["phantom"] == {"dateutil"}
+    assert issues["orphan"] == set()
+    assert _PackageIndexCache(str(tmp_path), _find_site_packages(str(tmp_path), "venv")).load()["dateutil"] == ["python-dateutil"]
@@ -0,0 +1,273 @@
+"""測試 import 圖與影響分析."""
+
+import argparse
+import json
+import os
+import xml.etree.ElementTree as ET
+
+from pyci_check.cli import check_impact, export_graph
+from pyci_check.graph import (
+    build_import_graph,
+    compute_metrics,
+    feedback_edges,
+    is_test_file,
+    iter_export,
+    load_import_graph,
+    package_level_edges,
+    strongly_connected_components,
+    transitive_importers,
+)
+from pyci_check.imports import IMPORT_TIME_KINDS, extract_imports_from_code
+
+
+def _write_project(tmp_path):
+    """
+    src/pkg/core.py <- src/pkg/service.py <- src/app.py
+                    <- tests/test_core.py
+    tests/test_app.py -> app
+    src/pkg/unrelated.py (沒有人 import)
+    """
+    pkg = tmp_path / "src" / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "core.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (pkg / "service.py").write_text("from .core import VALUE\n", encoding="utf-8")
+    (pkg / "unrelated.py").write_text("", encoding="utf-8")
+    (tmp_path / "src" / "app.py").write_text("import pkg.service\n", encoding="utf-8")
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_core.py").write_text("from pkg.core import VALUE\n", encoding="utf-8")
+    (tests / "test_app.py").write_text("import app\n", encoding="utf-8")
+    (tmp_path / "pyproject.toml").write_text('[tool.ruff]\nsrc = ["src"]\n', encoding="utf-8")
+
+
+def test_transitive_importers(tmp_path):
+    """反向 BFS: 直接與間接 importer, 不含輸入檔案本身."""
+    _write_project(tmp_path)
+    graph = load_import_graph(str(tmp_path), ["src"])
+
+    affected = transitive_importers(graph, [str(tmp_path / "src" / "pkg" / "core.py")])
+    names = {os.path.relpath(fp, tmp_path).replace(os.sep, "/") for fp in affected}
+    assert names == {"src/pkg/service.py", "src/app.py", "tests/test_core.py", "tests/test_app.py"}
+
+    assert transitive_importers(graph, [str(tmp_path / "src" / "pkg" / "unrelated.py")]) == set()
+
+
+def test_load_import_graph_reuses_cached_imports(tmp_path, monkeypatch):
+    """未變動的檔案不重新解析; 修改過的檔案重新解析並反映在圖中."""
+    _write_project(tmp_path)
+    load_import_graph(str(tmp_path), ["src"])
+
+    parsed = []
+    import pyci_check.graph as graph_module
+
+    original = graph_module.process_single_file
+
+    def tracking(filepath, **kwargs):
+        parsed.append(os.path.basename(filepath))
+        return original(filepath, **kwargs)
+
+    monkeypatch.setattr(graph_module, "process_single_file", tracking)
+    load_import_graph(str(tmp_path), ["src"])
+    assert parsed == []
+
+    unrelated = tmp_path / "src" / "pkg" / "unrelated.py"
+    unrelated.write_text("import pkg.core\n", encoding="utf-8")
+    graph = load_import_graph(str(tmp_path), ["src"])
+    assert parsed == ["unrelated.py"]
+    assert str(unrelated) in transitive_importers(graph, [str(tmp_path / "src" / "pkg" / "core.py")])
+
+
+def test_load_import_graph_drops_deleted_files(tmp_path):
+    """刪除的檔案不再出現在圖中."""
+    _write_project(tmp_path)
+    load_import_graph(str(tmp_path), ["src"])
+
+    (tmp_path / "tests" / "test_core.py").unlink()
+    graph = load_import_graph(str(tmp_path), ["src"])
+    affected = transitive_importers(graph, [str(tmp_path / "src" / "pkg" / "core.py")])
+    assert str(tmp_path / "tests" / "test_core.py") not in affected
+
+
+def test_is_test_file():
+    """測試檔判定: pytest 預設命名."""
+    assert is_test_file("tests/test_core.py")
+    assert is_test_file("pkg/core_test.py")
+    assert not is_test_file("pkg/core.py")
+    assert not is_test_file("tests/conftest.py")
+
+
+def test_cli_impact_tests_only(tmp_path, capsys, monkeypatch):
+    """測試 impact --tests: 只輸出受影響的測試檔, 未知檔案警告到 stderr."""
+    _write_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    args = argparse.Namespace(files=["src/pkg/service.py", "README.md"], tests=True)
+    assert check_impact(args) == 0
+
+    captured = capsys.readouterr()
+    assert captured.out.replace("\\", "/").splitlines() == ["tests/test_app.py"]
+    assert "README.md" in captured.err
+
+
+def test_cli_impact_skips_default_excluded_dirs(tmp_path, capsys, monkeypatch):
+    """設定的排除目錄為空時仍套用預設排除清單: .venv 內的檔案不進入 import 圖."""
+    _write_project(tmp_path)
+    venv = tmp_path / ".venv" / "lib"
+    venv.mkdir(parents=True)
+    (venv / "evil.py").write_text("import pkg.core\n", encoding="utf-8")
+    (venv / "test_v.py").write_text("import pkg.core\n", encoding="utf-8")
+    (tmp_path / "pyproject.toml").write_text('[tool.ruff]\nsrc = ["src"]\n\n[tool.pyci-check]\nexclude = ["docs"]\n', encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    assert check_impact(argparse.Namespace(files=["src/pkg/core.py"], tests=True)) == 0
+    assert capsys.readouterr().out.replace("\\", "/").splitlines() == ["tests/test_app.py", "tests/test_core.py"]
+
+    graph = load_import_graph(str(tmp_path), ["src"])
+    assert not any(".venv" in fp for fp in graph.edges)
+
+
+def test_compute_metrics():
+    """fan-in / fan-out / SCC / 拓撲層 / 遞移 import 數."""
+    edges = {"a": {"b"}, "b": {"a", "c"}, "c": set(), "d": {"a"}}
+    metrics = compute_metrics(edges)
+
+    assert metrics["a"].scc == metrics["b"].scc != metrics["c"].scc
+    assert metrics["a"].scc_size == 2
+    assert (metrics["c"].layer, metrics["a"].layer, metrics["b"].layer, metrics["d"].layer) == (0, 1, 1, 2)
+    assert (metrics["a"].fan_in, metrics["a"].fan_out) == (2, 1)
+    assert metrics["a"].transitive_size == 2  # b, c
+    assert metrics["d"].transitive_size == 3  # a, b, c
+    assert metrics["c"].transitive_size == 0
+
+
+def test_strongly_connected_components_deep_chain():
+    """長鏈不受遞迴深度限制, 元件依相依順序排列."""
+    n = 5000
+    edges = {f"m{i}": {f"m{i + 1}"} for i in range(n)}
+    edges[f"m{n}"] = set()
+    components = strongly_connected_components(edges)
+    assert len(components) == n + 1
+    assert components[0] == [f"m{n}"]
+    assert components[-1] == ["m0"]
+
+
+def test_package_level_edges(tmp_path):
+    """套件層級: 套件內部 import 不成邊."""
+    _write_project(tmp_path)
+    graph = load_import_graph(str(tmp_path), ["src"])
+    edges = package_level_edges(graph)
+    assert edges["pkg"] == set()
+    assert edges["app"] == {"pkg"}
+    assert edges["tests"] == {"pkg", "app"}
+
+
+def test_iter_export_formats():
+    """三種格式皆可被標準 parser 讀回, 節點帶指標."""
+    edges = {"a.py": {"b.py"}, "b.py": set(), 'q"<&>.py': {"a.py"}}
+
+    data = json.loads("".join(iter_export(edges, "json")))
+    assert [node["id"] for node in data["nodes"]] == ["a.py", "b.py", 'q"<&>.py']
+    assert data["nodes"][0]["transitive_size"] == 1
+    assert ["a.py", "b.py"] in data["edges"]
+
+    root = ET.fromstring("".join(iter_export(edges, "graphml", "package")).encode())  # noqa: S314 - 自己產生的輸出
+    ns = {"g": "http://graphml.graphdrawing.org/xmlns"}
+    assert len(root.findall(".//g:node", ns)) == 3
+    assert len(root.findall(".//g:edge", ns)) == 2
+
+    dot = "".join(iter_export(edges, "dot"))
+    assert dot.startswith('digraph "file_imports" {')
+    assert '"a.py" -> "b.py";' in dot
+    assert r'"q\"<&>.py"' in dot
+
+
+def test_cli_graph_output_file(tmp_path, monkeypatch):
+    """測試 graph --output: 寫入檔案."""
+    _write_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    out = tmp_path / "graph.json"
+
+    args = argparse.Namespace(format="json", level="file", output=str(out))
+    assert export_graph(args) == 0
+
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert data["level"] == "file"
+    assert {"src/pkg/core.py", "tests/test_app.py"} <= {node["id"] for node in data["nodes"]}
+
+
+def test_import_kinds_tagged():
+    """每個 import 標記執行時機: 模組層級 / 函數內 / TYPE_CHECKING / optional."""
+    code = """
+from typing import TYPE_CHECKING
+import a
+try:
+    import b
+except ImportError:
+    b = None
+if TYPE_CHECKING:
+    import c
+class K:
+    import d
+    def m(self):
+        try:
+            import e
+        except ImportError:
+            pass
+"""
+    imports, _ = extract_imports_from_code(code, "f.py", include_type_checking=True)
+    kinds = {imp["module"]: imp["kind"] for imp in imports}
+    assert kinds == {"typing": "module", "a": "module", "b": "optional", "c": "type_checking", "d": "module", "e": "function"}
+
+    imports, _ = extract_imports_from_code(code, "f.py")
+    assert "c" not in {imp["module"] for imp in imports}
+
+
+def test_load_import_graph_edge_kinds(tmp_path):
+    """預設圖不含 TYPE_CHECKING 邊; kinds 可只收錄 import 時執行的邊, edges_for 再篩選."""
+    (tmp_path / "a.py").write_text("import b\n\ndef f():\n    import c\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("from typing import TYPE_CHECKING\nif TYPE_CHECKING:\n    import a\n", encoding="utf-8")
+    (tmp_path / "c.py").write_text("import a\n", encoding="utf-8")
+    a, b, c = (str(tmp_path / name) for name in ("a.py", "b.py", "c.py"))
+
+    graph = load_import_graph(str(tmp_path), [])
+    assert graph.edges[a] == {b, c}
+    assert graph.edges[b] == set()
+    assert graph.edge_kinds[a] == {b: {"module"}, c: {"function"}}
+    assert graph.edges_for(IMPORT_TIME_KINDS)[a] == {b}
+
+    import_time = load_import_graph(str(tmp_path), [], kinds=IMPORT_TIME_KINDS)
+    assert import_time.edges[a] == {b}
+
+    everything = load_import_graph(str(tmp_path), [], kinds={"module", "function", "type_checking"})
+    assert everything.edges[b] == {a}
+
+
+def test_build_import_graph_untagged_imports_are_module_level(tmp_path):
+    """未標記 kind 的 import 紀錄 (舊格式) 視為模組層級."""
+    (tmp_path / "a.py").write_text("import b\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("", encoding="utf-8")
+    graph = build_import_graph([{"file": str(tmp_path / "a.py"), "module": "b"}], [], str(tmp_path), [], kinds=IMPORT_TIME_KINDS)
+    assert graph.edges[str(tmp_path / "a.py")] == {str(tmp_path / "b.py")}
+
+
+def test_feedback_edges_weighted_and_minimal():
+    """回饋邊集優先移除權重小的邊, 且每條邊都必要; 移除後無循環."""
+    edges = {"a": {"b"}, "b": {"c"}, "c": {"a"}, "d": {"a"}}
+    weights = {("a", "b"): 5, ("b", "c"): 1, ("c", "a"): 3, ("d", "a"): 1}
+    assert feedback_edges(edges, lambda u, v: weights[u, v]) == [(["a", "b", "c"], [("b", "c")])]
+
+    # 兩個環共用 x -> y: 移除這一條即可
+    edges = {"x": {"y"}, "y": {"x", "z"}, "z": {"x"}}
+    ((members, removed),) = feedback_edges(edges)
+    assert sorted(members) == ["x", "y", "z"]
+    assert removed == [("x", "y")]
+
+
+def test_feedback_edges_large_component_acyclic():
+    """數千個檔案的 SCC: 移除回饋邊後圖無循環."""
+    n = 2000
+    edges = {f"m{i}": {f"m{(i + 1) % n}", f"m{(i * 7 + 3) % n}"} for i in range(n)}
+    removed = {edge for _, component_edges in feedback_edges(edges) for edge in component_edges}
+    remaining = {node: {t for t in targets if (node, t) not in removed} for node, targets in edges.items()}
+    assert all(len(component) == 1 for component in strongly_connected_components(remaining))
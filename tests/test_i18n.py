@@ -3,7 +3,7 @@
 import tempfile
 from pathlib import Path
 
-from pyci_check.i18n import _find_pyproject_toml, _normalize_locale, get_locale, t
+from pyci_check.i18n import Message, _find_pyproject_toml, _normalize_locale, get_locale, t
 
 
 class TestI18n:
@@ -143,3 +143,26 @@ language = "zh_CN"
                 # 恢復 cache
                 _find_pyproject_toml.cache_clear()
                 get_locale.cache_clear()
+
+    def test_message_renders_lazily(self, monkeypatch):
+        """測試 Message 在輸出時才依當前語言翻譯."""
+        import pyci_check.i18n as i18n_mod
+
+        msg = Message("imports.error.module_not_found", "foo")
+        monkeypatch.setattr(i18n_mod, "get_locale", lambda: "en")
+        english = str(msg)
+        monkeypatch.setattr(i18n_mod, "get_locale", lambda: "zh_TW")
+        chinese = f"{msg}"
+
+        assert "foo" in english
+        assert "foo" in chinese
+        assert english != chinese
+
+    def test_message_json_roundtrip(self):
+        """測試 Message 序列化: 不可 JSON 化的參數 (exception) 轉為字串, 渲染結果不變."""
+        msg = Message("syntax.error.file_error", OSError("disk gone"))
+        restored = Message.from_json(msg.to_json())
+
+        assert restored.to_json() == ["syntax.error.file_error", "disk gone"]
+        assert str(restored) == str(msg)
+        assert Message.from_json(["imports.error.import_timeout", 30]) == Message("imports.error.import_timeout", 30)
@@ -0,0 +1,148 @@
+"""測試 execute 模式的 import 耗時量測與排程."""
+
+import sys
+
+from pyci_check.i18n import Message
+from pyci_check.imports import (
+    IMPORT_PROFILE_MARKER,
+    ImportProfile,
+    _ImportTimingCache,
+    check_missing_modules,
+    parse_importtime_output,
+    profile_module_import,
+    summarize_import_profiles,
+)
+
+
+def test_parse_importtime_output_skips_startup_imports():
+    """Marker 之前的 startup import 不應計入."""
+    stderr = "\n".join(  # noqa: FLY002 - 逐行列出 importtime 輸出較易讀
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 | encodings",
+            IMPORT_PROFILE_MARKER,
+            "import time:       300 |        300 |   pkg.sub",
+            "import time:       200 |        500 | pkg",
+            "boom",
+        ]
+    )
+
+    entries = parse_importtime_output(stderr)
+
+    assert entries == [("pkg.sub", 300, 300, 1), ("pkg", 200, 500, 0)]
+
+
+def test_profile_module_import(tmp_path):
+    """真實量測: 本地模組 import 另一個本地模組."""
+    (tmp_path / "heavy_child.py").write_text("X = sum(range(1000))\n", encoding="utf-8")
+    (tmp_path / "heavy_parent.py").write_text("import heavy_child\n", encoding="utf-8")
+
+    module, error, profile = profile_module_import("heavy_parent", project_dir=str(tmp_path), timeout=10)
+
+    assert module == "heavy_parent"
+    assert error is None
+    assert profile is not None
+    names = [name for name, *_ in profile.imports]
+    assert "heavy_parent" in names
+    assert "heavy_child" in names
+    assert profile.total_us > 0
+
+
+def test_profile_module_import_failure(tmp_path):
+    """Import 失敗時只回錯誤, 不回 profile."""
+    (tmp_path / "broken_mod.py").write_text("raise RuntimeError('nope')\n", encoding="utf-8")
+
+    _module, error, profile = profile_module_import("broken_mod", project_dir=str(tmp_path), timeout=10)
+
+    assert error == "nope"
+    assert profile is None
+
+
+def test_check_missing_modules_profile_sink(tmp_path):
+    """執行模式提供 profile_sink 時收集每個成功模組的 profile."""
+    (tmp_path / "ok_mod.py").write_text("", encoding="utf-8")
+    imports = [
+        {"module": "ok_mod", "line": 1, "file": "a.py"},
+        {"module": "missing_mod_xyz", "line": 2, "file": "a.py"},
+    ]
+    profiles: dict[str, ImportProfile] = {}
+
+    missing = check_missing_modules(imports, project_dir=str(tmp_path), use_static=False, timeout=10, profile_sink=profiles)
+
+    assert "missing_mod_xyz" in missing
+    assert set(profiles) == {"ok_mod"}
+
+
+def test_summarize_import_profiles_budget():
+    """超過預算的模組列入 over_budget, transitive import 跨模組去重."""
+    profiles = {
+        "fast": ImportProfile("fast", total_us=1_000, peak_rss_kb=None, imports=[("shared", 800, 800, 1), ("fast", 200, 1000, 0)]),
+        "slow": ImportProfile("slow", total_us=90_000, peak_rss_kb=20_000, imports=[("shared", 900, 900, 1), ("slow", 89_100, 90_000, 0)]),
+    }
+
+    summary = summarize_import_profiles(profiles, budget_ms=50)
+
+    assert [p.module for p in summary["heaviest_modules"]] == ["slow", "fast"]
+    assert [p.module for p in summary["over_budget"]] == ["slow"]
+    slowest = dict(summary["slowest_imports"])
+    assert slowest["shared"] == 0.9
+
+
+def test_timing_cache_orders_longest_first(tmp_path):
+    """歷史耗時最久的模組先排程, 未量測的以中位數估計."""
+    cache = _ImportTimingCache(str(tmp_path))
+    cache.record("fast", 10)
+    cache.record("medium", 50, rss_kb=30_000)
+    cache.record("slow", 900, rss_kb=80_000)
+    cache.flush()
+
+    reloaded = _ImportTimingCache(str(tmp_path))
+
+    assert reloaded.order_longest_first(["fast", "unknown", "slow"]) == ["slow", "unknown", "fast"]
+    assert reloaded.peak_rss_kb() == 80_000
+
+
+def test_check_missing_modules_deadline_exceeded(tmp_path):
+    """整體時限用完後, 尚未開始的模組回報 deadline 錯誤而非被靜默略過."""
+    (tmp_path / "ok_mod.py").write_text("", encoding="utf-8")
+    imports = [{"module": "ok_mod", "line": 1, "file": "a.py"}]
+
+    missing = check_missing_modules(imports, project_dir=str(tmp_path), use_static=False, timeout=10, deadline=1e-9)
+
+    assert missing["ok_mod"][0]["error"] == Message("imports.error.deadline_exceeded", 1e-9)
+
+
+def test_execute_mode_orders_and_sizes_from_history(tmp_path, monkeypatch):
+    """預設執行模式也記錄耗時與 peak RSS: 下一輪最久的模組先跑, worker 數依歷史 peak RSS 計算."""
+    import pyci_check.imports as imports_module
+
+    (tmp_path / "slow_mod.py").write_text("import time\ntime.sleep(0.3)\n", encoding="utf-8")
+    (tmp_path / "fast_mod.py").write_text("", encoding="utf-8")
+
+    def imports():
+        return [{"module": m, "line": 1, "file": "a.py"} for m in ("fast_mod", "slow_mod")]
+
+    assert check_missing_modules(imports(), project_dir=str(tmp_path), use_static=False, timeout=10) == {}
+    peak_rss_kb = _ImportTimingCache(str(tmp_path)).peak_rss_kb()
+    if sys.platform != "win32":
+        assert peak_rss_kb is not None
+        assert peak_rss_kb > 0
+
+    sized: list[tuple[int, int | None]] = []
+    started: list[str] = []
+    real_import_module = imports_module._import_module
+
+    def fake_workers(task_count, per_worker_rss_kb=None):
+        sized.append((task_count, per_worker_rss_kb))
+        return 1
+
+    def spy_import_module(module, *args):
+        started.append(module)
+        return real_import_module(module, *args)
+
+    monkeypatch.setattr(imports_module, "calculate_execute_workers", fake_workers)
+    monkeypatch.setattr(imports_module, "_import_module", spy_import_module)
+    assert check_missing_modules(imports(), project_dir=str(tmp_path), use_static=False, timeout=10) == {}
+
+    assert sized == [(2, peak_rss_kb)]
+    assert started == ["slow_mod", "fast_mod"]
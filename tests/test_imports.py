@@ -1,5 +1,6 @@
 """測試 import 檢查功能."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -174,6 +175,32 @@ extend-exclude = ["*.egg-info"]
             assert config["exclude_dirs"] == []
             assert config["exclude_files"] == []
 
+    def test_get_target_version_config(self):
+        """target-version: [tool.pyci-check] (列表取最低) 優先, 否則沿用 [tool.ruff]."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pyproject_path = Path(tmpdir) / "pyproject.toml"
+            pyproject_path.write_text('[tool.ruff]\ntarget-version = "py312"\n', encoding="utf-8")
+            get_ruff_config_from_pyproject.cache_clear()
+            assert get_ruff_config_from_pyproject(tmpdir)["target_version"] == (3, 12)
+
+            pyproject_path.write_text(
+                '[tool.pyci-check]\ntarget-version = ["py313", "py310"]\n\n[tool.ruff]\ntarget-version = "py312"\n', encoding="utf-8"
+            )
+            get_ruff_config_from_pyproject.cache_clear()
+            assert get_ruff_config_from_pyproject(tmpdir)["target_version"] == (3, 10)
+
+    def test_pyc_prefix_relative_to_pyproject(self, monkeypatch):
+        """相對的 pyc-prefix 以 pyproject.toml 所在目錄為準, 與 cwd 無關."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "pyproject.toml").write_text('[tool.pyci-check]\npyc-prefix = "build/pyc"\n', encoding="utf-8")
+            (Path(tmpdir) / "sub").mkdir()
+            monkeypatch.chdir(Path(tmpdir) / "sub")
+            get_ruff_config_from_pyproject.cache_clear()
+
+            config = get_ruff_config_from_pyproject(str(Path(tmpdir) / "sub"))
+
+            assert config["pyc_prefix"] == os.path.join(os.path.abspath(tmpdir), "build/pyc")
+
     def test_get_pyci_check_exclude_config(self):
         """測試從 pyproject.toml 讀取 [tool.pyci-check] 的 exclude 和 extend-exclude."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -7,6 +7,7 @@ from pyci_check.imports import (
     extract_from_all_files,
     find_python_executable,
     get_venv_from_pyproject,
+    iter_missing_imports,
     process_single_file,
 )
 
@@ -228,3 +229,78 @@ language = "en"
         )
 
         assert len(imports) > 0
+
+    def test_iter_missing_imports_matches_batch(self, temp_dir):
+        """串流管線與 extract_from_all_files + check_missing_modules 結果一致 (單執行緒與多執行緒)."""
+        (temp_dir / "local_mod.py").write_text("", encoding="utf-8")
+        (temp_dir / "a.py").write_text("import os\nimport local_mod\nimport missing_one\nimport missing_two\n", encoding="utf-8")
+        (temp_dir / "b.py").write_text(
+            "import missing_one\ntry:\n    import missing_two\nexcept ImportError:\n    pass\ntry:\n    import only_optional\nexcept ImportError:\n    pass\n",
+            encoding="utf-8",
+        )
+
+        imports, _ = extract_from_all_files(str(temp_dir))
+        batch = check_missing_modules(imports, project_dir=str(temp_dir), src_dirs=["."], use_static=True)
+        expected = sorted((m, info["file"], info["line"]) for m, infos in batch.items() for info in infos)
+
+        for workers in (1, 4):
+            streamed = sorted(
+                (m, info["file"], info["line"])
+                for m, info in iter_missing_imports(str(temp_dir), src_dirs=["."], max_workers=workers, max_pending=2)
+            )
+            assert streamed == expected
+        assert {m for m, *_ in expected} == {"missing_one", "missing_two"}
+
+    def test_iter_missing_imports_caches_per_worker(self, temp_dir, monkeypatch):
+        """多執行緒時每個 worker 各自緩衝內容快取, 結束時全部寫入: 第二次執行不再解析任何檔案."""
+        import pyci_check.imports as imports_module
+
+        for i in range(16):
+            (temp_dir / f"m{i:02d}.py").write_text(f"import missing_{i}\n", encoding="utf-8")
+        first = sorted(m for m, _ in iter_missing_imports(str(temp_dir), max_workers=4))
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError("cached file parsed again")
+
+        monkeypatch.setattr(imports_module, "extract_imports_from_code", fail)
+        assert sorted(m for m, _ in iter_missing_imports(str(temp_dir), max_workers=4)) == first
+        assert len(first) == 16
+
+    def test_iter_missing_imports_empty_targets_walk_project(self, temp_dir):
+        """指定的檔案列表為空時與 extract_from_all_files 一致, 改為走訪整個專案."""
+        (temp_dir / "a.py").write_text("import missing_one\n", encoding="utf-8")
+
+        assert [m for m, _ in iter_missing_imports(str(temp_dir), target_files=[])] == ["missing_one"]
+        assert [m for m, _ in iter_missing_imports(str(temp_dir), target_files=iter(()))] == ["missing_one"]
+
+    def test_iter_missing_imports_skips_rewriting_cache_hits(self, temp_dir, monkeypatch):
+        """模組結果命中 find_spec 快取時不再寫回, 只有新探測的模組會寫入."""
+        import pyci_check.imports as imports_module
+
+        (temp_dir / "a.py").write_text("import os\nimport missing_one\n", encoding="utf-8")
+        assert [m for m, _ in iter_missing_imports(str(temp_dir))] == ["missing_one"]
+
+        written: list[str] = []
+        monkeypatch.setattr(imports_module._FindSpecCache, "set", lambda _self, module, _error: written.append(module))
+        assert [m for m, _ in iter_missing_imports(str(temp_dir))] == ["missing_one"]
+        assert written == []
+
+    def test_iter_missing_imports_is_lazy(self, temp_dir):
+        """呼叫端未取下一筆前, 不會讀完所有檔案 (backpressure)."""
+        for i in range(20):
+            (temp_dir / f"m{i:02d}.py").write_text(f"import missing_{i}\n", encoding="utf-8")
+        consumed: list[str] = []
+
+        def files():
+            for i in range(20):
+                path = str(temp_dir / f"m{i:02d}.py")
+                consumed.append(path)
+                yield path
+
+        stream = iter_missing_imports(str(temp_dir), target_files=files(), max_workers=1)
+        module, info = next(stream)
+        stream.close()
+
+        assert module == "missing_0"
+        assert info["error"]
+        assert len(consumed) == 1
@@ -0,0 +1,87 @@
+"""測試延遲 import 機會偵測."""
+
+import argparse
+
+from pyci_check.cli import check_lazy_imports
+from pyci_check.graph import load_import_graph
+from pyci_check.lazy_imports import find_deferrable_imports, find_lazy_import_candidates
+from pyci_check.weight import compute_import_weights
+
+
+def test_find_deferrable_imports_scopes(tmp_path):
+    """只有函數 body 內的使用可延後; decorator / 預設值 / class body / annotation 為 import 時使用."""
+    source = tmp_path / "mod.py"
+    source.write_text(
+        "import json\n"
+        "import csv\n"
+        "import functools\n"
+        "import decimal\n"
+        "import typing\n"
+        "from collections import OrderedDict, deque\n"
+        "import exported\n"
+        "__all__ = ['exported']\n"
+        "\n"
+        "@functools.cache\n"
+        "def f(x=decimal.Decimal(0)) -> typing.Any:\n"
+        "    return json.dumps(x), deque()\n"
+        "\n"
+        "class C:\n"
+        "    fmt = csv.excel\n"
+        "    def g(self, a: OrderedDict):\n"
+        "        return lambda: exported\n",
+        encoding="utf-8",
+    )
+    candidates = find_deferrable_imports(str(source))
+    assert [(c.line, c.names, c.functions) for c in candidates] == [
+        (1, ["json"], ["f"]),
+        (6, ["deque"], ["f"]),
+    ]
+    assert candidates[1].statement == "from collections import OrderedDict, deque"
+
+
+def test_find_deferrable_imports_postponed_annotations(tmp_path):
+    """延後求值: from __future__ import annotations 時 annotation 不求值; __init__.py 不列入."""
+    source = tmp_path / "mod.py"
+    source.write_text(
+        "from __future__ import annotations\nimport decimal\n\ndef f(x: decimal.Decimal) -> None:\n    return decimal.Decimal(x)\n",
+        encoding="utf-8",
+    )
+    assert [c.names for c in find_deferrable_imports(str(source))] == [["decimal"]]
+
+    init = tmp_path / "__init__.py"
+    init.write_text("import json\n\ndef f():\n    return json\n", encoding="utf-8")
+    assert find_deferrable_imports(str(init)) == []
+
+
+def test_find_lazy_import_candidates_ranked(tmp_path):
+    """本地模組以遞移閉包原始碼大小估計成本, 由大到小排序並套用門檻; 測試檔不列入."""
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "heavy.py").write_text("import pkg.base\n" + "X = 1\n" * 2000, encoding="utf-8")
+    (pkg / "base.py").write_text("Y = 1\n" * 500, encoding="utf-8")
+    (pkg / "light.py").write_text("Z = 1\n", encoding="utf-8")
+    (pkg / "cli.py").write_text(
+        "import pkg.heavy\nimport pkg.light\n\ndef main():\n    return pkg.heavy.X, pkg.light.Z\n",
+        encoding="utf-8",
+    )
+    (pkg / "test_cli.py").write_text("import pkg.heavy\n\ndef test_x():\n    assert pkg.heavy\n", encoding="utf-8")
+    graph = load_import_graph(str(tmp_path), [])
+    weights = compute_import_weights(graph, {})
+
+    candidates = find_lazy_import_candidates(graph, weights, ())
+    assert [c.statement for c in candidates] == ["import pkg.heavy", "import pkg.light"]
+    heavy_bytes = sum((pkg / name).stat().st_size for name in ("heavy.py", "base.py", "__init__.py"))
+    assert candidates[0].estimated_bytes == heavy_bytes
+
+    assert [c.statement for c in find_lazy_import_candidates(graph, weights, (), min_bytes=1024)] == ["import pkg.heavy"]
+
+
+def test_cli_lazy_imports_warning_only(tmp_path, capsys, monkeypatch):
+    """測試 lazy-imports 子命令: 有候選時僅警告, 回傳 0."""
+    (tmp_path / "mod.py").write_text("import json\n\ndef f():\n    return json.dumps(1)\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    assert check_lazy_imports(argparse.Namespace(quiet=True, min_size=0)) == 0
+    out = capsys.readouterr().out
+    assert "mod.py:1 -> import json" in out
@@ -3,8 +3,9 @@
 import argparse
 from pathlib import Path
 
+from pyci_check import signature
 from pyci_check.cli import check_signature
-from pyci_check.signature import _get_module_name
+from pyci_check.signature import _get_module_name, check_signatures
 
 
 def test_get_module_name():
@@ -97,3 +98,184 @@ src = ["src"]
     assert "Unexpected keyword arguments: d" in stdout  # strict_func unexpected d
     assert "Too many positional arguments" in stdout  # strict_func too many pos
     assert "Missing required positional arguments" in stdout  # Mailer missing host
+
+
+def test_parallel_signature_check_matches_serial(tmp_path: Path, monkeypatch):
+    """大型專案的區塊並行路徑 (thread / subinterpreter) 與單執行緒結果一致."""
+    (tmp_path / "lib.py").write_text("def strict(a, b, *, c):\n    pass\n", encoding="utf-8")
+    files = [str(tmp_path / "lib.py")]
+    for i in range(12):
+        caller = tmp_path / f"caller_{i}.py"
+        caller.write_text(f"from lib import strict\nstrict(1, c={i})\nstrict(1, 2, c=3)\n", encoding="utf-8")
+        files.append(str(caller))
+
+    serial = check_signatures(files, str(tmp_path), [])
+    monkeypatch.setattr(signature, "should_use_thread_pool", lambda *_args, **_kwargs: True)
+    parallel = check_signatures(files, str(tmp_path), [])
+
+    assert len(serial) == 12
+    assert sorted((e["file"], e["line"]) for e in parallel) == sorted((e["file"], e["line"]) for e in serial)
+
+
+def test_method_calls_via_class_hierarchy(tmp_path: Path):
+    """方法呼叫: self / cls 接收者、建構子賦值的區域變數, 經 MRO 找到繼承的方法與建構子."""
+    (tmp_path / "base.py").write_text(
+        "class Base:\n"
+        "    def __init__(self, name):\n        pass\n"
+        "    def run(self, a, *, flag):\n        pass\n"
+        "    @staticmethod\n    def util(a, b):\n        pass\n"
+        "    @classmethod\n    def build(cls, a):\n        return cls(a)\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "app.py").write_text(
+        "from base import Base\n\n"
+        "class Child(Base):\n"
+        "    def go(self):\n"
+        "        self.run(1, flag=True)\n"  # ok
+        "        self.run(1)\n"  # 6: missing flag
+        "        self.util(1, 2)\n"  # ok: staticmethod 不扣 self
+        "        Base.util(1)\n"  # 8: missing b
+        "        Base.run(self, 1, flag=1)\n"  # ok: 經類別存取的一般方法不檢查
+        "\n"
+        "    @classmethod\n"
+        "    def make(cls):\n"
+        "        return cls()\n"  # 13: 繼承的 __init__ 缺 name
+        "\n"
+        "def main():\n"
+        "    c = Child('x')\n"
+        "    c.run(1, 2, flag=3)\n"  # 17: too many positional
+        "    c.build(1)\n"  # ok
+        "    maybe = Child('y')\n"
+        "    maybe = object()\n"
+        "    maybe.run()\n",  # ok: 綁定不一致, 不推論
+        encoding="utf-8",
+    )
+    files = [str(tmp_path / "base.py"), str(tmp_path / "app.py")]
+    errors = check_signatures(files, str(tmp_path), [])
+    assert sorted((e["line"], e["func"]) for e in errors) == [
+        (6, "base.Base.run"),
+        (8, "base.Base.util"),
+        (13, "base.Base"),
+        (17, "base.Base.run"),
+    ]
+
+
+def test_external_bases_and_overrides_not_guessed(tmp_path: Path):
+    """MRO 上專案外的基底之後的方法與建構子視為未知; 子類別的覆寫 (含 property) 遮蔽基底."""
+    (tmp_path / "mod.py").write_text(
+        "from enum import Enum\n\n"
+        "class Color(Enum):\n    RED = 1\n\n"
+        "class Local:\n    def size(self, a):\n        pass\n\n"
+        "class Mixed(dict, Local):\n    pass\n\n"
+        "class Over(Local):\n    @property\n    def size(self):\n        return 1\n\n"
+        "def main():\n"
+        "    Color(1)\n"
+        "    Mixed(a=1).size()\n"
+        "    m = Mixed()\n    m.size()\n"
+        "    o = Over()\n    o.size()\n"
+        "    p = Local()\n    p.size()\n",
+        encoding="utf-8",
+    )
+    errors = check_signatures([str(tmp_path / "mod.py")], str(tmp_path), [])
+    assert [(e["line"], e["func"]) for e in errors] == [(26, "mod.Local.size")]
+
+
+def test_relative_imports_and_reexport_chains(tmp_path: Path):
+    """相對 import 依所在模組換算; 經 __init__ 重新匯出 (含 star import 與多層) 的名稱追到定義處."""
+    pkg = tmp_path / "src" / "pkg"
+    (pkg / "sub").mkdir(parents=True)
+    (pkg / "sub" / "core.py").write_text("def helper(a, b):\n    pass\n\nclass Base:\n    def run(self, x):\n        pass\n", encoding="utf-8")
+    (pkg / "sub" / "__init__.py").write_text("from .core import *\n", encoding="utf-8")
+    (pkg / "__init__.py").write_text("from .sub import helper, Base as PublicBase\n", encoding="utf-8")
+    (pkg / "sub" / "user.py").write_text(
+        "from .core import helper\nfrom .. import PublicBase\nfrom ... import too_far\n\n"
+        "class Impl(PublicBase):\n    def go(self):\n        self.run()\n\n"
+        "helper(1)\ntoo_far(1)\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "src" / "app.py").write_text("import pkg\nfrom pkg import helper\n\nhelper(1, 2, 3)\npkg.helper()\n", encoding="utf-8")
+
+    files = [str(p) for p in sorted((tmp_path / "src").rglob("*.py"))]
+    errors = check_signatures(files, str(tmp_path), ["src"])
+    assert sorted((Path(e["file"]).name, e["line"], e["func"]) for e in errors) == [
+        ("app.py", 4, "pkg.sub.core.helper"),
+        ("app.py", 5, "pkg.sub.core.helper"),
+        ("user.py", 7, "pkg.sub.core.Base.run"),
+        ("user.py", 9, "pkg.sub.core.helper"),
+    ]
+
+
+def test_dataclass_decorator_forms(tmp_path: Path):
+    """@dataclasses.dataclass(...) 與 @dataclass 相同: 產生建構子, cls(...) 依 field 檢查; 繼承的 field 不猜."""
+    (tmp_path / "mod.py").write_text(
+        "import dataclasses\n\n"
+        "@dataclasses.dataclass(frozen=True)\n"
+        "class Matcher:\n"
+        "    names: set\n\n"
+        "    @classmethod\n"
+        "    def build(cls, item):\n"
+        "        return cls(item)\n\n"
+        "@dataclasses.dataclass\n"
+        "class Extended(Matcher):\n"
+        "    extra: int = 0\n\n"
+        "Matcher({'a'}, 1)\n"
+        "Extended({'a'}, 1)\n",
+        encoding="utf-8",
+    )
+    errors = check_signatures([str(tmp_path / "mod.py")], str(tmp_path), [])
+    assert [(e["line"], e["func"]) for e in errors] == [(15, "mod.Matcher")]
+
+
+def test_reexported_decorated_definitions_skipped(tmp_path: Path):
+    """重新匯出追到被 decorator 取代的定義 (例如 @replaced_by_pep8(...)) 時不檢查; 直接定義處的呼叫照舊."""
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "core.py").write_text(
+        "def replaced_by_pep8(name):\n    return lambda fn: fn\n\n"
+        '@replaced_by_pep8("legacy_name")\ndef legacyName(): ...\n\n'
+        "class Parser:\n    @staticmethod\n    def parse(text):\n        pass\n",
+        encoding="utf-8",
+    )
+    (pkg / "__init__.py").write_text("from .core import *\n", encoding="utf-8")
+    (tmp_path / "app.py").write_text("import pkg\n\npkg.legacyName(1, 2)\npkg.Parser.parse()\n", encoding="utf-8")
+
+    files = [str(p) for p in sorted(tmp_path.rglob("*.py"))]
+    errors = check_signatures(files, str(tmp_path), [])
+    assert [(e["line"], e["func"]) for e in errors] == [(4, "pkg.core.Parser.parse")]
+
+
+def test_local_bindings_shadow_module_definitions(tmp_path: Path):
+    """參數 / 區域變數與模組層級函數同名時, 呼叫的是區域值, 不以模組層級簽章檢查."""
+    (tmp_path / "mod.py").write_text(
+        "def helper(a):\n    pass\n\n"
+        "def path_factory():\n    pass\n\n"
+        "def use(helper):\n    return helper(1, 2, 3)\n\n"
+        "def fixture_user(path_factory):\n    return path_factory.mktemp('x', 1), path_factory('a')\n\n"
+        "def rebound():\n    helper = print\n    helper(1, 2, 3)\n\n"
+        "lam = lambda helper: helper(1, 2)\n"
+        "helper(1, 2)\n",
+        encoding="utf-8",
+    )
+    errors = check_signatures([str(tmp_path / "mod.py")], str(tmp_path), [])
+    assert [(e["line"], e["func"]) for e in errors] == [(18, "mod.helper")]
+
+
+def test_decorated_definitions_skipped_for_direct_calls(tmp_path: Path):
+    """被 decorator 取代的函數: 直接 import、模組屬性與同模組呼叫都不以原始簽章檢查."""
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "utils.py").write_text(
+        "def deco(fn):\n    def w(*args):\n        return fn()\n    return w\n\n"
+        "@deco\ndef wrapped():\n    pass\n\n"
+        "def plain():\n    pass\n\n"
+        "wrapped(1)\n",
+        encoding="utf-8",
+    )
+    (pkg / "app.py").write_text(
+        "from . import utils\nfrom .utils import plain, wrapped\n\nwrapped(1, 2)\nutils.wrapped(1, 2)\nplain(1)\n",
+        encoding="utf-8",
+    )
+    files = [str(p) for p in sorted(pkg.glob("*.py"))]
+    errors = check_signatures(files, str(tmp_path), [])
+    assert [(Path(e["file"]).name, e["line"], e["func"]) for e in errors] == [("app.py", 6, "pkg.utils.plain")]
@@ -104,7 +104,7 @@ def test_check_missing_modules_static_cache_reuses_results(tmp_path: Path) -> No
         ]
 
     first = check_missing_modules(make_imports(), project_dir=str(tmp_path), use_static=True)
-    cache_file = tmp_path / ".pyci-check-cache" / "find_spec.json"
+    cache_file = tmp_path / ".pyci-check-cache" / "cache.sqlite3"
     second = check_missing_modules(make_imports(), project_dir=str(tmp_path), use_static=True)
 
     assert cache_file.exists()
@@ -342,5 +342,73 @@ def test_execute_mode_isolates_each_import_from_sys_modules_pollution(tmp_path:
     assert "missing_dep_xyz" in missing
 
 
+def test_static_probe_scans_each_directory_once(tmp_path: Path, monkeypatch) -> None:
+    """目錄列表快取: 多個 missing dotted module 共用同一批 scandir 結果."""
+    from pyci_check import imports as imports_mod
+
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "pkg" / "sub" / "leaf.py").write_text("", encoding="utf-8")
+
+    scanned: list[str] = []
+    real_scandir = imports_mod.os.scandir
+
+    def counting_scandir(path):
+        scanned.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(imports_mod.os, "scandir", counting_scandir)
+    imports_mod._DIR_LISTINGS.clear()
+
+    roots = [str(tmp_path)]
+    assert imports_mod._probe_module_roots("pkg.sub.leaf", roots)
+    assert not imports_mod._probe_module_roots("pkg.sub.missing", roots)
+    assert not imports_mod._probe_module_roots("pkg.sub.other.deep", roots)
+    # 大小寫敏感, 與 import system 一致
+    assert not imports_mod._probe_module_roots("pkg.sub.LEAF", roots)
+
+    assert sorted(scanned) == sorted({str(tmp_path), str(tmp_path / "pkg"), str(tmp_path / "pkg" / "sub")})
+
+
+def test_prefix_trie_merges_namespace_roots(tmp_path: Path) -> None:
+    """Namespace package 分散在多個 root: trie 合併同一 prefix 的目錄, 中間段是檔案時不可往下."""
+    from pyci_check import imports as imports_mod
+
+    root_a = tmp_path / "a"
+    root_b = tmp_path / "b"
+    (root_a / "ns" / "left").mkdir(parents=True)
+    (root_a / "ns" / "left" / "mod.py").write_text("", encoding="utf-8")
+    (root_b / "ns").mkdir(parents=True)
+    (root_b / "ns" / "right.py").write_text("", encoding="utf-8")
+    imports_mod._DIR_LISTINGS.clear()
+
+    trie = imports_mod._ModulePrefixTrie([str(root_a), str(root_b)])
+
+    assert trie.contains("ns")
+    assert trie.contains("ns.left.mod")
+    assert trie.contains("ns.right")
+    assert not trie.contains("ns.right.deeper")
+    assert not trie.contains("ns.missing")
+    assert not trie.contains("other")
+
+
+def test_find_spec_cache_is_language_independent(tmp_path: Path) -> None:
+    """find_spec cache 只存翻譯鍵與參數, 不存翻譯後字串."""
+    import json
+    import sqlite3
+
+    from pyci_check.i18n import Message
+
+    imports = [{"module": "missing_lang_xyz", "line": 1, "statement": "import missing_lang_xyz", "file": "f.py", "optional": False}]
+    first = check_missing_modules(imports, project_dir=str(tmp_path), use_static=True)
+
+    with sqlite3.connect(tmp_path / ".pyci-check-cache" / "cache.sqlite3") as conn:
+        (stored,) = conn.execute("SELECT value FROM entries WHERE namespace LIKE 'find_spec@%' AND key = 'missing_lang_xyz'").fetchone()
+    assert json.loads(stored) == ["imports.error.module_not_found", "missing_lang_xyz"]
+
+    second = check_missing_modules(imports, project_dir=str(tmp_path), use_static=True)
+    assert second["missing_lang_xyz"][0]["error"] == Message("imports.error.module_not_found", "missing_lang_xyz")
+    assert first == second
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,8 +1,16 @@
 """語法檢查進階測試."""
 
+import importlib.util
+import os
+import py_compile
+import subprocess
+import sys
 from pathlib import Path
 
-from pyci_check.syntax import check_file_syntax, check_files_parallel, find_python_files
+import pytest
+
+from pyci_check import syntax
+from pyci_check.syntax import check_file_syntax, check_files_parallel, compile_file, find_python_files, pyc_path_for
 
 
 class TestSyntaxAdvanced:
@@ -224,3 +232,112 @@ def http_error(status):
         # 根據 Python 版本決定結果
 
         assert is_valid is True
+
+    def test_compile_mode_catches_compile_time_errors(self, temp_dir):
+        """ast.parse 放行但編譯期才報的錯誤, 只有編譯模式抓得到."""
+        test_file = temp_dir / "bad.py"
+        test_file.write_text("x = 1\nreturn x\n", encoding="utf-8")
+
+        assert check_file_syntax(str(test_file)) == (True, "")
+        is_valid, error = compile_file(str(test_file), pyc_prefix=str(temp_dir / "pyc"))
+
+        assert is_valid is False
+        assert "'return' outside function" in error
+        assert not (temp_dir / "pyc").exists()
+
+    def test_compile_mode_writes_importlib_compatible_pyc(self, temp_dir):
+        """寫出的 pyc 路徑與內容與 importlib / py_compile 相同."""
+        test_file = temp_dir / "good.py"
+        test_file.write_text("def f():\n    return 1\n", encoding="utf-8")
+        prefix = temp_dir / "pyc"
+
+        for invalidation, mode in (
+            ("timestamp", py_compile.PycInvalidationMode.TIMESTAMP),
+            ("checked-hash", py_compile.PycInvalidationMode.CHECKED_HASH),
+        ):
+            pyc_path = pyc_path_for(str(test_file), str(prefix))
+            Path(pyc_path).unlink(missing_ok=True)
+            assert compile_file(str(test_file), pyc_prefix=str(prefix), invalidation=invalidation) == (True, "")
+
+            expected = temp_dir / f"expected-{invalidation}.pyc"
+            py_compile.compile(str(test_file), cfile=str(expected), invalidation_mode=mode, doraise=True)
+            assert Path(pyc_path).read_bytes() == expected.read_bytes()
+
+        assert pyc_path_for(str(test_file)) == importlib.util.cache_from_source(str(test_file))
+
+    def test_pyc_path_includes_optimization_tag(self, temp_dir):
+        """-O / -OO 下的 pyc 檔名帶 .opt-N, 與 importlib 及 compile 的最佳化等級一致."""
+        test_file = temp_dir / "opt.py"
+        test_file.write_text("assert False\n", encoding="utf-8")
+        script = (
+            "import importlib.util, sys\n"
+            "from pyci_check.syntax import compile_file, pyc_path_for\n"
+            "path = sys.argv[1]\n"
+            "print(compile_file(path) == (True, ''), pyc_path_for(path) == importlib.util.cache_from_source(path))\n"
+        )
+        env = {
+            **os.environ,
+            "PYTHONDONTWRITEBYTECODE": "1",
+            "PYTHONPATH": os.pathsep.join([str(Path(syntax.__file__).parents[1]), str(temp_dir)]),
+        }
+        result = subprocess.run(
+            [sys.executable, "-O", "-c", script, str(test_file)], capture_output=True, text=True, check=False, env=env, cwd=temp_dir
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ["True", "True"]
+        assert [p.name for p in (temp_dir / "__pycache__").iterdir()] == [f"opt.{sys.implementation.cache_tag}.opt-1.pyc"]
+
+    def test_compile_mode_skips_up_to_date_pyc(self, temp_dir, monkeypatch):
+        """原始碼未變 (pyc header 相符) 時不重新編譯 (預熱快取)."""
+        test_file = temp_dir / "warm.py"
+        test_file.write_text("VALUE = 1\n", encoding="utf-8")
+        assert compile_file(str(test_file)) == (True, "")
+
+        def fail_write(*_args):
+            raise AssertionError("should not rewrite an up-to-date pyc")
+
+        monkeypatch.setattr(syntax, "_write_atomic", fail_write)
+        success, error_count, _errors = check_files_parallel([str(test_file)], compile_mode=True)
+
+        assert (success, error_count) == (1, 0)
+
+    def test_target_version_rejects_newer_syntax(self, temp_dir):
+        """目標版本較舊時, 新版本才有的語法視為錯誤; 編譯模式也一樣."""
+        test_file = temp_dir / "match_310.py"
+        test_file.write_text("match 1:\n    case 1:\n        pass\n", encoding="utf-8")
+
+        assert check_file_syntax(str(test_file)) == (True, "")
+        is_valid, error = check_file_syntax(str(test_file), target_version=(3, 9))
+        assert is_valid is False
+        assert "3.10" in error
+
+        is_valid, _error = compile_file(str(test_file), pyc_prefix=str(temp_dir / "pyc"), target_version=(3, 9))
+        assert is_valid is False
+        assert compile_file(str(test_file), pyc_prefix=str(temp_dir / "pyc"), target_version=(3, 10)) == (True, "")
+        # pyc 已是最新也仍需依目標版本重新檢查
+        is_valid, _error = compile_file(str(test_file), pyc_prefix=str(temp_dir / "pyc"), target_version=(3, 9))
+        assert is_valid is False
+
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="PEP 701 f-string 只在 3.12+ 的 parser 上能解析")
+    def test_target_version_rejects_pep701_fstrings(self, temp_dir):
+        """3.12+ 的 parser 指定 feature_version 仍接受 PEP 701 f-string; 目標低於 3.12 時另外偵測."""
+        test_file = temp_dir / "fstring_312.py"
+        test_file.write_text('x = 1\nname = f"{f"{x}"}"\n', encoding="utf-8")
+
+        assert check_file_syntax(str(test_file), target_version=(3, 12)) == (True, "")
+        is_valid, error = check_file_syntax(str(test_file), target_version=(3, 10))
+        assert is_valid is False
+        assert "3.12" in error
+        assert "fstring_312.py, line 2" in error
+        is_valid, _error = compile_file(str(test_file), pyc_prefix=str(temp_dir / "pyc"), target_version=(3, 11))
+        assert is_valid is False
+
+    def test_find_pep701_fstring(self):
+        """重用外層引號、替換欄位內的反斜線與註解為 3.12 語法; 不同引號的巢狀 f-string 自 3.6 即合法."""
+        assert syntax.find_pep701_fstring("x = f\"{f'{1}'}\"\n") is None
+        assert syntax.find_pep701_fstring('x = f"""{"a"}"""\n') is None
+        assert syntax.find_pep701_fstring('x = f"a\\n{b}"\n') is None
+        if sys.version_info >= (3, 12):
+            assert syntax.find_pep701_fstring('x = f"{d["k"]}"\n')[:2] == (1, 9)
+            assert syntax.find_pep701_fstring("x = f\"{'\\n'.join(a)}\"\n") is not None
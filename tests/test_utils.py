@@ -1,5 +1,6 @@
 """測試工具函數."""
 
+import functools
 import os
 
 import pytest
@@ -169,3 +170,105 @@ class TestUtils:
         assert len(imports) == 200
         assert {info["module"] for info in imports} == {"sys"}
         assert relative_imports == []
+
+
+def test_calculate_execute_workers_memory_bound(monkeypatch):
+    """歷史 peak RSS 很大時, 並行數由可用記憶體決定."""
+    monkeypatch.setattr(utils, "_usable_cpu_count", lambda: 24)
+    monkeypatch.setattr(utils, "_available_memory_kb", lambda: 4_000_000)
+
+    # 75% * 4GB / 1GB = 3
+    assert utils.calculate_execute_workers(100, per_worker_rss_kb=1_000_000) == 3
+    # 未量測過 RSS: 只看 CPU, 不再固定上限 32
+    assert utils.calculate_execute_workers(100) == 48
+    assert utils.calculate_execute_workers(2) == 2
+
+
+def test_chunk_evenly_preserves_order():
+    """區塊大小相差不超過 1, 串接後與原序列相同."""
+    items = list(range(10))
+
+    chunks = utils.chunk_evenly(items, 4)
+
+    assert [len(c) for c in chunks] == [3, 3, 2, 2]
+    assert [x for c in chunks for x in c] == items
+    assert utils.chunk_evenly([1, 2], 8) == [[1], [2]]
+    assert utils.chunk_evenly([], 4) == []
+
+
+def test_map_chunks_merges_in_order():
+    """並行處理的區塊結果依原順序回傳."""
+    results = utils.map_chunks(lambda chunk: [x * 2 for x in chunk], list(range(100)), max_workers=4)
+
+    assert [x for chunk in results for x in chunk] == [x * 2 for x in range(100)]
+
+
+def test_compute_once_caches_until_cleared():
+    """無鎖記憶化: 只計算一次, cache_clear 後重新計算."""
+    calls: list[int] = []
+
+    @utils.compute_once
+    def value():
+        calls.append(1)
+        return len(calls)
+
+    assert value() == 1
+    assert value() == 1
+    value.cache_clear()
+    assert value() == 2
+
+
+def test_parallel_backend_env_override(monkeypatch):
+    """PYCI_CHECK_BACKEND=thread 強制 thread; 要求 interpreter 但不支援時退回 thread."""
+    monkeypatch.setenv(utils.PARALLEL_BACKEND_ENV, "thread")
+    utils.parallel_backend.cache_clear()
+    assert utils.parallel_backend() == "thread"
+
+    monkeypatch.setenv(utils.PARALLEL_BACKEND_ENV, "interpreter")
+    monkeypatch.setattr(utils, "_interpreter_pool_class", lambda: None)
+    utils.parallel_backend.cache_clear()
+    assert utils.parallel_backend() == "thread"
+    utils.parallel_backend.cache_clear()
+
+
+def test_map_chunks_falls_back_for_unpicklable_func(monkeypatch):
+    """Subinterpreter 後端無法傳遞 lambda 時, 改用 thread 而非失敗."""
+    monkeypatch.setattr(utils, "parallel_backend", lambda: "interpreter")
+    monkeypatch.setattr(utils, "_interpreter_pool_class", lambda: pytest.fail("should not use interpreter pool"))
+
+    results = utils.map_chunks(lambda chunk: sum(x for x in chunk), list(range(10)), max_workers=2)
+
+    assert sum(results) == 45
+
+
+class _Unpicklable:
+    def __reduce__(self):
+        raise AssertionError("partial arguments should not be pickled when probing")
+
+
+def test_is_shareable_probes_partial_function_only():
+    """Partial 只探測底層函式, 不為了探測序列化綁定的參數; 底層是 lambda 時仍不可傳遞."""
+    assert utils._is_shareable(functools.partial(utils.chunk_evenly, chunk_count=_Unpicklable()))
+    assert not utils._is_shareable(functools.partial(lambda chunk, n: chunk * n, n=1))
+
+
+def test_map_chunks_uses_interpreter_pool_for_partial():
+    """模組層級函式的 partial 走 subinterpreter 後端 (需要 Python 3.14+ 且 pyci_check 可在 subinterpreter 載入)."""
+    utils.parallel_backend.cache_clear()
+    if utils.parallel_backend() != "interpreter":
+        pytest.skip("subinterpreter backend unavailable")
+    pool_cls = utils._interpreter_pool_class()
+    created: list[int] = []
+
+    class RecordingPool(pool_cls):
+        def __init__(self, *args, **kwargs):
+            created.append(1)
+            super().__init__(*args, **kwargs)
+
+    func = functools.partial(utils.chunk_evenly, chunk_count=1)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(utils, "_interpreter_pool_class", lambda: RecordingPool)
+        results = utils.map_chunks(func, list(range(20)), max_workers=2)
+
+    assert [x for chunk in results for part in chunk for x in part] == list(range(20))
+    assert created == [1]
@@ -0,0 +1,60 @@
+"""測試靜態 import 成本估算."""
+
+import argparse
+
+from pyci_check.cli import check_weight
+from pyci_check.graph import load_import_graph
+from pyci_check.weight import compute_import_weights, load_weight_budget
+
+
+def _write_project(tmp_path, tool_config: str = ""):
+    """pkg.cli -> pkg.core -> (requests, yaml, json); pkg.light 只 import os."""
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "core.py").write_text("import json\nimport requests\nimport yaml\n\nX = 1\n", encoding="utf-8")
+    (pkg / "cli.py").write_text("from pkg import core\nimport pkg.core\n\ndef main():\n    pass\n", encoding="utf-8")
+    (pkg / "light.py").write_text("import os\n", encoding="utf-8")
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\n\n[project.scripts]\ndemo = "pkg.cli:main"\n' + tool_config,
+        encoding="utf-8",
+    )
+
+
+def test_compute_import_weights(tmp_path):
+    """遞移閉包內的本地模組數、第三方套件 (stdlib 排除) 與原始碼大小."""
+    _write_project(tmp_path)
+    graph = load_import_graph(str(tmp_path), [])
+    weights = {w.module: w for w in compute_import_weights(graph, {"yaml": ["pyyaml"]}).values()}
+
+    cli = weights["pkg.cli"]
+    assert cli.modules == 3  # pkg.cli, pkg.core, pkg (__init__)
+    assert cli.third_party == ["pyyaml", "requests"]
+    files = ("cli.py", "core.py", "__init__.py")
+    assert cli.source_bytes == sum((tmp_path / "pkg" / name).stat().st_size for name in files)
+
+    assert weights["pkg.light"].modules == 1
+    assert weights["pkg.light"].third_party == []
+
+
+def test_load_weight_budget_defaults_to_project_scripts(tmp_path):
+    """未設定 entry-points 時取 [project.scripts] 的模組."""
+    _write_project(tmp_path, '\n[tool.pyci-check.import-weight]\nmax-packages = 1\nmax-bytes = "1KB"\n')
+    budget = load_weight_budget(str(tmp_path))
+    assert budget.entry_points == ["pkg.cli"]
+    assert budget.max_packages == 1
+    assert budget.max_bytes == 1024
+    assert budget.max_modules is None
+
+
+def test_cli_weight_over_budget(tmp_path, capsys, monkeypatch):
+    """測試 weight 指令: 入口模組超過預算時回傳 1."""
+    _write_project(tmp_path, "\n[tool.pyci-check.import-weight]\nmax-packages = 1\n")
+    monkeypatch.chdir(tmp_path)
+
+    assert check_weight(argparse.Namespace(top=0)) == 1
+    out = capsys.readouterr().out
+    assert "pkg.cli" in out
+    assert "max-packages" in out
+
+    assert check_weight(argparse.Namespace(top=0, entry=["pkg.light"])) == 0